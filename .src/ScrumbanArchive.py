@@ -0,0 +1,231 @@
+"""
+File: ScrumbanArchive.py
+
+Description: This module is responsible for the archive of old completed tasks
+             of the Virtual Scrumban System.
+
+             It completes several tasks:
+
+             1. Moves completed tasks into one compressed partition per month
+                of their completion date
+             2. Lists the months that have been archived
+             3. Streams the archived tasks one partition at a time, so reading
+                the archive only ever holds one of its lines in memory
+
+Dependencies: gzip, os
+
+Date Created: 10/17/2026
+"""
+
+# used to compress the partitions
+import gzip
+# used to find the partitions and flush them to disk
+from os import fsync, listdir, makedirs, path
+# used to name the partition of a completion date
+from datetime import date
+
+from ScrumbanMember import parse_date
+from ScrumbanSchema import format_header, is_header
+
+# where the partitions are kept, next to the completed tasks file
+archive_directory: str = "completed_archive"
+
+# the end of the name of every partition, after its YYYY-MM month
+partition_suffix: str = ".csv.gz"
+
+
+class CompletedArchive():
+    """
+    Completed tasks that are too old to be loaded at boot, kept in gzip
+    compressed partitions named by the month they were completed in.
+
+    The completed tasks file is the hot partition, it holds the recent tasks
+    and is the only one loaded. Each archive run appends a new gzip member to
+    the partitions it adds to, so a partition is never rewritten.
+
+    Used By:
+        ScrumbanHistory.py
+        VSS.py
+
+    Members:
+        Member Name:        : Type          : Default Val          -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.directory      : str           : archive_directory    -> the directory holding the partitions
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _partition_path(self, month: str)                           |   -> str
+                                                                                    |
+        Usage:          instance._partition_path("2026-10")                         |
+                                                                                    |
+        Description:    Return the path of the partition of a month                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_month(task: list[str])                                  |   -> str or None
+                                                                                    |
+        Usage:          CompletedArchive.get_month(task)                            |
+                                                                                    |
+        Description:    Static method that returns the YYYY-MM a task was completed |
+                        in, None if its completion date isn't a real day            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    add(self, tasks: iterable[list[str]])                       |   -> int
+                                                                                    |
+        Usage:          instance.add(old_tasks)                                     |
+                                                                                    |
+        Description:    Append tasks to the partitions of their months              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_months(self)                                            |   -> list[str]
+                                                                                    |
+        Usage:          instance.get_months()                                       |
+                                                                                    |
+        Description:    Return the archived months, oldest first                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    iter_tasks(self, first: str, last: str)                     |   -> iterator of list[str]
+                                                                                    |
+        Usage:          instance.iter_tasks("2026-01", "2026-06")                   |
+                                                                                    |
+        Description:    Stream the tasks of the months from first to last           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, directory: str = archive_directory):
+        # where the partitions live
+        self.directory = directory
+
+    def _partition_path(self, month: str) -> str:
+        """
+        Parameter:
+            month:      a month as YYYY-MM
+
+        Called By:      add(), iter_tasks() - ScrumbanArchive.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         str
+
+        Description:    return the path of the partition of month
+        """
+        return path.join(self.directory, month + partition_suffix)
+
+    @staticmethod
+    def get_month(task: list):
+        """
+        Parameter:
+            task:       the fields of a completed task
+
+        Called By:      add() - ScrumbanArchive.py
+
+        Calls:          parse_date() - ScrumbanMember.py
+
+        Modifies:       N/A
+
+        Return:         str or None
+
+        Description:    return the YYYY-MM of the completion date of the task,
+                        None if it has no completion date that is a real day
+        """
+        done = parse_date(task[3]) if len(task) > 3 else 0
+        if isinstance(done, str) or done == 0:
+            return None
+        day = date.fromordinal(done)
+        return f"{day.year:04d}-{day.month:02d}"
+
+    def add(self, tasks) -> int:
+        """
+        Parameter:
+            tasks:      the fields of each completed task to archive, each must
+                        have a completion date
+
+        Called By:      archive_completed_tasks() - ScrumbanHistory.py
+
+        Calls:          get_month(), _partition_path()
+                        format_header() - ScrumbanSchema.py
+                        gzip.GzipFile, os.fsync()
+
+        Modifies:       the partitions
+
+        Return:         int - the number of tasks archived
+
+        Description:    append the tasks to the partitions of the months they
+                        were completed in, as compressed csv lines, and flush
+                        each partition to disk. A new partition starts with
+                        the version header.
+        """
+        # lines: the csv lines of the tasks of each month, in the order given
+        lines = {}
+        # archived: how many tasks were given
+        archived = 0
+        for task in tasks:
+            lines.setdefault(self.get_month(task), []).append(", ".join(task) + "\n")
+            archived += 1
+
+        makedirs(self.directory, exist_ok=True)
+        # month: each month that gets tasks
+        for month in sorted(lines):
+            # a new partition starts with the version header
+            if not path.exists(self._partition_path(month)):
+                lines[month].insert(0, format_header("completed_archive"))
+            with open(self._partition_path(month), "ab") as partition:
+                # each run adds a gzip member, which reads back as one stream
+                with gzip.GzipFile(fileobj=partition, mode="wb") as compressed:
+                    compressed.write("".join(lines[month]).encode())
+                partition.flush()
+                fsync(partition.fileno())
+
+        return archived
+
+    def get_months(self) -> list:
+        """
+        Parameter:      N/A
+
+        Called By:      iter_tasks() - ScrumbanArchive.py
+
+        Calls:          os.listdir()
+
+        Modifies:       N/A
+
+        Return:         list[str]
+
+        Description:    return the YYYY-MM of each partition, oldest first
+        """
+        if not path.isdir(self.directory):
+            return []
+        return sorted(name[:-len(partition_suffix)] for name in listdir(self.directory)
+                      if name.endswith(partition_suffix))
+
+    def iter_tasks(self, first: str = None, last: str = None):
+        """
+        Parameter:
+            first:      the first month to read as YYYY-MM, None for the oldest
+            last:       the last month to read as YYYY-MM, None for the newest
+
+        Called By:      N/A
+
+        Calls:          get_months(), _partition_path()
+                        is_header() - ScrumbanSchema.py
+                        gzip.open()
+
+        Modifies:       N/A
+
+        Return:         iterator[list[str]]
+
+        Description:    yield the fields of each archived task of the months
+                        from first to last, oldest month first. Each partition
+                        is only opened when the one before it is used up.
+        """
+        # month: each partition in the range
+        for month in self.get_months():
+            if (first is not None and month < first) or (last is not None and month > last):
+                continue
+            with gzip.open(self._partition_path(month), "rt") as partition:
+                for line in partition:
+                    # skip the version header
+                    if is_header(line):
+                        continue
+                    yield [field.strip() for field in line.strip().split(",")]
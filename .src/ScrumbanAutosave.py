@@ -0,0 +1,313 @@
+"""
+File: ScrumbanAutosave.py
+
+Description: This module is responsible for saving the board of the Virtual
+             Scrumban System while a meeting is running.
+
+             It completes several tasks:
+
+             1. Watches the generation of each part of the board from the
+                interface event loop, and waits for a burst of changes to
+                settle before saving them
+             2. Copies only the changed parts of the board on the interface
+                thread, so the board is never read by two threads. The
+                project backlog is copied unsorted and is sorted and
+                formatted on the background thread.
+             3. Writes the converted parts on a background thread, so the
+                interface never waits on the disk
+             4. Finishes the write in progress when the system saves or shuts
+                down
+
+Dependencies: concurrent.futures
+
+Date Created: 10/17/2026
+"""
+
+# used to write the board on a background thread
+from concurrent.futures import ThreadPoolExecutor
+
+from ScrumbanBoard import SAVED_PARTS
+
+# how often the board is checked for changes, in milliseconds
+poll_interval: int = 250
+
+
+class Autosaver():
+    """
+    Write behind saving of the board during a meeting.
+
+    Every poll_interval milliseconds the interface thread compares the
+    generation of each part of the board with the last poll. Once the board
+    has been quiet for self.delay milliseconds, or has had unsaved changes for
+    self.max_delay milliseconds, the changed parts are handed to history and
+    written on the background thread. Only one write is in progress at a time,
+    history isn't touched by the interface thread until it is collected.
+
+    Used By:
+        VSS.py
+        ScrumbanInterface.py
+
+    Members:
+        Member Name:                : Type              : Default Val   -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.system                 : VSS               : -             -> the system whose board and history are saved
+        self.delay                  : int               : 2000          -> milliseconds without a change before saving
+        self.max_delay              : int               : 30000         -> milliseconds a change can wait while the board keeps
+                                                                           changing
+        self._executor              : ThreadPoolExecutor: -             -> the background thread the saves are written on
+        self._pending               : Future            : None          -> the write in progress, None if there is none
+        self._pending_generations   : dict[str, int]    : {}            -> the generation of each part of the write in progress
+        self._seen                  : tuple[int]        : ()            -> the generations of the parts at the last poll
+        self._quiet                 : int               : 0             -> milliseconds since the board last changed
+        self._waiting               : int               : 0             -> milliseconds the board has had unsaved changes
+        self._window                : Tk                : None          -> the window whose event loop runs the polls
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _poll(self)                                                 |   -> None
+                                                                                    |
+        Usage:          window.after(poll_interval, instance._poll)                 |
+                                                                                    |
+        Description:    Check the board for changes and save it once it settles     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _save(self)                                                 |   -> None
+                                                                                    |
+        Usage:          instance._save()                                            |
+                                                                                    |
+        Description:    Hand the changed parts to history and write them behind     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _collect(self, wait: bool)                                  |   -> None
+                                                                                    |
+        Usage:          instance._collect(False)                                    |
+                                                                                    |
+        Description:    Mark the parts of a finished write as saved                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    start(self, window: Tk)                                     |   -> None
+                                                                                    |
+        Usage:          instance.start(interface)                                   |
+                                                                                    |
+        Description:    Start polling the board from the event loop of window       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    is_saving(self)                                             |   -> bool
+                                                                                    |
+        Usage:          instance.is_saving()                                        |
+                                                                                    |
+        Description:    Return True while a write is in progress                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    flush(self)                                                 |   -> None
+                                                                                    |
+        Usage:          instance.flush()                                            |
+                                                                                    |
+        Description:    Wait for the write in progress to finish                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    stop(self)                                                  |   -> None
+                                                                                    |
+        Usage:          instance.stop()                                             |
+                                                                                    |
+        Description:    Flush and end the background thread                         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, system, delay: int = 2000, max_delay: int = 30000):
+        # the system whose board is saved
+        self.system = system
+
+        # how long the board has to be quiet, and how long a change can wait at most
+        self.delay = delay
+        self.max_delay = max(delay, max_delay)
+
+        # one thread, so the writes land in the order they were handed over
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        self._pending_generations = {}
+
+        # the debounce state
+        self._seen = ()
+        self._quiet = 0
+        self._waiting = 0
+
+        # the window whose event loop polls the board
+        self._window = None
+
+    def start(self, window) -> None:
+        """
+        Parameter:
+            window:     the Tk window whose event loop runs the polls
+
+        Called By:      startup() - VSS.py
+
+        Calls:          after() - tkinter
+
+        Modifies:       self._window
+
+        Return:         None
+
+        Description:    start checking the board for changes every
+                        poll_interval milliseconds
+        """
+        self._window = window
+        window.after(poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      the Tk event loop
+
+        Calls:          _collect(), _save()
+                        get_unsaved_parts() - ScrumbanBoard.py
+                        after() - tkinter
+
+        Modifies:       self._seen
+                        self._quiet
+                        self._waiting
+
+        Return:         None
+
+        Description:    restart the quiet time whenever a part of the board
+                        changed since the last poll, and save the board once
+                        it has been quiet for self.delay or unsaved for
+                        self.max_delay
+        """
+        board = self.system.board
+
+        # mark the parts of a finished write as saved
+        self._collect(False)
+
+        # generations: a counter per part that rises with each change to it
+        generations = tuple(board.generations[part] for part in SAVED_PARTS)
+        if generations != self._seen:
+            self._seen = generations
+            self._quiet = 0
+        else:
+            self._quiet += poll_interval
+
+        # only start a save when none is being written
+        if self._pending is None and board.get_unsaved_parts():
+            self._waiting += poll_interval
+            if self._quiet >= self.delay or self._waiting >= self.max_delay:
+                self._save()
+
+        self._window.after(poll_interval, self._poll)
+
+    def _save(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      _poll() - ScrumbanAutosave.py
+
+        Calls:          _set_changed_parts() - VSS.py
+                        save_scrumban() - ScrumbanHistory.py
+
+        Modifies:       self._pending
+                        self._pending_generations
+                        self._waiting
+
+        Return:         None
+
+        Description:    copy the changed parts of the board into history on
+                        this thread, then write them on the background thread,
+                        which also sorts and formats the project backlog
+                        copy. The generations are kept from the moment of
+                        the copy, so a change made during the write is still
+                        unsaved when it finishes.
+        """
+        board = self.system.board
+
+        # changed: the parts copied, the others are left as they are
+        changed = self.system._set_changed_parts()
+        self._pending_generations = {part: board.generations[part] for part in changed}
+        self._pending = self._executor.submit(self.system.history.save_scrumban, changed)
+        self._waiting = 0
+
+    def _collect(self, wait: bool) -> None:
+        """
+        Parameter:
+            wait:       True to wait for the write in progress, False to only
+                        collect it if it is already done
+
+        Called By:      _poll(), flush() - ScrumbanAutosave.py
+
+        Calls:          mark_saved() - ScrumbanBoard.py
+
+        Modifies:       self._pending
+                        self.system.board
+
+        Return:         None
+
+        Description:    mark the parts of the finished write as saved at the
+                        generations they were written with. A failed write is
+                        reported and its parts stay unsaved, so they are tried
+                        again.
+        """
+        if self._pending is None or (not wait and not self._pending.done()):
+            return
+
+        try:
+            self._pending.result()
+        except Exception as error:
+            print(f"AUTOSAVE FAILED: {error}")
+        else:
+            self.system.board.mark_saved(set(self._pending_generations), self._pending_generations)
+
+        self._pending = None
+
+    def is_saving(self) -> bool:
+        """
+        Parameter:      N/A
+
+        Called By:      _poll() - ScrumbanWatcher.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         bool
+
+        Description:    return True from the moment the board is handed to
+                        history until the write is collected, the files and
+                        history may not agree in that time
+        """
+        return self._pending is not None
+
+    def flush(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      send_reports(), shutdown() - VSS.py
+                        project_reset_clicked() - ScrumbanInterface.py
+
+        Calls:          _collect()
+
+        Modifies:       self._pending
+
+        Return:         None
+
+        Description:    wait for the write in progress so history can be used
+                        by the caller. The changes it didn't include are left
+                        for the caller's own save.
+        """
+        self._collect(True)
+
+    def stop(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      shutdown() - VSS.py
+
+        Calls:          flush()
+
+        Modifies:       self._executor
+
+        Return:         None
+
+        Description:    finish the write in progress and end the background
+                        thread
+        """
+        self.flush()
+        self._executor.shutdown(wait=True)
@@ -4,7 +4,34 @@ Author: Sam Gebhardt
 Date:   02/16/2022
 Last Edit: 02/16/   Sam Gebhardt    Created File
 """
+from datetime import date
+from heapq import heapify, heappop, heappush
 from ScrumbanMember import ScrumbanMember, Task
+from ScrumbanQueue import TaskQueue, BacklogRows
+from ScrumbanCompleted import CompletedStore, CompletedRows
+from ScrumbanDeadlines import DueDateIndex
+from ScrumbanCommands import MoveCommand, CompoundCommand, CommandLog
+
+# The containers a task can be located in
+PROJECT = "project"
+TODO = "todo"
+MEMBER = "member"
+COMPLETED = "completed"
+
+# The parts of the board that are saved to their own file, the containers
+# and the meeting notes
+NOTES = "notes"
+SAVED_PARTS = (PROJECT, TODO, MEMBER, COMPLETED, NOTES)
+
+# The moves apply_batch accepts, mapped to (container the task must be in,
+# container it moves to). Each op is a tuple of (move, uid) or (move, uid, member).
+BATCH_MOVES = {
+    "assign_task": (TODO, MEMBER),
+    "move_member_to_member": (MEMBER, MEMBER),
+    "member_to_todo": (MEMBER, TODO),
+    "complete_task": (MEMBER, COMPLETED),
+    "completed_to_todo": (COMPLETED, TODO),
+}
 
 
 class Board():
@@ -18,12 +45,13 @@ class Board():
     Members:
         Member Name:            : Type          : Default Val  -> Description
         ------------------------------------------------------------------------------------------------------------------------------------------
-        self.project_backlog    : list[Task]    : -             -> a list of Task objects representing the tasks
+        self.project_backlog    : TaskQueue     : -             -> a priority queue of Task objects representing the tasks
+                                                                   that have not been pulled into the todo backlog
 
         self.todo_backlog       : list[Task]    : -             -> a list of Tasl objects that represent tasks that must
                                                                    be completed, but aren't assigned to a member
 
-        self.completed_backlog  : list[Task]    : -             -> a list of task objects that represent tasks that have been completed
+        self.completed_backlog  : CompletedStore : -            -> a column store of the tasks that have been completed
 
         self.members            : list[ScrumbanMembers] : -     -> a list of ScrumbanMember objects that represent each
                                                                    member on the team
@@ -38,6 +66,26 @@ class Board():
 
         self.task_member_limit  : int           : 4             -> the max number of tasks that can be assigned to a member
 
+        self.next_uid           : int           : 0             -> the stable id given to the next task added to the board
+
+        self.locations          : dict[int, tuple] : {}         -> maps each task's stable id to its (container, member index,
+                                                                   position) so any task can be found in O(1), except the
+                                                                   completed tasks still paged from the file, which the
+                                                                   completed store finds itself
+
+        self.due_dates          : DueDateIndex  : -             -> the open tasks (project, todo and members) sorted by due date
+
+        self.command_log        : CommandLog    : -             -> the moves that can be undone and redone
+
+        self.journal            : BoardJournal  : None          -> records every change to the board when the event sourced
+                                                                   storage mode is on
+
+        self.generations        : dict[str, int] : 0 each       -> for each part in SAVED_PARTS, a counter raised by every
+                                                                   change to that part
+
+        self.saved_generations  : dict[str, int] : 0 each       -> for each part, the generation its file holds, None if the
+                                                                   file may not match the board
+
     Methods:
 
         Public:                                                                      Return:
@@ -83,6 +131,157 @@ class Board():
         Description:    Move the task specified by index from the completed backlog |
                         to the todo backlog                                         |
         ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    locate_task(self, uid: int)                                 |   -> (str, int, int) or None
+                                                                                    |
+        Usage:          instance.locate_task(12)                                    |
+                                                                                    |
+        Description:    Return the container, member index and position of the task |
+                        with the stable id uid                                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_task(self, uid: int)                                    |   -> Task or None
+                                                                                    |
+        Usage:          instance.get_task(12)                                       |
+                                                                                    |
+        Description:    Return the task with the stable id uid                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    assign_task_by_uid(self, member_id: int, uid: int)          |   ->  int
+        Declaration:    move_member_to_member_by_uid(self, uid: int, member2: int)  |   ->  int
+        Declaration:    member_to_todo_by_uid(self, uid: int)                       |   ->  int
+        Declaration:    complete_task_by_uid(self, uid: int)                        |   ->  int
+        Declaration:    completed_to_todo_by_uid(self, uid: int)                    |   ->  int
+                                                                                    |
+        Usage:          instance.complete_task_by_uid(12)                           |
+                                                                                    |
+        Description:    Same moves as the index based methods above, addressing     |
+                        the task by its stable id. Return 1 if the task is not in   |
+                        the expected container or a limit is reached, else 0        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    apply_batch(self, ops: list[tuple])                         |   ->  dict or None
+                                                                                    |
+        Usage:          instance.apply_batch([("assign_task", 12, 0),               |
+                                              ("complete_task", 7)])                |
+                                                                                    |
+        Description:    Check a list of moves against the limits and make all of    |
+                        them or none. Return the containers that changed, or None   |
+                        if any move is invalid                                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    auto_assign(self)                                           |   ->  dict
+                                                                                    |
+        Usage:          instance.auto_assign()                                      |
+                                                                                    |
+        Description:    Hand out the todo backlog by priority, each task going to   |
+                        the least loaded member below the WIP limit                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    apply_backlog_changes(self, inserted: list[list[str]],      |   ->  int
+                                              removed: list[str],                   |
+                                              changed: list[list[str]])             |
+        Usage:          instance.apply_backlog_changes([row], ["name"], [])         |
+                                                                                    |
+        Description:    Apply the tasks added to, removed from or changed in the    |
+                        project backlog file, return how many were applied          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_aging_policy(self, policy: AgingPolicy)                 |   ->  None
+                                                                                    |
+        Usage:          instance.set_aging_policy(AgingPolicy(7))                   |
+                                                                                    |
+        Description:    Age the project backlog with policy, None to stop aging     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_queued_days(self)                                       |   ->  dict[str, int]
+                                                                                    |
+        Usage:          instance.get_queued_days()                                  |
+                                                                                    |
+        Description:    Return the day each project backlog task was queued, keyed  |
+                        by task name                                                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    undo(self)                                                  |   ->  int
+                                                                                    |
+        Usage:          instance.undo()                                             |
+                                                                                    |
+        Description:    Undo the last move, return 1 if there is nothing to undo    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    redo(self)                                                  |   ->  int
+                                                                                    |
+        Usage:          instance.redo()                                             |
+                                                                                    |
+        Description:    Redo the last undone move, return 1 if there is nothing to  |
+                        redo                                                        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_state(self)                                             |   ->  dict
+                                                                                    |
+        Usage:          instance.get_state()                                        |
+                                                                                    |
+        Description:    Return the whole board as plain lists and dicts             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    from_state(cls, state: dict)                                |   ->  Board
+                                                                                    |
+        Usage:          Board.from_state(state)                                     |
+                                                                                    |
+        Description:    Build a board from the result of get_state, keeping the     |
+                        task ids and positions                                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    apply_entry(self, entry: dict)                              |   ->  None
+                                                                                    |
+        Usage:          instance.apply_entry({"op": "notes", "text": ""})           |
+                                                                                    |
+        Description:    Replay one change read back from the journal                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_member_qc(self, member_id: int, qc: str)                |   ->  None
+                                                                                    |
+        Usage:          instance.set_member_qc(0, "")                               |
+                                                                                    |
+        Description:    Set the questions and concerns of a member                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    start_meeting(self)                                         |   ->  None
+                                                                                    |
+        Usage:          instance.start_meeting()                                    |
+                                                                                    |
+        Description:    Reset a board kept from the last meeting as if it had just  |
+                        been read from the saved files                              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    page_completed(self, completed_rows: CompletedRows)         |   ->  None
+                                                                                    |
+        Usage:          instance.page_completed(rows)                               |
+                                                                                    |
+        Description:    Page the completed backlog from the file holding it         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_unsaved_parts(self)                                     |   ->  set[str]
+                                                                                    |
+        Usage:          instance.get_unsaved_parts()                                |
+                                                                                    |
+        Description:    Return the parts in SAVED_PARTS changed since last saved    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    mark_saved(self, parts: set[str],                           |   ->  None
+                                   generations: dict[str, int])                     |
+        Usage:          instance.mark_saved({PROJECT, TODO})                        |
+                                                                                    |
+        Description:    Record that the files of parts now match the board, or the  |
+                        board as it was at generations                              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    mark_unsaved(self)                                          |   ->  None
+                                                                                    |
+        Usage:          instance.mark_unsaved()                                     |
+                                                                                    |
+        Description:    Treat every part as changed so the next save writes all     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_overdue_tasks(self, today: int = None)                  |   ->  list[Task]
+                                                                                    |
+        Usage:          instance.get_overdue_tasks()                                |
+                                                                                    |
+        Description:    Return the open tasks due before today, most overdue first  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_upcoming_tasks(self, days: int, today: int = None)      |   ->  list[Task]
+                                                                                    |
+        Usage:          instance.get_upcoming_tasks(7)                              |
+                                                                                    |
+        Description:    Return the open tasks due in the next days days             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_string_at_risk(self, days: int)                         |   ->  list[Str]
+                                                                                    |
+        Usage:          instance.get_string_at_risk(7)                              |
+                                                                                    |
+        Description:    Return the overdue tasks and the tasks due in the next days |
+                        days as display strings                                     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    get_agenda(self)                                            |   ->  list[Str]
                                                                                     |
         Usage:          instance.get_agenda()                                       |
@@ -101,13 +300,13 @@ class Board():
                                                                                     |
         Description:    Returns the todo backlog (self.todo_backlog)                |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    get_project_backlog(self)                                   |   -> list[Task]
+        Declaration:    get_project_backlog(self)                                   |   -> TaskQueue
                                                                                     |
         Usage:          instance.get_project_backlog()                              |
                                                                                     |
         Description:    Returns the project backlog (self.project_backlog)          |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    get_completed(self)                                         |   ->  list[Task]
+        Declaration:    get_completed(self)                                         |   ->  CompletedStore
                                                                                     |
         Usage:          instance.get_completed()                                    |
                                                                                     |
@@ -143,12 +342,19 @@ class Board():
                                                                                     |
         Description:    Return the todo backlog as a list of strings                |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    get_string_completed(self)                                  |   -> list[list[Str]]
+        Declaration:    get_string_completed(self)                                  |   -> CompletedRows
                                                                                     |
         Usage:          instance.get_string_completed()                             |
                                                                                     |
         Description:    Return the completed backlog as a list of strings           |
         ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_string_completed_counts(self)                           |   -> list[str]
+                                                                                    |
+        Usage:          instance.get_string_completed_counts()                      |
+                                                                                    |
+        Description:    Return the completed tasks per day and per priority as      |
+                        display strings                                             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    set_notes(self, notes: str)                                 |   -> None
                                                                                     |
         Usage:          instance.set_notes()                                        |
@@ -169,17 +375,18 @@ class Board():
         ----------------------------------------------------------------------------|-------------------------------------------------
     """
 
-    def __init__(self, project_backlog:list, todo_backlog:list, members:list,
-            completed_backlog:list, agenda:list, task_limit=4, todo_limit=4):
+    def __init__(self, project_backlog, todo_backlog, members,
+            completed_backlog:list, agenda:list, task_limit=4, todo_limit=4,
+            queued_days:dict = None):
 
-        # list of tasks for the project backlog
-        self.project_backlog = []
+        # priority queue of tasks for the project backlog
+        self.project_backlog = TaskQueue()
 
         # list of tasks for the todo backlog
         self.todo_backlog = []
 
-        # list of tasks for the completed backlog
-        self.completed_backlog = []
+        # column store of tasks for the completed backlog
+        self.completed_backlog = CompletedStore()
 
         # list of ScrumbanMembers for each member of the team
         self.members = []
@@ -196,6 +403,28 @@ class Board():
         # The max number of task each member can work on
         self.task_member_limit = task_limit
 
+        # the stable id that will be given to the next task added to the board
+        self.next_uid = 0
+
+        # maps each task's stable id to (container, member index, position)
+        self.locations = {}
+
+        # the open tasks sorted by due date
+        self.due_dates = DueDateIndex()
+
+        # the moves made on the board that can be undone
+        self.command_log = CommandLog()
+
+        # set by BoardJournal.attach when changes are being journaled
+        self.journal = None
+
+        # the board starts out as it was read from the files
+        self.generations = dict.fromkeys(SAVED_PARTS, 0)
+        self.saved_generations = dict.fromkeys(SAVED_PARTS, 0)
+
+        # the project backlog, todo backlog and members are each walked once in
+        # order, so they can be lists or the rows history streams from the files
+
         # member: each item in the members argument
         # For each inputted user,create a Task object for each task
         # assigned to the user, then create a Scrumban Member object
@@ -214,70 +443,90 @@ class Board():
                     task_fields = task.split('\t')
 
                     # Create a task object using the indiviudal task fields
-                    tasks.append(Task(task_fields[0], task_fields[1], task_fields[2], ""))
+                    tasks.append(self._register_task(Task(task_fields[0], task_fields[1], task_fields[2], "")))
 
             # new_member: A ScrumbanMember object that has the members email, name
             # list of task objects and any questions or concerns
             new_member = ScrumbanMember(member[0], member[1], tasks, member[3])
             self.members.append(new_member)
 
-        # task: each task from the inputted project_backlog
-        for task in project_backlog:
-            # Create a task object with the following arguments:
-            # task name,  priority, due date, completed date
-            # Then add it to the class attribute
-            self.project_backlog.append(Task(task[0], task[1], task[2], ""))
+            # index the member's tasks
+            self._reindex(MEMBER, len(self.members) - 1, tasks, 0)
 
-        # sort the project backlog on priority
-        task_bubble_sort(self.project_backlog)
+        # task: each task from the inputted project_backlog
+        # Create a task object with the following arguments:
+        # task name,  priority, due date, completed date
+        # Then heapify them into the project backlog all at once
+        self.project_backlog.heapify(self._register_task(Task(task[0], task[1], task[2], ""), PROJECT)
+                                     for task in project_backlog)
+
+        # Tasks that were queued in an earlier session keep their age
+        if queued_days:
+            self.project_backlog.set_queued_days({task.get_uid(): queued_days[task.get_name()]
+                                                  for task in self.project_backlog.tasks()
+                                                  if task.get_name() in queued_days})
+
+        # tasks queued for the first time today have a queued day to save
+        if any(task.get_name() not in (queued_days or {}) for task in self.project_backlog.tasks()):
+            self._touch(PROJECT)
 
         # task: each task from the inputted project_backlog
         for task in todo_backlog:
             # Create a task object with the following arguments:
             # task name,  priority, due date, completed date
             # Then add it to the class attribute
-            self.todo_backlog.append(Task(task[0], task[1], task[2], ""))
+            self.todo_backlog.append(self._register_task(Task(task[0], task[1], task[2], "")))
 
-        # _: temp var that is only for iteration
-        # Add the tasks from the project backlog to
-        # the todo backlog without going over the todo_limit
-        for _ in range(len(self.todo_backlog), todo_limit):
+        # index the todo backlog
+        self._reindex(TODO, None, self.todo_backlog, 0)
 
-            # if the project backlog is empty stop
-            if not self.project_backlog:
-                break
+        # top up the todo backlog from the project backlog
+        self._fill_todo()
 
-            # Move the task from project to todo backlog
-            self.todo_backlog.append(self.project_backlog.pop(0))
+        # rows still in the completed tasks file are paged from it, they take
+        # the next block of stable ids and are only read when needed
+        if isinstance(completed_backlog, CompletedRows) and completed_backlog.file is not None:
+            self.completed_backlog.attach(completed_backlog.file, completed_backlog.paged, self.next_uid)
+            self.next_uid += completed_backlog.paged
+            completed_backlog = completed_backlog.rows
 
         # task: each task from the inputted project_backlog
         for task in completed_backlog:
             # Create a task object with the following arguments:
             # task name,  priority, due date, completed date
             # Then add it to the class attribute
-            self.completed_backlog.append(Task(task[0], task[1], task[2], task[3]))
+            self.completed_backlog.append(self._register_task(Task(task[0], task[1], task[2], task[3])))
 
-    def backlog_to_todo(self) -> None:
+        # index the completed backlog
+        self._reindex(COMPLETED, None, self.completed_backlog, 0)
+
+        # index the due dates of every open task, sorting once
+        self.due_dates.rebuild(self._open_tasks())
+
+    def _fill_todo(self) -> None:
         """
         Parameter:
             None
 
         Called By:
-            refresh_todo_button_clicked - ScrumbanInterface.py
+            __init__, start_meeting - ScrumbanBoard.py
 
         Calls:
-           None
+           _place, _touch
+           [TaskQueue].pop()
 
         Modifies:
             self.project_backlog
             self.todo_backlog
+            self.generations
 
         Return:
             None
 
         Description:
-            - Add tasks to the todo backlog from the project backlog till max
-                todo size is reached
+            Move tasks from the project backlog to the todo backlog till
+            max todo size is reached, as is done at the start of each meeting.
+            These moves aren't undoable.
         """
         # _: temp var that is only for iteration
         # Add the tasks from the project backlog to
@@ -289,60 +538,1015 @@ class Board():
                 break
 
             # Move the task from project to todo backlog
-            self.todo_backlog.append(self.project_backlog.pop(0))
+            self._place(self.project_backlog.pop(), TODO)
+            self._touch(PROJECT, TODO)
 
-    def assign_task(self, member_id: int, task_id: int) -> int:
+    def start_meeting(self) -> None:
+        """
+        Parameter:
+            None
+
+        Called By:
+            load - ScrumbanSnapshot.py
+            startup - VSS.py
+
+        Calls:
+           _fill_todo
+           [ScrumbanMember].set_qc()
+           [CommandLog].clear()
+
+        Modifies:
+            self.notes
+            self.members
+            self.command_log
+            self.generations
+            self.saved_generations
+
+        Return:
+            None
+
+        Description:
+            Put a board saved at the end of a meeting into the state the
+            constructor leaves a board read from the saved files in: no notes,
+            no questions and concerns, nothing to undo, every part saved and
+            the todo backlog topped up
+        """
+        self.notes = ""
+        # member: each member's questions and concerns start blank
+        for member in self.members:
+            member.set_qc("")
+        self.command_log.clear()
+
+        # the files hold the board as it was saved
+        self.generations = dict.fromkeys(SAVED_PARTS, 0)
+        self.saved_generations = dict.fromkeys(SAVED_PARTS, 0)
+
+        self._fill_todo()
+
+    def __getstate__(self) -> dict:
+        """
+        Parameter:
+            None
+
+        Called By:
+            save - ScrumbanSnapshot.py (through pickle)
+
+        Calls:
+           None
+
+        Modifies:
+            None
+
+        Return:
+            dict
+
+        Description:
+            Return the attributes to pickle, leaving out the undo history and
+            the journal, neither of which outlives the meeting
+        """
+        state = self.__dict__.copy()
+        state["command_log"] = CommandLog()
+        state["journal"] = None
+        return state
+
+    def _open_tasks(self):
+        """
+        Parameter:
+            None
+
+        Called By:
+            __init__ - ScrumbanBoard.py
+
+        Calls:
+           [TaskQueue].tasks()
+
+        Modifies:
+            None
+
+        Return:
+            generator[Task]
+
+        Description:
+            Yield every task that hasn't been completed, in no particular order
+        """
+        yield from self.project_backlog.tasks()
+        yield from self.todo_backlog
+        # member: each member's assigned tasks
+        for member in self.members:
+            yield from member.get_tasks()
+
+    def _register_task(self, task: Task, container=None) -> Task:
+        """
+        Parameter:
+            task: A task that is being added to the board
+            container: PROJECT if the task is going into the project backlog,
+                other containers record locations when the task is placed
+
+        Called By:
+            __init__ - ScrumbanBoard.py
+
+        Calls:
+           [Task].set_uid()
+
+        Modifies:
+            self.next_uid
+            self.locations
+
+        Return:
+            Task
+
+        Description:
+            Give task the next stable id and return it
+        """
+        task.set_uid(self.next_uid)
+        self.next_uid += 1
+
+        # tasks in the project backlog have no position, the queue finds them
+        if container == PROJECT:
+            self.locations[task.get_uid()] = (PROJECT, None, None)
+
+        return task
+
+    def _container_list(self, container: str, member) -> list:
         """
         Parameters:
-            member_id: The index of the member that is getting assigned a task
-            task_id: The index of the task (from todo backlog) that is getting
-                assigned to the member
+            container: TODO, MEMBER or COMPLETED
+            member: The index of the member when container is MEMBER
 
         Called By:
-            todo_to_member - ScrumbanInterface.py
+            _take, _place - ScrumbanBoard.py
 
         Calls:
            None
 
         Modifies:
-            self.project_backlog
-            self.todo_backlog
+            None
+
+        Return:
+            list[Task] or CompletedStore
+
+        Description:
+            Return the list that holds the tasks of container
+        """
+        if container == TODO:
+            return self.todo_backlog
+        if container == MEMBER:
+            return self.members[member].current_tasks
+        return self.completed_backlog
+
+    def _reindex(self, container: str, member, tasks: list, start: int) -> None:
+        """
+        Parameters:
+            container: The container that holds tasks
+            member: The index of the member when container is MEMBER
+            tasks: The list or CompletedStore of tasks held by the container
+            start: The first position whose location has to be recorded
+
+        Called By:
+            __init__, _take, _place - ScrumbanBoard.py
+
+        Calls:
+           [Task].get_uid()
+           [CompletedStore].iter_uids()
+
+        Modifies:
+            self.locations
+
+        Return:
+            None
+
+        Description:
+            Record the location of every task in tasks from position start on
+        """
+        # the completed store hands out ids without rebuilding its tasks, and
+        # finds the rows it still pages from the file itself
+        if container == COMPLETED:
+            start = max(start, tasks.get_paged_rows())
+            uids = tasks.iter_uids(start)
+        else:
+            uids = (task.get_uid() for task in tasks[start:])
+
+        # position, uid: each position from start to the end and the task id there
+        for position, uid in enumerate(uids, start):
+            self.locations[uid] = (container, member, position)
+
+    def _take(self, uid: int):
+        """
+        Parameters:
+            uid: The stable id of a task on the board
+
+        Called By:
+            _relocate - ScrumbanBoard.py
+
+        Calls:
+           _container_list, _reindex, _paged_location, _page_in_completed
+           [TaskQueue].remove()
+
+        Modifies:
+            self.locations
+            the list that held the task
+
+        Return:
+            (Task, (str, int, int))
+
+        Description:
+            Remove the task from wherever it is on the board and return it
+            with the exact location it was taken from. Only the tasks after it
+            in the same list are re-indexed, and the todo backlog and member
+            lists are bounded by the WIP limits. A task taken from the project
+            backlog reports its queue sequence number and queued day as its
+            position, so the move holds its age rather than the queue.
+        """
+        location = self.locations.pop(uid, None) or self._paged_location(uid)
+        if location is None:
+            raise KeyError(uid)
+        container, member, position = location
+
+        # the queue knows where the task is and its place among equal priorities
+        if container == PROJECT:
+            position, task = self.project_backlog.remove(uid)
+            return task, (container, member, position)
+
+        tasks = self._container_list(container, member)
+
+        # a paged completed row can only be taken once the rows are read in
+        if container == COMPLETED and position < tasks.get_paged_rows():
+            self._page_in_completed()
+
+        task = tasks.pop(position)
+        self._reindex(container, member, tasks, position)
+        return task, (container, member, position)
+
+    def _place(self, task: Task, container: str, member=None, position=None) -> tuple:
+        """
+        Parameters:
+            task: The task being placed on the board
+            container: PROJECT, TODO, MEMBER or COMPLETED
+            member: The index of the member when container is MEMBER
+            position: Where in the list to insert the task, None to append it.
+                In the project backlog it is the queue sequence number and
+                queued day the task was taken with.
+
+        Called By:
+            __init__, _relocate - ScrumbanBoard.py
+
+        Calls:
+           _container_list, _reindex, _page_in_completed
+           [TaskQueue].push()
+
+        Modifies:
+            self.locations
+            the list that receives the task
+
+        Return:
+            (str, int, int)
+
+        Description:
+            Insert the task into a container, record its location and return it
+        """
+        # the queue orders the project backlog itself
+        if container == PROJECT:
+            self.project_backlog.push(task, position)
+            self.locations[task.get_uid()] = (PROJECT, None, None)
+            return (PROJECT, None, position)
+
+        tasks = self._container_list(container, member)
+
+        # a row can only be put among the paged completed rows once they are read in
+        if container == COMPLETED and position is not None and position < tasks.get_paged_rows():
+            self._page_in_completed()
+
+        # append unless a position inside the list is given
+        if position is None or position >= len(tasks):
+            position = len(tasks)
+            tasks.append(task)
+        else:
+            tasks.insert(position, task)
+
+        self._reindex(container, member, tasks, position)
+        return (container, member, position)
+
+    def _paged_location(self, uid: int):
+        """
+        Parameters:
+            uid: The stable id of a task
+
+        Called By:
+            _take, locate_task - ScrumbanBoard.py
+
+        Calls:
+           [CompletedStore].locate()
+
+        Modifies:
+            None
+
+        Return:
+            (str, int, int) or None
+
+        Description:
+            Return the location of a completed task that is still paged from
+            the completed tasks file, None if the task isn't one
+        """
+        position = self.completed_backlog.locate(uid)
+        return None if position is None else (COMPLETED, None, position)
+
+    def _page_in_completed(self) -> None:
+        """
+        Parameters:
+            None
+
+        Called By:
+            _take, _place - ScrumbanBoard.py
+
+        Calls:
+           _reindex
+           [CompletedStore].page_in()
+
+        Modifies:
+            self.completed_backlog
+            self.locations
+
+        Return:
+            None
+
+        Description:
+            Read the paged completed rows into the store and record their
+            locations, so one of them can be moved
+        """
+        self.completed_backlog.page_in()
+        self._reindex(COMPLETED, None, self.completed_backlog, 0)
+
+    def page_completed(self, completed_rows) -> None:
+        """
+        Parameters:
+            completed_rows: The completed tasks as they are in the completed
+                tasks file, a CompletedRows paged from it
+
+        Called By:
+            startup - VSS.py
+
+        Calls:
+           [CompletedStore].attach()
+
+        Modifies:
+            self.completed_backlog
+            self.locations
+            self.next_uid
+
+        Return:
+            None
+
+        Description:
+            Page the completed backlog from the file that holds the same
+            tasks, instead of keeping them in memory. The completed tasks get
+            new stable ids, so it is only done at the start of a meeting.
+        """
+        # the file has to hold exactly the completed backlog
+        if not isinstance(completed_rows, CompletedRows) or completed_rows.file is None \
+                or completed_rows.paged != len(completed_rows) or len(completed_rows) != len(self.completed_backlog):
+            return
+
+        # forget where the rows in memory were
+        for uid in self.completed_backlog.iter_uids(self.completed_backlog.get_paged_rows()):
+            self.locations.pop(uid, None)
+
+        self.completed_backlog = CompletedStore()
+        self.completed_backlog.attach(completed_rows.file, completed_rows.paged, self.next_uid)
+        self.next_uid += completed_rows.paged
+
+    def _relocate(self, uid: int, location: tuple, done=None) -> tuple:
+        """
+        Parameters:
+            uid: The stable id of the task being moved
+            location: The (container, member index, position) to move it to,
+                a position of None appends it
+            done: The completed date to give the task, None to leave it
+
+        Called By:
+            apply, revert - ScrumbanCommands.py
+
+        Calls:
+           _take, _place, _touch
+           [Task].set_completed_date()
+           [DueDateIndex].add(), [DueDateIndex].discard()
+
+        Modifies:
+            self.locations
+            self.due_dates
+            self.generations
+            the lists that lose and receive the task
+
+        Return:
+            ((str, int, int), (str, int, int), int)
+
+        Description:
+            Move a task to location without checking any limits. Returns the
+            exact location it came from, the exact location it went to and the
+            completed date it had, which is everything needed to move it back.
+        """
+        container, member, position = location
+
+        task, source = self._take(uid)
+        previous_done = task.completed_date
+
+        if done is not None:
+            task.set_completed_date(done)
+
+        # only open tasks are tracked by due date
+        if source[0] == COMPLETED and container != COMPLETED:
+            self.due_dates.add(task)
+        elif source[0] != COMPLETED and container == COMPLETED:
+            self.due_dates.discard(task)
+
+        target = self._place(task, container, member, position)
+        self._touch(source[0], container)
+
+        # the exact target lets a replay put the task in the same place
+        self._record({"op": "move", "uid": uid, "to": list(target), "done": done})
+
+        return source, target, previous_done
+
+    def _touch(self, *parts) -> None:
+        """
+        Parameters:
+            parts: The parts in SAVED_PARTS that were just changed
+
+        Called By:
+            __init__, _relocate, apply_entry, set_notes - ScrumbanBoard.py
+
+        Calls:
+           None
+
+        Modifies:
+            self.generations
+
+        Return:
+            None
+
+        Description:
+            Raise the generation of each changed part so it is saved again
+        """
+        # part: each part that changed
+        for part in parts:
+            self.generations[part] += 1
+
+    def get_unsaved_parts(self) -> set:
+        """
+        Parameters:
+            None
+
+        Called By:
+            shutdown, send_reports - VSS.py
+
+        Calls:
+           None
+
+        Modifies:
+            None
+
+        Return:
+            set[str]
+
+        Description:
+            Return the parts in SAVED_PARTS whose generation differs from the
+            one last saved to their file
+        """
+        return {part for part in SAVED_PARTS if self.generations[part] != self.saved_generations[part]}
+
+    def mark_saved(self, parts: set, generations: dict = None) -> None:
+        """
+        Parameters:
+            parts: The parts in SAVED_PARTS that were just written to their files
+            generations: The generation of each part when it was handed to history,
+                         None if it was handed over just now
+
+        Called By:
+            shutdown, send_reports - VSS.py
+            _collect - ScrumbanAutosave.py
+
+        Calls:
+           None
+
+        Modifies:
+            self.saved_generations
+
+        Return:
+            None
+
+        Description:
+            Record that the files of parts hold the board as it was at generations
+        """
+        if generations is None:
+            generations = self.generations
+
+        # part: each part that was saved
+        for part in parts:
+            self.saved_generations[part] = generations[part]
+
+    def mark_unsaved(self) -> None:
+        """
+        Parameters:
+            None
+
+        Called By:
+            startup - VSS.py
+
+        Calls:
+           None
+
+        Modifies:
+            self.saved_generations
+
+        Return:
+            None
+
+        Description:
+            Forget what the files hold so every part is written at the next save
+        """
+        self.saved_generations = dict.fromkeys(SAVED_PARTS, None)
+
+    def _record(self, entry: dict) -> None:
+        """
+        Parameters:
+            entry: The change that was just made
+
+        Called By:
+            _relocate, set_member_qc, set_notes, set_agenda - ScrumbanBoard.py
+
+        Calls:
+           [BoardJournal].record()
+
+        Modifies:
+            None
+
+        Return:
+            None
+
+        Description:
+            Pass the change to the journal if the board is being journaled
+        """
+        if self.journal is not None:
+            self.journal.record(entry)
+
+    def get_state(self) -> dict:
+        """
+        Parameters:
+            None
+
+        Called By:
+            snapshot - ScrumbanJournal.py
+
+        Calls:
+           [TaskQueue].entries()
+           [CompletedStore].iter_uids(), [CompletedStore].iter_rows()
+
+        Modifies:
+            None
+
+        Return:
+            dict
+
+        Description:
+            Return the whole board as plain lists and dicts that can be written
+            as JSON. Tasks are [id, name, priority, due date, completed date]
+            and project backlog tasks also carry their queue sequence number
+            and the day they were queued.
+        """
+        def row(task):
+            return [task.get_uid(), task.get_name(), task.get_priority_value(), task.get_due(), task.get_done()]
+
+        return {
+            "next_uid": self.next_uid,
+            "task_limit": self.task_member_limit,
+            "todo_limit": self.max_todo_size,
+            "notes": self.notes,
+            "agenda": self.agenda,
+            "project": [[sequence, queued] + row(task) for sequence, task, queued in self.project_backlog.entries()],
+            "todo": [row(task) for task in self.todo_backlog],
+            "members": [[member.get_name(), member.get_email(), member.get_qc(),
+                         [row(task) for task in member.get_tasks()]] for member in self.members],
+            "completed": [[uid] + fields for uid, fields in zip(self.completed_backlog.iter_uids(0),
+                                                                self.completed_backlog.iter_rows())],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict):
+        """
+        Parameters:
+            state: A dict returned by get_state
+
+        Called By:
+            load - ScrumbanJournal.py
+
+        Calls:
+           _reindex
+           [TaskQueue].restore()
+           [DueDateIndex].rebuild()
+
+        Modifies:
+            None
+
+        Return:
+            Board
+
+        Description:
+            Build a board from a saved state. Tasks keep their ids, order and
+            queue sequence numbers, so journal entries written against the
+            saved board replay onto the new one unchanged.
+        """
+        def task(row):
+            return Task(row[1], row[2], row[3], row[4], row[0])
+
+        board = cls([], [], [], [], state["agenda"], state["task_limit"], state["todo_limit"])
+        board.notes = state["notes"]
+        board.next_uid = state["next_uid"]
+
+        # the files weren't read, so none of them is known to match the board
+        board.saved_generations = dict.fromkeys(SAVED_PARTS, None)
+
+        # name, email, qc, tasks: the fields of each saved member
+        for name, email, qc, tasks in state["members"]:
+            board.members.append(ScrumbanMember(name, email, [task(row) for row in tasks], qc))
+            board._reindex(MEMBER, len(board.members) - 1, board.members[-1].current_tasks, 0)
+
+        # row: each project task, its sequence number and queued day first
+        board.project_backlog.restore((row[0], task(row[2:]), row[1]) for row in state["project"])
+        # queued: each restored project task, the queue keeps its place
+        for queued in board.project_backlog.tasks():
+            board.locations[queued.get_uid()] = (PROJECT, None, None)
+
+        # the todo backlog in its saved order
+        board.todo_backlog.extend(task(row) for row in state["todo"])
+        board._reindex(TODO, None, board.todo_backlog, 0)
+
+        # row: each completed task in its saved order
+        for row in state["completed"]:
+            board.completed_backlog.append(task(row))
+        board._reindex(COMPLETED, None, board.completed_backlog, 0)
+
+        # index the due dates of every open task, sorting once
+        board.due_dates.rebuild(board._open_tasks())
+        return board
+
+    def apply_entry(self, entry: dict) -> None:
+        """
+        Parameters:
+            entry: A change read back from the journal
+
+        Called By:
+            load - ScrumbanJournal.py
+
+        Calls:
+           _relocate, _touch
+
+        Modifies:
+            whatever the change touched
+
+        Return:
+            None
+
+        Description:
+            Make the change again. Moves go to the exact location that was
+            recorded, so limits aren't checked and no command is logged.
+        """
+        op = entry["op"]
+        if op == "move":
+            self._relocate(entry["uid"], tuple(entry["to"]), entry["done"])
+        elif op == "qc":
+            self.members[entry["member"]].set_qc(entry["text"])
+        elif op == "notes":
+            self.notes = entry["text"]
+            self._touch(NOTES)
+        elif op == "agenda":
+            self.agenda = entry["items"]
+
+    def set_member_qc(self, member_id: int, qc: str) -> None:
+        """
+        Parameters:
+            member_id: The index of the member
+            qc: The member's questions and concerns
+
+        Called By:
+            _save_text - ScrumbanInterface.py
+
+        Calls:
+           _record
+           [ScrumbanMember].set_qc()
+
+        Modifies:
+            self.members
+
+        Return:
+            None
+
+        Description:
+            Set the questions and concerns of a member. Only a change is
+            recorded since the interface calls this constantly.
+        """
+        member = self.members[member_id]
+        if member.get_qc() == qc:
+            return
+        member.set_qc(qc)
+        self._record({"op": "qc", "member": member_id, "text": qc})
+
+    def _execute(self, command) -> None:
+        """
+        Parameters:
+            command: A command that hasn't been applied yet
+
+        Called By:
+            assign_task_by_uid, move_member_to_member_by_uid, member_to_todo_by_uid,
+            complete_task_by_uid, completed_to_todo_by_uid - ScrumbanBoard.py
+
+        Calls:
+           [command].apply()
+           [CommandLog].record()
+
+        Modifies:
+            self.command_log
+
+        Return:
+            None
+
+        Description:
+            Apply the command and keep it so it can be undone
+        """
+        command.apply(self)
+        self.command_log.record(command)
+
+    def undo(self) -> int:
+        """
+        Parameters:
+            None
+
+        Called By:
+            _undo - ScrumbanInterface.py
+
+        Calls:
+           [CommandLog].undo()
+
+        Modifies:
+            self.command_log
+            the containers the moves touched
+
+        Return:
+            int
+
+        Description:
+            Undo the last move by applying its inverse. Return 1 if there is
+            nothing to undo, else 0
+        """
+        return self.command_log.undo(self)
+
+    def redo(self) -> int:
+        """
+        Parameters:
+            None
+
+        Called By:
+            _redo - ScrumbanInterface.py
+
+        Calls:
+           [CommandLog].redo()
+
+        Modifies:
+            self.command_log
+            the containers the moves touched
+
+        Return:
+            int
+
+        Description:
+            Apply the last undone move again. Return 1 if there is nothing to
+            redo, else 0
+        """
+        return self.command_log.redo(self)
+
+    def locate_task(self, uid: int):
+        """
+        Parameters:
+            uid: The stable id of a task
+
+        Called By:
+            _set_key_bindings, _member_to_complete - ScrumbanInterface.py
+
+        Calls:
+           _paged_location
+
+        Modifies:
+            None
+
+        Return:
+            (str, int, int) or None
+
+        Description:
+            Return the (container, member index, position) of the task in O(1).
+            The member index is None outside of members and the position is None
+            in the project backlog. Returns None if the task is not on the board.
+        """
+        return self.locations.get(uid) or self._paged_location(uid)
+
+    def get_task(self, uid: int):
+        """
+        Parameters:
+            uid: The stable id of a task
+
+        Called By:
+            None
+
+        Calls:
+           locate_task, _container_list
+
+        Modifies:
+            None
+
+        Return:
+            Task or None
+
+        Description:
+            Return the task with the id uid in O(1), None if it is not on the board
+        """
+        location = self.locate_task(uid)
+
+        # the task isn't on the board
+        if location is None:
+            return None
+
+        container, member, position = location
+
+        # tasks in the project backlog are found through the queue
+        if container == PROJECT:
+            return self.project_backlog.get(uid)
+
+        return self._container_list(container, member)[position]
+
+    def backlog_to_todo(self) -> None:
+        """
+        Parameter:
+            None
+
+        Called By:
+            refresh_todo_button_clicked - ScrumbanInterface.py
+
+        Calls:
+           [TaskQueue].age()
+           [MoveCommand].apply()
+           [CommandLog].record()
+
+        Modifies:
+            self.project_backlog
+            self.todo_backlog
+            self.command_log
+
+        Return:
+            None
+
+        Description:
+            - Add tasks to the todo backlog from the project backlog till max
+                todo size is reached. The moves are undone together.
+        """
+        # tasks that waited long enough move up before any are pulled
+        self.project_backlog.age()
+
+        # moves: each move from the project backlog to todo
+        moves = []
+
+        # _: temp var that is only for iteration
+        # Add the tasks from the project backlog to
+        # the todo backlog without going over the todo_limit
+        for _ in range(len(self.todo_backlog), self.max_todo_size):
+
+            # if the project backlog is empty stop
+            if not self.project_backlog:
+                break
+
+            # Move the task from project to todo backlog
+            move = MoveCommand(self.project_backlog.peek().get_uid(), (TODO, None, None))
+            move.apply(self)
+            moves.append(move)
+
+        # a refresh that moved nothing isn't worth undoing
+        if moves:
+            self.command_log.record(CompoundCommand(moves))
+
+    def assign_task(self, member_id: int, task_id: int) -> int:
+        """
+        Parameters:
+            member_id: The index of the member that is getting assigned a task
+            task_id: The index of the task (from todo backlog) that is getting
+                assigned to the member
+
+        Called By:
+            todo_to_member - ScrumbanInterface.py
+
+        Calls:
+           assign_task_by_uid
+
+        Modifies:
+            self.project_backlog
+            self.todo_backlog
+
+        Return:
+            int
+
+        Description:
+            - Move task from todo backlog to member. If WIP limit is met,
+                then do not assign task and return 1 for error, else 0
+        """
+
+        # if the member currently has the max number of tasks return error to caller
+        if len(self.members[member_id].get_tasks()) == self.task_member_limit:
+            return 1
+
+        if not len(self.todo_backlog) == 0:
+            # Move the task at that position using its stable id
+            return self.assign_task_by_uid(member_id, self.todo_backlog[task_id].get_uid())
+
+        # Return 0 as the operation was successful
+        return 0
+
+    def assign_task_by_uid(self, member_id: int, uid: int) -> int:
+        """
+        Parameters:
+            member_id: The index of the member that is getting assigned a task
+            uid: The stable id of the todo backlog task being assigned
+
+        Called By:
+            assign_task - ScrumbanBoard.py
+
+        Calls:
+           _execute
+
+        Modifies:
+            self.todo_backlog
+            self.members
+
+        Return:
+            int
+
+        Description:
+            - Move task from todo backlog to member. If WIP limit is met or the
+                task isn't in the todo backlog return 1 for error, else 0
+        """
+        location = self.locate_task(uid)
+
+        # the task has to be in the todo backlog
+        if location is None or location[0] != TODO:
+            return 1
+
+        # if the member currently has the max number of tasks return error to caller
+        if len(self.members[member_id].get_tasks()) == self.task_member_limit:
+            return 1
+
+        # Remove the task from todo and add it to the specified member
+        self._execute(MoveCommand(uid, (MEMBER, member_id, None)))
+
+        # Return 0 as the operation was successful
+        return 0
+
+    def move_member_to_member(self, member1: int, member2: int,
+                              task_id: int) -> int:
+        """
+        Parameters:
+            member1: The index of the member that is losing a task
+            member2: The index of the member that is getting assigned a task
+            task_id: The index of the task (from member1) that is getting
+                assigned to the member
+
+        Called By:
+            member_to_member - ScrumbanInterface.py
+
+        Calls:
+           move_member_to_member_by_uid
+
+        Modifies:
+            self.members
 
         Return:
             int
 
         Description:
-            - Move task from todo backlog to member. If WIP limit is met,
-                then do not assign task and return 1 for error, else 0
+            - Move a task from a member to another member
         """
 
         # if the member currently has the max number of tasks return error to caller
-        if len(self.members[member_id].get_tasks()) == self.task_member_limit:
+        if len(self.members[member2].get_tasks()) == self.task_member_limit:
             return 1
 
-        if not len(self.todo_backlog) == 0:
-            # task: The task being moved from todo to the member
-            # Remove the correct task and add it to the specified member
-            task = self.todo_backlog.pop(task_id)
-            self.members[member_id].add_task(task)
-
-        # Return 0 as the operation was successful
-        return 0
+        # Move the task at that position using its stable id
+        return self.move_member_to_member_by_uid(self.members[member1].current_tasks[task_id].get_uid(), member2)
 
-    def move_member_to_member(self, member1: int, member2: int,
-                              task_id: int) -> int:
+    def move_member_to_member_by_uid(self, uid: int, member2: int) -> int:
         """
         Parameters:
-            member1: The index of the member that is losing a task
-            member2: The index of the member that is getting assigned a task
-            task_id: The index of the task (from member1) that is getting
-                assigned to the member
+            uid: The stable id of the member task being moved
+            member2: The index of the member that is getting assigned the task
 
         Called By:
-            member_to_member - ScrumbanInterface.py
+            move_member_to_member - ScrumbanBoard.py
 
         Calls:
-           None
+           _execute
 
         Modifies:
             self.members
@@ -351,17 +1555,21 @@ class Board():
             int
 
         Description:
-            - Move a task from a member to another member
+            - Move a task from its member to another member. Return 1 if the task
+                isn't assigned to a member or member2 is at the WIP limit, else 0
         """
+        location = self.locate_task(uid)
+
+        # the task has to be assigned to a member
+        if location is None or location[0] != MEMBER:
+            return 1
 
         # if the member currently has the max number of tasks return error to caller
         if len(self.members[member2].get_tasks()) == self.task_member_limit:
             return 1
 
-        # task: The task being moved from member1 to member2
-        # Remove the task from member1 and add it to member2
-        task = self.members[member1].current_tasks.pop(task_id)
-        self.members[member2].current_tasks.append(task)
+        # Remove the task from its member and add it to member2
+        self._execute(MoveCommand(uid, (MEMBER, member2, None)))
 
         # Return 0 as the operation was successful
         return 0
@@ -377,7 +1585,7 @@ class Board():
             member_to_todo - ScrumbanInterface.py
 
         Calls:
-           None
+           member_to_todo_by_uid
 
         Modifies:
             self.members
@@ -394,10 +1602,39 @@ class Board():
         if len(self.todo_backlog) == self.max_todo_size or self.members[member_id].get_tasks() == []:
             return 1
 
-        # task: The task being moved from member to todo
+        # Move the task at that position using its stable id
+        return self.member_to_todo_by_uid(self.members[member_id].current_tasks[task_id].get_uid())
+
+    def member_to_todo_by_uid(self, uid: int) -> int:
+        """
+        Parameters:
+            uid: The stable id of the member task being moved
+
+        Called By:
+            member_to_todo - ScrumbanBoard.py
+
+        Calls:
+           _execute
+
+        Modifies:
+            self.members
+            self.todo_backlog
+
+        Return:
+            int
+
+        Description:
+            Move a task from its member to the todo backlog. Return 1 if the task
+            isn't assigned to a member or the todo backlog is full, else 0
+        """
+        location = self.locate_task(uid)
+
+        # the task has to be assigned to a member and todo needs room for it
+        if location is None or location[0] != MEMBER or len(self.todo_backlog) == self.max_todo_size:
+            return 1
+
         # Remove the task from member and add it to the todo backlog
-        task = self.members[member_id].remove_task(task_id)
-        self.todo_backlog.append(task)
+        self._execute(MoveCommand(uid, (TODO, None, None)))
 
         # Return 0 as the operation was successful
         return 0
@@ -413,7 +1650,7 @@ class Board():
             member_to_complete - ScrumbanInterface.py
 
         Calls:
-           [Task].set_completed_date()
+           complete_task_by_uid
 
         Modifies:
             self.members
@@ -426,15 +1663,42 @@ class Board():
             Move a task from a member to the completed backlog
         """
 
-        # task: The task being moved from member to completed
-        # Remove the task from member
-        task = self.members[member].remove_task(member_task_id)
+        # Move the task at that position using its stable id
+        self.complete_task_by_uid(self.members[member].current_tasks[member_task_id].get_uid())
+
+    def complete_task_by_uid(self, uid: int) -> int:
+        """
+        Parameters:
+            uid: The stable id of the member task being completed
+
+        Called By:
+            complete_task - ScrumbanBoard.py
+            _member_to_complete - ScrumbanInterface.py
+
+        Calls:
+           _execute
+
+        Modifies:
+            self.members
+            self.completed_backlog
+
+        Return:
+            int
+
+        Description:
+            Move a task from its member to the completed backlog. Return 1 if the
+            task isn't assigned to a member, else 0
+        """
+        location = self.locate_task(uid)
+
+        # the task has to be assigned to a member
+        if location is None or location[0] != MEMBER:
+            return 1
 
-        # Set the date of task completion
-        task.set_completed_date()
+        # Move the task from member to completed, dated today
+        self._execute(MoveCommand(uid, (COMPLETED, None, None), date.today().toordinal()))
 
-        # Add the task to completed
-        self.completed_backlog.append(task)
+        return 0
 
     def completed_to_todo(self, index:int) -> int:
         """
@@ -446,7 +1710,7 @@ class Board():
             completed_to_todo - ScrumbanInterface.py
 
         Calls:
-           None
+           completed_to_todo_by_uid
 
         Modifies:
             self.todo_backlog
@@ -461,10 +1725,422 @@ class Board():
         if len(self.todo_backlog) == self.max_todo_size:
             return 1
 
-        task = self.completed_backlog.pop(index)
-        self.todo_backlog.append(task)
+        # Move the task at that position using its stable id
+        return self.completed_to_todo_by_uid(self.completed_backlog.get_uid(index))
+
+    def completed_to_todo_by_uid(self, uid: int) -> int:
+        """
+        Parameters:
+            uid: The stable id of the completed task being moved
+
+        Called By:
+            completed_to_todo - ScrumbanBoard.py
+
+        Calls:
+           _execute
+
+        Modifies:
+            self.todo_backlog
+            self.completed_backlog
+
+        Return:
+            int
+
+        Description:
+            Move a task from the completed backlog to the todo backlog. Return 1
+            if the task isn't completed or the todo backlog is full, else 0
+        """
+        location = self.locate_task(uid)
+
+        # the task has to be completed and todo needs room for it
+        if location is None or location[0] != COMPLETED or len(self.todo_backlog) == self.max_todo_size:
+            return 1
+
+        # Move the task from completed to the todo backlog
+        self._execute(MoveCommand(uid, (TODO, None, None)))
         return 0
 
+    def apply_batch(self, ops: list):
+        """
+        Parameters:
+            ops: A list of (move, uid) or (move, uid, member) tuples, move is a
+                key of BATCH_MOVES and member is the member index for
+                assign_task and move_member_to_member
+
+        Called By:
+            auto_assign - ScrumbanBoard.py
+            _apply_batch - ScrumbanInterface.py
+
+        Calls:
+           [MoveCommand].apply()
+           [CommandLog].record()
+
+        Modifies:
+            self.todo_backlog
+            self.members
+            self.completed_backlog
+            self.command_log
+
+        Return:
+            dict or None
+
+        Description:
+            Make every move in ops or none of them. The moves are first checked
+            in order against where each task will be and how full todo and each
+            member will be at that point, using counts only. If any move is
+            invalid nothing changes and None is returned. Otherwise the moves
+            are made and undone as one, and a change set is returned:
+            {"todo": bool, "members": set of member indexes, "completed": bool}
+        """
+        # where each task named in ops will be, as (container, member)
+        simulated = {}
+
+        # how many tasks todo and each touched member will hold
+        todo_count = len(self.todo_backlog)
+        member_counts = {}
+
+        changes = {"todo": False, "members": set(), "completed": False}
+
+        # op: each move in the order it will be made
+        for op in ops:
+            move, uid = op[0], op[1]
+            if move not in BATCH_MOVES:
+                return None
+            source, target = BATCH_MOVES[move]
+
+            # the task's current container, taking earlier moves into account
+            if uid not in simulated:
+                location = self.locate_task(uid)
+                if location is None:
+                    return None
+                simulated[uid] = (location[0], location[1])
+            container, member = simulated[uid]
+
+            if container != source:
+                return None
+
+            # the task leaves its container
+            if container == TODO:
+                todo_count -= 1
+                changes["todo"] = True
+            elif container == MEMBER:
+                member_counts[member] = member_counts.get(member, len(self.members[member].get_tasks())) - 1
+                changes["members"].add(member)
+            else:
+                changes["completed"] = True
+
+            # the task enters its new container if there is room
+            if target == MEMBER:
+                new_member = op[2]
+                if not 0 <= new_member < len(self.members):
+                    return None
+                count = member_counts.get(new_member, len(self.members[new_member].get_tasks()))
+                if count >= self.task_member_limit:
+                    return None
+                member_counts[new_member] = count + 1
+                changes["members"].add(new_member)
+                simulated[uid] = (MEMBER, new_member)
+            elif target == TODO:
+                if todo_count >= self.max_todo_size:
+                    return None
+                todo_count += 1
+                changes["todo"] = True
+                simulated[uid] = (TODO, None)
+            else:
+                changes["completed"] = True
+                simulated[uid] = (COMPLETED, None)
+
+        # every move is valid, make them and undo them together
+        moves = []
+        today = date.today().toordinal()
+        for op in ops:
+            target = BATCH_MOVES[op[0]][1]
+            if target == MEMBER:
+                move = MoveCommand(op[1], (MEMBER, op[2], None))
+            elif target == TODO:
+                move = MoveCommand(op[1], (TODO, None, None))
+            else:
+                move = MoveCommand(op[1], (COMPLETED, None, None), today)
+            move.apply(self)
+            moves.append(move)
+
+        if moves:
+            self.command_log.record(CompoundCommand(moves))
+
+        return changes
+
+    def auto_assign(self) -> dict:
+        """
+        Parameters:
+            None
+
+        Called By:
+            _auto_assign_clicked - ScrumbanInterface.py
+
+        Calls:
+           apply_batch
+           heapq.heapify(), heapq.heappop(), heapq.heappush()
+
+        Modifies:
+            self.todo_backlog
+            self.members
+            self.command_log
+
+        Return:
+            dict
+
+        Description:
+            Assign the todo backlog, highest priority first, to the member
+            with the fewest tasks at that point, ties going to the earlier
+            member. Members at task_member_limit are left out of the heap, so
+            assigning stops once every member is full. Building the heap is
+            O(m) and each task costs one pop and one push, O(log m). The
+            assignments are made as one batch, so one undo reverts them, and
+            the change set of the batch is returned.
+        """
+        # loads: (number of tasks, member index) of every member with room
+        loads = [(len(member.get_tasks()), index) for index, member in enumerate(self.members)
+                 if len(member.get_tasks()) < self.task_member_limit]
+        heapify(loads)
+
+        # the todo tasks in priority order, equal priorities keep their todo order
+        tasks = sorted(self.todo_backlog, key=lambda task: task.get_priority_value())
+
+        ops = []
+        # task: each todo task, highest priority first
+        for task in tasks:
+            # every member is at the limit
+            if not loads:
+                break
+
+            load, index = heappop(loads)
+            ops.append(("assign_task", task.get_uid(), index))
+
+            # the member goes back in the heap while it still has room
+            if load + 1 < self.task_member_limit:
+                heappush(loads, (load + 1, index))
+
+        return self.apply_batch(ops)
+
+    def apply_backlog_changes(self, inserted: list, removed: list, changed: list) -> int:
+        """
+        Parameters:
+            inserted: The name, priority and due date of each task added to the file
+            removed: The name of each task taken out of the file
+            changed: The name, new priority and new due date of each task whose
+                line in the file changed
+
+        Called By:
+            _poll - ScrumbanWatcher.py
+
+        Calls:
+           _take, _place, _register_task, _touch
+           [DueDateIndex].add(), [DueDateIndex].discard()
+           [CommandLog].clear()
+
+        Modifies:
+            self.project_backlog
+            self.locations
+            self.due_dates
+            self.command_log
+            self.generations
+
+        Return:
+            int
+
+        Description:
+            Apply the edits made to the project backlog file while the meeting
+            runs, leaving the rest of the board as it is. Tasks are matched by
+            name, and only the ones still in the project backlog are removed
+            or changed; a task that already left it stays where it is. A
+            changed task keeps its id, its place among equal priorities and
+            the day it was queued. The undo history is cleared when a task is
+            removed, as its moves could no longer be undone.
+        """
+        # uids: the id of each project backlog task by name, the files identify tasks by name
+        uids = {task.get_name(): task.get_uid() for task in self.project_backlog.tasks()}
+        applied = 0
+        taken = 0
+
+        # name: each task taken out of the file
+        for name in removed:
+            uid = uids.pop(name, None)
+            if uid is None:
+                continue
+            task, _ = self._take(uid)
+            self.due_dates.discard(task)
+            taken += 1
+
+        # row: each task whose priority or due date changed
+        for row in changed:
+            uid = uids.get(row[0])
+            if uid is None:
+                continue
+            old_task, (_, _, place) = self._take(uid)
+            self.due_dates.discard(old_task)
+            # the new task takes the old one's id, sequence number and queued day
+            task = Task(row[0], row[1], row[2], "")
+            task.set_uid(uid)
+            self._place(task, PROJECT, None, place)
+            self.due_dates.add(task)
+            applied += 1
+
+        # row: each task added to the file that isn't queued already
+        for row in inserted:
+            if row[0] in uids:
+                continue
+            task = self._register_task(Task(row[0], row[1], row[2], ""), PROJECT)
+            uids[row[0]] = task.get_uid()
+            self._place(task, PROJECT)
+            self.due_dates.add(task)
+            applied += 1
+
+        if taken:
+            self.command_log.clear()
+        applied += taken
+        if applied:
+            self._touch(PROJECT)
+        return applied
+
+    def set_aging_policy(self, policy) -> None:
+        """
+        Parameters:
+            policy: An AgingPolicy, or None to order the project backlog by
+                priority alone
+
+        Called By:
+            startup - VSS.py
+
+        Calls:
+           [TaskQueue].set_policy()
+
+        Modifies:
+            self.project_backlog
+
+        Return:
+            None
+
+        Description:
+            Age the project backlog with policy. Every task is reordered once
+            here, after that only tasks that cross an aging boundary move.
+        """
+        self.project_backlog.set_policy(policy)
+
+    def get_queued_days(self) -> dict:
+        """
+        Parameters:
+            None
+
+        Called By:
+            shutdown, send_reports - VSS.py
+
+        Calls:
+           [TaskQueue].get_queued_day()
+
+        Modifies:
+            None
+
+        Return:
+            dict[str, int]
+
+        Description:
+            Return the day ordinal each project backlog task was first queued,
+            keyed by task name as that is how the files identify a task
+        """
+        return {task.get_name(): self.project_backlog.get_queued_day(task.get_uid())
+                for task in self.project_backlog.tasks()}
+
+    def get_overdue_tasks(self, today: int = None) -> list:
+        """
+        Parameters:
+            today: The day ordinal to check against, defaults to the current day
+
+        Called By:
+            _at_risk_button_clicked - ScrumbanInterface.py
+            send_reports - VSS.py
+
+        Calls:
+           [DueDateIndex].overdue()
+           get_task
+
+        Modifies:
+            None
+
+        Return:
+            list[Task]
+
+        Description:
+            Return the open tasks that are past their due date, most overdue
+            first, in O(log n + k)
+        """
+        if today is None:
+            today = date.today().toordinal()
+        return [self.get_task(uid) for uid in self.due_dates.overdue(today)]
+
+    def get_upcoming_tasks(self, days: int, today: int = None) -> list:
+        """
+        Parameters:
+            days: How many days after today to include
+            today: The day ordinal to start from, defaults to the current day
+
+        Called By:
+            _at_risk_button_clicked - ScrumbanInterface.py
+            send_reports - VSS.py
+
+        Calls:
+           [DueDateIndex].due_within()
+           get_task
+
+        Modifies:
+            None
+
+        Return:
+            list[Task]
+
+        Description:
+            Return the open tasks due from today through the next days days,
+            soonest first, in O(log n + k)
+        """
+        if today is None:
+            today = date.today().toordinal()
+        return [self.get_task(uid) for uid in self.due_dates.due_within(today, days)]
+
+    def get_string_at_risk(self, days: int) -> list:
+        """
+        Parameters:
+            days: How many days after today count as due soon
+
+        Called By:
+            _at_risk_button_clicked - ScrumbanInterface.py
+            send_reports - VSS.py
+
+        Calls:
+           get_overdue_tasks, get_upcoming_tasks
+
+        Modifies:
+            None
+
+        Return:
+            list[str]
+
+        Description:
+            Return the overdue tasks followed by the tasks due soon, one
+            display string per task
+        """
+        # at_risk: Holds the string representation of each at risk task
+        at_risk = []
+
+        # task: Each overdue task, most overdue first
+        for task in self.get_overdue_tasks():
+            at_risk.append(f"OVERDUE  |  {task.get_name()}  |  Due: {task.get_due()}")
+
+        # task: Each task due soon, soonest first
+        for task in self.get_upcoming_tasks(days):
+            at_risk.append(f"DUE SOON  |  {task.get_name()}  |  Due: {task.get_due()}")
+
+        # return the list of strings
+        return at_risk
+
     def set_agenda(self, agenda: list) -> None:
         """
         Parameters:
@@ -486,6 +2162,7 @@ class Board():
             Sets the agenda attribute with agenda
         """
         self.agenda = agenda
+        self._record({"op": "agenda", "items": agenda})
 
     def get_agenda(self) -> list:
         """
@@ -545,10 +2222,11 @@ class Board():
             None
 
         Return:
-            list[Task]
+            TaskQueue
 
         Description:
-            Returns the project backlog
+            Returns the project backlog, iterating it yields the tasks
+            in priority order
         """
         return self.project_backlog
 
@@ -567,7 +2245,7 @@ class Board():
             None
 
         Return:
-            list[Task]
+            CompletedStore
 
         Description:
             Returns the completed backlog
@@ -618,39 +2296,29 @@ class Board():
         """
         return self.members
 
-    def get_string_project_backlog(self) -> list: #UNUSED
+    def get_string_project_backlog(self) -> BacklogRows:
         """
         Parameters:
             None
 
         Called By:
-            shutdown - VSS.py
+            _set_changed_parts - VSS.py
 
         Calls:
-           [Task].listify()
+           [TaskQueue].rows()
 
         Modifies:
             None
 
         Return:
-            list[str]
+            BacklogRows
 
         Description:
-            Return project backlog as a list of strings
+            Return project backlog as rows of strings. The backlog is copied
+            here, it is only sorted and formatted when the rows are iterated,
+            which an autosave does on its background thread.
         """
-
-        # project_backlog_list: A list to hold the list of
-        # strings that will be returned from the function
-        project_backlog_list = []
-
-        # task: Each task object in the project backlog
-        # Turn each task from an object into a list of strings
-        # that contain the attributes of the Task class
-        for task in self.project_backlog:
-            project_backlog_list.append(task.listify())
-
-        # return the list of list of strings
-        return project_backlog_list
+        return self.project_backlog.rows()
 
     def get_string_members(self) -> list:
         """
@@ -724,7 +2392,33 @@ class Board():
             shutdown - VSS.py
 
         Calls:
-           [Task].listify()
+           [CompletedStore].get_rows()
+
+        Modifies:
+            None
+
+        Return:
+            CompletedRows
+
+        Description:
+            Return completed backlog as lists of strings
+        """
+
+        # read the rows straight from the columns without rebuilding the tasks,
+        # the rows still paged from the file aren't read at all
+        return self.completed_backlog.get_rows()
+
+    def get_string_completed_counts(self) -> list:
+        """
+        Parameters:
+            None
+
+        Called By:
+            send_reports - VSS.py
+
+        Calls:
+           [CompletedStore].counts_per_day()
+           [CompletedStore].counts_per_priority()
 
         Modifies:
             None
@@ -733,19 +2427,22 @@ class Board():
             list[str]
 
         Description:
-            Return completed backlog as a list of strings
+            Return how many tasks were completed on each day, then how many of
+            each priority were completed, one display string per count
         """
+        # counts: Holds the string representation of each count
+        counts = []
 
-        # todo_list: Holds the strings representation of the completed backlog
-        completed_backlog = []
+        # day, count: Each completion day and the tasks completed on it, oldest first
+        for day, count in self.completed_backlog.counts_per_day().items():
+            counts.append(f"COMPLETED ON {day or 'NO DATE'}  |  {count}")
 
-        # task: Each task object in self.completed_backlog
-        # Add the string representation of a task to the completed_backlog
-        for task in self.completed_backlog:
-            completed_backlog.append(task.listify())
+        # priority, count: Each priority and the tasks of it completed
+        for priority, count in self.completed_backlog.counts_per_priority().items():
+            counts.append(f"PRIORITY {priority}  |  {count}")
 
-        # return the list of list of strings
-        return completed_backlog
+        # return the list of strings
+        return counts
 
     def set_notes(self, notes: str) -> None:
         """
@@ -756,18 +2453,24 @@ class Board():
             save_text - ScrumbanInterface.py
 
         Calls:
-           None
+           _record, _touch
 
         Modifies:
             self.notes
+            self.generations
 
         Return:
             None
 
         Description:
-            Updates the notes
+            Updates the notes. Only a change is recorded since the interface
+            calls this constantly.
         """
+        if self.notes == notes:
+            return
         self.notes = notes
+        self._touch(NOTES)
+        self._record({"op": "notes", "text": notes})
 
     def get_max_todo_size(self) -> int:
         """
@@ -813,31 +2516,3 @@ class Board():
         """
         return self.task_member_limit
 
-
-def task_bubble_sort(lst: list) -> None:
-    """
-    Parameters:
-        lst: The project backlog
-
-    Called By:
-        Board.__init__()
-
-    Calls:
-        None
-
-    Modifies:
-        lst
-
-    Return:
-        None
-
-    Description:
-        A helper function to sort the backlog by priority
-    """
-
-    for i in range(len(lst) - 1):
-        for j in range(len(lst) - i - 1):
-            if int(lst[j].get_priority()) > int(lst[j+1].get_priority()):
-                temp = lst[j]
-                lst[j] = lst[j + 1]
-                lst[j+1] = temp
@@ -0,0 +1,299 @@
+"""
+File: ScrumbanCommands.py
+
+Description: This module is responsible for making the changes to the Virtual
+             Scrumban System board reversible.
+
+             It completes several tasks:
+
+             1. Records each move of a task as a command that knows its inverse
+             2. Groups the moves of one action so they are undone together
+             3. Keeps a bounded history of commands to undo and redo
+
+Dependencies: collections
+
+Date Created: 10/17/2026
+"""
+
+# used for the bounded undo history
+from collections import deque
+
+
+class MoveCommand():
+    """
+    Reversible move of one task from wherever it is to a new location.
+
+    The command only knows where the task is going when it is created. The
+    first apply records the exact location the task came from and the exact
+    location it landed in, so the inverse puts it back in the same position
+    without copying any part of the board.
+
+    Used By:
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type              : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.uid            : int               : -            -> the stable id of the task being moved
+
+        self.target         : tuple             : -            -> (container, member index, position) the task moves to,
+                                                                  the position is None until the first apply
+
+        self.done           : int or None       : None         -> the completed date given to the task by the move, None
+                                                                  if the move leaves it unchanged
+
+        self.source         : tuple             : None         -> (container, member index, position) the task came from
+
+        self.previous_done  : int or str        : None         -> the completed date the task had before the move
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    apply(self, board: Board)                                   |   -> None
+                                                                                    |
+        Usage:          instance.apply(board)                                       |
+                                                                                    |
+        Description:    Move the task to its target                                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    revert(self, board: Board)                                  |   -> None
+                                                                                    |
+        Usage:          instance.revert(board)                                      |
+                                                                                    |
+        Description:    Move the task back to where it came from                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    __slots__ = ("uid", "target", "done", "source", "previous_done")
+
+    def __init__(self, uid: int, target: tuple, done=None):
+        # the task being moved and where it is going
+        self.uid = uid
+        self.target = target
+        self.done = done
+
+        # filled in by the first apply
+        self.source = None
+        self.previous_done = None
+
+    def apply(self, board) -> None:
+        """
+        Parameter:
+            board:      the Board the task is on
+
+        Called By:      _execute(), backlog_to_todo() - ScrumbanBoard.py
+                        redo() - ScrumbanCommands.py
+
+        Calls:          _relocate() - ScrumbanBoard.py
+
+        Modifies:       self.source
+                        self.target
+                        self.previous_done
+
+        Return:         None
+
+        Description:    move the task to its target and remember the exact
+                        locations on both ends of the move
+        """
+        self.source, self.target, self.previous_done = board._relocate(self.uid, self.target, self.done)
+
+    def revert(self, board) -> None:
+        """
+        Parameter:
+            board:      the Board the task is on
+
+        Called By:      undo() - ScrumbanCommands.py
+
+        Calls:          _relocate() - ScrumbanBoard.py
+
+        Modifies:       N/A
+
+        Return:         None
+
+        Description:    move the task back to the position it came from and
+                        restore its completed date
+        """
+        board._relocate(self.uid, self.source, self.previous_done)
+
+
+class CompoundCommand():
+    """
+    Reversible group of commands that make up one action, such as refreshing
+    the todo backlog.
+
+    Used By:
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type              : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.commands       : list[MoveCommand] : -            -> the commands in the order they were applied
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    apply(self, board: Board)                                   |   -> None
+                                                                                    |
+        Usage:          instance.apply(board)                                       |
+                                                                                    |
+        Description:    Apply every command in order                                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    revert(self, board: Board)                                  |   -> None
+                                                                                    |
+        Usage:          instance.revert(board)                                      |
+                                                                                    |
+        Description:    Revert every command in reverse order                       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    __slots__ = ("commands",)
+
+    def __init__(self, commands: list):
+        self.commands = commands
+
+    def apply(self, board) -> None:
+        # command: each command in the order it was first applied
+        for command in self.commands:
+            command.apply(board)
+
+    def revert(self, board) -> None:
+        # command: each command, last applied first
+        for command in reversed(self.commands):
+            command.revert(board)
+
+
+class CommandLog():
+    """
+    Bounded history of the commands applied to a board.
+
+    Undoing reverts the newest command and keeps it for redo. Recording a new
+    command drops anything that could have been redone. Once the history is
+    full the oldest command is forgotten.
+
+    Used By:
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type              : Default Val       -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self._undo          : deque             : deque(maxlen=100) -> the commands that can be undone, newest last
+
+        self._redo          : list              : []                -> the commands that can be redone, newest undo last
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    record(self, command)                                       |   -> None
+                                                                                    |
+        Usage:          instance.record(MoveCommand)                                |
+                                                                                    |
+        Description:    Add a command that has already been applied                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    undo(self, board: Board)                                    |   -> int
+                                                                                    |
+        Usage:          instance.undo(board)                                        |
+                                                                                    |
+        Description:    Revert the newest command, return 1 if there is none        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    redo(self, board: Board)                                    |   -> int
+                                                                                    |
+        Usage:          instance.redo(board)                                        |
+                                                                                    |
+        Description:    Apply the newest undone command, return 1 if there is none  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    clear(self)                                                 |   -> None
+                                                                                    |
+        Usage:          instance.clear()                                            |
+                                                                                    |
+        Description:    Forget every command                                        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, limit: int = 100):
+        # the oldest command falls off once limit commands are kept
+        self._undo = deque(maxlen=limit)
+
+        # commands that were undone and can be applied again
+        self._redo = []
+
+    def can_undo(self) -> bool:
+        return len(self._undo) > 0
+
+    def can_redo(self) -> bool:
+        return len(self._redo) > 0
+
+    def record(self, command) -> None:
+        """
+        Parameter:
+            command:    a command that has just been applied
+
+        Called By:      _execute(), backlog_to_todo() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       self._undo
+                        self._redo
+
+        Return:         None
+
+        Description:    add the command to the undo history, a new change means
+                        the undone commands can no longer be redone
+        """
+        self._undo.append(command)
+        self._redo.clear()
+
+    def undo(self, board) -> int:
+        """
+        Parameter:
+            board:      the Board the commands were applied to
+
+        Called By:      undo() - ScrumbanBoard.py
+
+        Calls:          [command].revert()
+
+        Modifies:       self._undo
+                        self._redo
+
+        Return:         int
+
+        Description:    revert the newest command and keep it for redo, return 1
+                        if there is nothing to undo, else 0
+        """
+        if not self._undo:
+            return 1
+
+        command = self._undo.pop()
+        command.revert(board)
+        self._redo.append(command)
+        return 0
+
+    def redo(self, board) -> int:
+        """
+        Parameter:
+            board:      the Board the commands were applied to
+
+        Called By:      redo() - ScrumbanBoard.py
+
+        Calls:          [command].apply()
+
+        Modifies:       self._undo
+                        self._redo
+
+        Return:         int
+
+        Description:    apply the newest undone command again, return 1 if there
+                        is nothing to redo, else 0
+        """
+        if not self._redo:
+            return 1
+
+        command = self._redo.pop()
+        command.apply(board)
+        self._undo.append(command)
+        return 0
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
@@ -0,0 +1,999 @@
+"""
+File: ScrumbanCompleted.py
+
+Description: This module is responsible for holding the completed tasks of the
+             Virtual Scrumban System in a compact, column oriented form.
+
+             It completes several tasks:
+
+             1. Stores each completed task as one row across typed columns
+             2. Rebuilds Task objects only when a row is read
+             3. Counts completed tasks per day and per priority
+             4. Reads the completed tasks file through a memory map and a
+                sidecar index of where each row starts, so only the rows that
+                are shown or changed are ever read into memory
+
+Dependencies: array, mmap
+
+Date Created: 10/17/2026
+"""
+
+# used for the typed, compact columns
+from array import array
+# used to count column values in C rather than in a python loop
+from collections import Counter
+# used to chain the paged and in memory stable ids
+from itertools import chain
+# used to read the completed tasks file and its index without loading them
+from mmap import mmap, ACCESS_READ
+# used to check and replace the index file
+from os import getpid, makedirs, path, replace, stat
+
+from ScrumbanMember import Task, format_date, parse_date
+from ScrumbanSchema import header_prefix, is_header
+
+# where the index of the rows of the completed tasks file is kept
+completed_index_path: str = ".sys_data/completed_tasks.idx"
+
+# raised when the layout of the index changes so old indexes are rebuilt
+index_version: int = 1
+
+# the priorities the priority column can hold
+priority_range: range = range(-2 ** 63, 2 ** 63)
+
+# the index starts with version, file size, file mtime in nanoseconds and row count
+index_header_size: int = 4 * 8
+
+
+def build_completed_index(file_path: str, index_path: str = completed_index_path, appended_from: int = None) -> None:
+    """
+    Parameter:
+        file_path:      the completed tasks file
+        index_path:     the index of its rows
+        appended_from:  the size the file had before text was appended to it,
+                        None to index the whole file again
+
+    Called By:      CompletedFile._open() - ScrumbanCompleted.py
+                    save_scrumban() - ScrumbanHistory.py
+
+    Calls:          mmap.find()
+
+    Modifies:       the index file
+
+    Return:         None
+
+    Description:    record the byte each row of the file starts at, after the
+                    version header, the title and the headers. When the index already covers the
+                    file as it was before an append only the appended text is
+                    scanned and its rows are added to the end of the index,
+                    otherwise the index is built again and moved into place.
+    """
+    status = stat(file_path)
+
+    # header: version, size, mtime, rows of the index as it is
+    header = array('q')
+    if appended_from is not None and path.exists(index_path):
+        with open(index_path, "rb") as index_file:
+            header.frombytes(index_file.read(index_header_size))
+    # the index can only be extended if it covers the file up to the append
+    extend = len(header) == 4 and header[0] == index_version and header[1] == appended_from
+
+    # offsets: where each new row starts
+    offsets = array('q')
+    if status.st_size > 0:
+        with open(file_path, "rb") as completed_file, mmap(completed_file.fileno(), 0, access=ACCESS_READ) as data:
+            # start after the rows already indexed, or after the version header,
+            # the title and the headers, a file from before versions has no version header
+            position = appended_from if extend else _skip_lines(data, 3 if is_header(data[:len(header_prefix)]) else 2)
+            # each row starts after the newline of the one before it
+            while 0 < position < status.st_size:
+                offsets.append(position)
+                position = data.find(b"\n", position) + 1
+
+    makedirs(path.dirname(index_path) or ".", exist_ok=True)
+    if extend:
+        rows = header[3] + len(offsets)
+        with open(index_path, "r+b") as index_file:
+            # drop anything past the rows the header counted before adding the new ones
+            index_file.truncate(index_header_size + header[3] * 8)
+            index_file.seek(0, 2)
+            index_file.write(offsets.tobytes())
+            # the header goes last, a crash before it leaves an index that is rebuilt
+            index_file.seek(0)
+            index_file.write(array('q', [index_version, status.st_size, status.st_mtime_ns, rows]).tobytes())
+    else:
+        # each copy of the system builds its own, read only copies can build it at the same time
+        temp_path = f"{index_path}.{getpid()}.tmp"
+        with open(temp_path, "wb") as index_file:
+            index_file.write(array('q', [index_version, status.st_size, status.st_mtime_ns, len(offsets)]).tobytes())
+            index_file.write(offsets.tobytes())
+        replace(temp_path, index_path)
+
+
+def _skip_lines(data: mmap, count: int) -> int:
+    """
+    Parameter:
+        data:       a mapped file
+        count:      the number of lines to skip
+
+    Called By:      build_completed_index() - ScrumbanCompleted.py
+
+    Calls:          mmap.find()
+
+    Modifies:       N/A
+
+    Return:         int
+
+    Description:    return the byte after the first count lines, 0 if the
+                    file has fewer lines than that
+    """
+    position = 0
+    for _ in range(count):
+        position = data.find(b"\n", position) + 1
+        if position == 0:
+            return 0
+    return position
+
+
+class CompletedFile():
+    """
+    Read only view of the rows of the completed tasks file.
+
+    The file and its index are memory mapped, so a row is only read from disk
+    when it is asked for and the rows never have to fit in memory. The index
+    holds the byte each row starts at and is keyed by the size and mtime of
+    the file, so it is rebuilt if the file changed outside the system.
+
+    Used By:
+        ScrumbanHistory.py
+        ScrumbanCompleted.py
+
+    Members:
+        Member Name:        : Type              : Default Val           -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.file_path      : str               : file_path             -> the path of the completed tasks file
+
+        self.index_path     : str               : completed_index_path  -> the path of the index of its rows
+
+        self._size          : int               : 0                     -> the size of the file when it was mapped
+
+        self._rows          : int               : 0                     -> the number of rows in the file when it was mapped
+
+        self._data          : mmap              : None                  -> the mapped file, None if it is empty
+
+        self._index         : mmap              : None                  -> the mapped index, None if there are no rows
+
+        self._offsets       : memoryview        : None                  -> the start of each row, read from the mapped index
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    row(self, index: int)                                       |   -> list[str]
+                                                                                    |
+        Usage:          instance.row(3)                                             |
+                                                                                    |
+        Description:    Return the fields of a row, stripped of whitespace          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    iter_rows(self, start: int, stop: int)                      |   -> iterator of list[str]
+                                                                                    |
+        Usage:          instance.iter_rows(0, 50)                                   |
+                                                                                    |
+        Description:    Iterate the fields of the rows from start to stop           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, file_path: str, index_path: str = completed_index_path):
+        # where the file and its index live
+        self.file_path = file_path
+        self.index_path = index_path
+
+        # filled in by _open
+        self._size = 0
+        self._rows = 0
+        self._data = None
+        self._index = None
+        self._offsets = None
+
+        self._open()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getstate__(self) -> dict:
+        # the maps can't be pickled, they are opened again from the paths
+        return {"file_path": self.file_path, "index_path": self.index_path, "rows": self._rows}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["file_path"], state["index_path"])
+        # rows are only ever appended, so the rows that were paged must still be there
+        if self._rows < state["rows"]:
+            raise ValueError(f"{self.file_path} has fewer rows than when it was paged")
+
+    def _open(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      __init__(), __setstate__() - ScrumbanCompleted.py
+
+        Calls:          build_completed_index()
+
+        Modifies:       every member
+
+        Return:         None
+
+        Description:    map the file and its index, building the index first if
+                        it doesn't match the file
+        """
+        status = stat(self.file_path)
+        self._size = status.st_size
+        if self._size == 0:
+            return
+
+        # header: version, size, mtime, rows the index was built for
+        header = array('q')
+        if path.exists(self.index_path):
+            with open(self.index_path, "rb") as index_file:
+                header.frombytes(index_file.read(index_header_size))
+        if list(header[:3]) != [index_version, self._size, status.st_mtime_ns]:
+            build_completed_index(self.file_path, self.index_path)
+
+        with open(self.file_path, "rb") as completed_file:
+            self._data = mmap(completed_file.fileno(), 0, access=ACCESS_READ)
+        with open(self.index_path, "rb") as index_file:
+            self._index = mmap(index_file.fileno(), 0, access=ACCESS_READ)
+        self._rows = array('q', self._index[:index_header_size])[3]
+        self._offsets = memoryview(self._index)[index_header_size:index_header_size + self._rows * 8].cast('q')
+
+    def row(self, index: int) -> list:
+        """
+        Parameter:
+            index:      a row of the file, after the title and the headers
+
+        Called By:      iter_rows() - ScrumbanCompleted.py
+                        _build_task() - ScrumbanCompleted.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         list[str]
+
+        Description:    return the comma separated fields of the row with the
+                        whitespace stripped, as the file was read before
+        """
+        if not 0 <= index < self._rows:
+            raise IndexError(index)
+        end = self._offsets[index + 1] if index + 1 < self._rows else self._size
+        line = self._data[self._offsets[index]:end].decode()
+        return [field.strip() for field in line.strip().split(",")]
+
+    def iter_rows(self, start: int = 0, stop: int = None):
+        """
+        Parameter:
+            start:      the first row
+            stop:       the row to stop before, None for the last row
+
+        Called By:      CompletedRows, CompletedStore - ScrumbanCompleted.py
+
+        Calls:          row()
+
+        Modifies:       N/A
+
+        Return:         iterator[list[str]]
+
+        Description:    iterate the fields of the rows from start to stop
+        """
+        stop = self._rows if stop is None else min(stop, self._rows)
+        for index in range(start, stop):
+            yield self.row(index)
+
+
+class CompletedRows():
+    """
+    The string rows of the completed tasks as they are passed between the
+    board and the history: the first rows of a CompletedFile followed by rows
+    held in a list.
+
+    The rows from the file are read only when they are iterated, so passing
+    the completed tasks around or appending new ones to the file never reads
+    the old ones.
+
+    Used By:
+        ScrumbanHistory.py
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type              : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.file           : CompletedFile     : None         -> the file the first rows are read from, None if there are none
+
+        self.paged          : int               : 0            -> how many rows are read from the file
+
+        self.rows           : list[list[str]]   : []           -> the rows after them
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    starts_with(self, other: CompletedRows)                     |   -> bool
+                                                                                    |
+        Usage:          instance.starts_with(written)                               |
+                                                                                    |
+        Description:    Return True if the rows of other are the first rows         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    rows_after(self, count: int)                                |   -> iterator of list[str]
+                                                                                    |
+        Usage:          instance.rows_after(len(written))                           |
+                                                                                    |
+        Description:    Iterate the rows after the first count                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, completed_file: CompletedFile = None, paged: int = 0, rows: list = None):
+        self.file = completed_file
+        self.paged = paged if completed_file is not None else 0
+        self.rows = rows if rows is not None else []
+
+    def __len__(self) -> int:
+        return self.paged + len(self.rows)
+
+    def __iter__(self):
+        return self.rows_after(0)
+
+    def __getitem__(self, index: int) -> list:
+        if index < 0:
+            index += len(self)
+        if 0 <= index < self.paged:
+            return self.file.row(index)
+        return self.rows[index - self.paged]
+
+    def starts_with(self, other) -> bool:
+        """
+        Parameter:
+            other:      the rows that are in the file
+
+        Called By:      _save_completed_tasks() - ScrumbanHistory.py
+
+        Calls:          rows_after()
+
+        Modifies:       N/A
+
+        Return:         bool
+
+        Description:    return True if other is the start of these rows. The
+                        rows both page from the same file are the same rows, so
+                        only the rows after them are compared.
+        """
+        if len(other) > len(self):
+            return False
+        # shared: the first rows both read from the same file
+        shared = min(self.paged, other.paged) if other.file is self.file else 0
+        return all(mine == theirs for mine, theirs in zip(self.rows_after(shared), other.rows_after(shared)))
+
+    def rows_after(self, count: int):
+        """
+        Parameter:
+            count:      the number of rows to skip
+
+        Called By:      __iter__() - ScrumbanCompleted.py
+                        _save_completed_tasks() - ScrumbanHistory.py
+
+        Calls:          CompletedFile.iter_rows()
+
+        Modifies:       N/A
+
+        Return:         iterator[list[str]]
+
+        Description:    iterate the rows after the first count
+        """
+        if count < self.paged:
+            yield from self.file.iter_rows(count, self.paged)
+        yield from self.rows[max(count - self.paged, 0):]
+
+
+class CompletedStore():
+    """
+    Column store of the completed tasks used for the completed backlog.
+
+    Each completed task is one row. Priorities and dates are kept in typed
+    arrays, and names are dictionary encoded so a name that is repeated is only
+    stored once. Dates that are not real calendar days are dictionary encoded as
+    negative codes.
+
+    The first rows can be left paged in a CompletedFile instead. Their stable
+    ids are a block starting at the first paged id, so they need no columns
+    and are only read when they are shown. Taking out or putting back a row
+    among them reads them all into the columns first.
+
+    Used By:
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type              : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self._uids          : array[int]        : array('q')   -> the stable id of the task in each row
+
+        self._names         : array[int]        : array('l')   -> the code of the task name in each row
+
+        self._priorities    : array[int]        : array('q')   -> the priority of the task in each row
+
+        self._due           : array[int]        : array('l')   -> the due date day ordinal in each row, 0 if none
+
+        self._done          : array[int]        : array('l')   -> the completed date day ordinal in each row
+
+        self._name_values   : list[str]         : []           -> the distinct task names, indexed by name code
+
+        self._name_codes    : dict[str, int]    : {}           -> maps each distinct task name to its code
+
+        self._date_values   : list[str]         : []           -> the distinct unparsed date texts, code -(i + 1) is entry i
+
+        self._date_codes    : dict[str, int]    : {}           -> maps each unparsed date text to its negative code
+
+        self._file          : CompletedFile     : None         -> the file the first rows are paged from, None if none are
+
+        self._paged         : int               : 0            -> how many of the first rows are paged from the file
+
+        self._first_uid     : int               : 0            -> the stable id of the first paged row
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    attach(self, completed_file, paged: int, first_uid: int)    |   -> None
+                                                                                    |
+        Usage:          instance.attach(completed_file, 1000, 0)                    |
+                                                                                    |
+        Description:    Page the first rows of an empty store from a file           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_paged_rows(self)                                        |   -> int
+                                                                                    |
+        Usage:          instance.get_paged_rows()                                   |
+                                                                                    |
+        Description:    Return how many of the first rows are paged from the file   |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    page_in(self)                                               |   -> None
+                                                                                    |
+        Usage:          instance.page_in()                                          |
+                                                                                    |
+        Description:    Read the paged rows into the columns                        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    locate(self, uid: int)                                      |   -> int or None
+                                                                                    |
+        Usage:          instance.locate(12)                                         |
+                                                                                    |
+        Description:    Return the row of a paged stable id, None if not paged      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_rows(self)                                              |   -> CompletedRows
+                                                                                    |
+        Usage:          instance.get_rows()                                         |
+                                                                                    |
+        Description:    Return the rows as strings without reading the paged ones   |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    append(self, task: Task)                                    |   -> None
+                                                                                    |
+        Usage:          instance.append(Task)                                       |
+                                                                                    |
+        Description:    Add a completed task as the last row                        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    insert(self, index: int, task: Task)                        |   -> None
+                                                                                    |
+        Usage:          instance.insert(3, Task)                                    |
+                                                                                    |
+        Description:    Add a completed task as row index                           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    pop(self, index: int)                                       |   -> Task that was in row index
+                                                                                    |
+        Usage:          instance.pop(3)                                             |
+                                                                                    |
+        Description:    Remove a row and return it as a Task                        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_uid(self, index: int)                                   |   -> stable id of the task in row index
+                                                                                    |
+        Usage:          instance.get_uid(3)                                         |
+                                                                                    |
+        Description:    Return the stable id of a row without building a Task       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    iter_uids(self, start: int)                                 |   -> iterator of stable ids
+                                                                                    |
+        Usage:          instance.iter_uids(0)                                       |
+                                                                                    |
+        Description:    Iterate the stable ids from row start on                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    iter_rows(self)                                             |   -> iterator of list[str]
+                                                                                    |
+        Usage:          instance.iter_rows()                                        |
+                                                                                    |
+        Description:    Iterate the rows as [name, priority, due date, completed]   |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    iter_names_and_dates(self, start: int, stop: int)           |   -> iterator of (str, str)
+                                                                                    |
+        Usage:          instance.iter_names_and_dates(0, 100)                       |
+                                                                                    |
+        Description:    Iterate the task name and completed date of the rows        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    counts_per_day(self)                                        |   -> dict[str, int]
+                                                                                    |
+        Usage:          instance.counts_per_day()                                   |
+                                                                                    |
+        Description:    Count the tasks completed on each day (MM/DD/YYYY)          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    counts_per_priority(self)                                   |   -> dict[int, int]
+                                                                                    |
+        Usage:          instance.counts_per_priority()                              |
+                                                                                    |
+        Description:    Count the completed tasks of each priority                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self):
+        # one typed array per column
+        self._uids = array('q')
+        self._names = array('l')
+        self._priorities = array('q')
+        self._due = array('l')
+        self._done = array('l')
+
+        # dictionary encoding of the task names
+        self._name_values = []
+        self._name_codes = {}
+
+        # dictionary encoding of dates that could not be parsed
+        self._date_values = []
+        self._date_codes = {}
+
+        # the first rows, left in the completed tasks file until they are needed
+        self._file = None
+        self._paged = 0
+        self._first_uid = 0
+
+    def __len__(self) -> int:
+        return self._paged + len(self._uids)
+
+    def __getitem__(self, index: int) -> Task:
+        return self._build_task(index)
+
+    def __iter__(self):
+        # rebuild each task only as it is reached
+        for index in range(len(self)):
+            yield self._build_task(index)
+
+    def attach(self, completed_file: CompletedFile, paged: int, first_uid: int) -> None:
+        """
+        Parameter:
+            completed_file: the file the rows are paged from
+            paged:          how many of its first rows are the first rows here
+            first_uid:      the stable id of the first of them, the others
+                            follow on from it
+
+        Called By:      __init__() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       self._file
+                        self._paged
+                        self._first_uid
+
+        Return:         None
+
+        Description:    leave the first rows of the store in the file, the
+                        store must be empty
+        """
+        self._file = completed_file if paged > 0 else None
+        self._paged = paged
+        self._first_uid = first_uid
+
+    def get_paged_rows(self) -> int:
+        """
+        Parameter:      N/A
+
+        Called By:      _reindex(), _take(), _place() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return how many of the first rows are still paged
+        """
+        return self._paged
+
+    def page_in(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      insert(), pop() - ScrumbanCompleted.py
+                        _take(), _place() - ScrumbanBoard.py
+
+        Calls:          _build_task(), _encode_name(), _encode_date()
+
+        Modifies:       every column
+                        self._file
+                        self._paged
+
+        Return:         None
+
+        Description:    read the paged rows into the front of the columns, so
+                        rows among them can be taken out or put back
+        """
+        if self._paged == 0:
+            return
+
+        # columns: the paged rows, then the rows already in the columns
+        uids, names, priorities, due, done = array('q'), array('l'), array('q'), array('l'), array('l')
+        for index in range(self._paged):
+            task = self._build_task(index)
+            uids.append(task.get_uid())
+            names.append(self._encode_name(task.get_name()))
+            priorities.append(task.get_priority_value())
+            due.append(self._encode_date(task.due_date))
+            done.append(self._encode_date(task.completed_date))
+
+        self._uids = uids + self._uids
+        self._names = names + self._names
+        self._priorities = priorities + self._priorities
+        self._due = due + self._due
+        self._done = done + self._done
+        self._file = None
+        self._paged = 0
+
+    def locate(self, uid: int):
+        """
+        Parameter:
+            uid:        a stable id
+
+        Called By:      _take(), locate_task() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int or None
+
+        Description:    return the row of the task with the id uid if it is
+                        still paged, otherwise None
+        """
+        if self._first_uid <= uid < self._first_uid + self._paged:
+            return uid - self._first_uid
+        return None
+
+    def get_rows(self) -> CompletedRows:
+        """
+        Parameter:      N/A
+
+        Called By:      get_string_completed() - ScrumbanBoard.py
+
+        Calls:          iter_rows()
+
+        Modifies:       N/A
+
+        Return:         CompletedRows
+
+        Description:    return the rows in the same form as Task.listify(),
+                        the paged rows stay in the file
+        """
+        return CompletedRows(self._file, self._paged, list(self.iter_rows(self._paged)))
+
+    def _encode_name(self, name: str) -> int:
+        """
+        Parameter:
+            name:       a task name
+
+        Called By:      append(), insert() - ScrumbanCompleted.py
+
+        Calls:          N/A
+
+        Modifies:       self._name_values
+                        self._name_codes
+
+        Return:         int
+
+        Description:    return the code of name, giving it the next code if it
+                        hasn't been seen before
+        """
+        code = self._name_codes.get(name)
+        if code is None:
+            code = len(self._name_values)
+            self._name_codes[name] = code
+            self._name_values.append(name)
+        return code
+
+    def _encode_date(self, value) -> int:
+        """
+        Parameter:
+            value:      a day ordinal or unparsed date text from a Task
+
+        Called By:      append(), insert() - ScrumbanCompleted.py
+
+        Calls:          N/A
+
+        Modifies:       self._date_values
+                        self._date_codes
+
+        Return:         int
+
+        Description:    return the day ordinal unchanged, or a negative code
+                        for date text that isn't a real calendar day
+        """
+        if not isinstance(value, str):
+            return value
+        code = self._date_codes.get(value)
+        if code is None:
+            self._date_values.append(value)
+            code = -len(self._date_values)
+            self._date_codes[value] = code
+        return code
+
+    def _decode_date(self, code: int) -> str:
+        """
+        Parameter:
+            code:       a value from the due or completed column
+
+        Called By:      _build_task(), iter_rows(), iter_names_and_dates()
+                        - ScrumbanCompleted.py
+
+        Calls:          format_date() - ScrumbanMember.py
+
+        Modifies:       N/A
+
+        Return:         str
+
+        Description:    return the MM/DD/YYYY text of a date column value
+        """
+        if code < 0:
+            return self._date_values[-code - 1]
+        return format_date(code)
+
+    def _build_task(self, index: int) -> Task:
+        """
+        Parameter:
+            index:      the row to rebuild
+
+        Called By:      __getitem__(), __iter__(), pop() - ScrumbanCompleted.py
+
+        Calls:          _decode_date()
+
+        Modifies:       N/A
+
+        Return:         Task
+
+        Description:    rebuild the Task stored in row index
+        """
+        # a paged row is read from the file
+        if index < self._paged:
+            fields = self._file.row(index)
+            return Task(fields[0], fields[1], fields[2], fields[3], self._first_uid + index)
+
+        index -= self._paged
+        return Task(self._name_values[self._names[index]], self._priorities[index],
+                    self._decode_date(self._due[index]), self._decode_date(self._done[index]),
+                    self._uids[index])
+
+    def append(self, task: Task) -> None:
+        """
+        Parameter:
+            task:       the completed task to store
+
+        Called By:      _place() - ScrumbanBoard.py
+
+        Calls:          insert()
+
+        Modifies:       every column
+
+        Return:         None
+
+        Description:    add the completed task as the last row
+        """
+        self.insert(len(self), task)
+
+    def insert(self, index: int, task: Task) -> None:
+        """
+        Parameter:
+            index:      the row the task will be stored in
+            task:       the completed task to store
+
+        Called By:      append() - ScrumbanCompleted.py
+                        _place() - ScrumbanBoard.py
+
+        Calls:          _encode_name(), _encode_date(), page_in()
+
+        Modifies:       every column
+
+        Return:         None
+
+        Description:    add the completed task as row index, the Task object
+                        itself is not kept
+        """
+        # a row can't be put among the paged rows
+        if index < self._paged:
+            self.page_in()
+        index -= self._paged
+
+        self._uids.insert(index, task.get_uid())
+        self._names.insert(index, self._encode_name(task.get_name()))
+        self._priorities.insert(index, task.get_priority_value())
+        self._due.insert(index, self._encode_date(task.due_date))
+        self._done.insert(index, self._encode_date(task.completed_date))
+
+    def pop(self, index: int) -> Task:
+        """
+        Parameter:
+            index:      the row to remove
+
+        Called By:      _take() - ScrumbanBoard.py
+
+        Calls:          _build_task(), page_in()
+
+        Modifies:       every column
+
+        Return:         Task
+
+        Description:    remove row index and return it as a Task
+        """
+        # a paged row can't be taken out of the file
+        if index < self._paged:
+            self.page_in()
+
+        task = self._build_task(index)
+        index -= self._paged
+        # column: each column drops the row
+        for column in (self._uids, self._names, self._priorities, self._due, self._done):
+            column.pop(index)
+        return task
+
+    def get_uid(self, index: int) -> int:
+        """
+        Parameter:
+            index:      a row
+
+        Called By:      completed_to_todo() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return the stable id of the task in row index
+        """
+        if index < self._paged:
+            return self._first_uid + index
+        return self._uids[index - self._paged]
+
+    def iter_uids(self, start: int = 0):
+        """
+        Parameter:
+            start:      the first row
+
+        Called By:      _reindex() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         iterator[int]
+
+        Description:    iterate the stable ids from row start to the last row
+        """
+        # the paged ids follow on from the first one
+        paged = range(self._first_uid + start, self._first_uid + self._paged)
+        return chain(paged, self._uids[max(start - self._paged, 0):])
+
+    def iter_rows(self, start: int = 0):
+        """
+        Parameter:
+            start:      the first row
+
+        Called By:      get_rows() - ScrumbanCompleted.py
+                        to_state() - ScrumbanBoard.py
+
+        Calls:          _decode_date()
+                        CompletedFile.iter_rows()
+
+        Modifies:       N/A
+
+        Return:         iterator[list[str]]
+
+        Description:    iterate each row from start on in the same form as
+                        Task.listify(), paged rows as they are in the file
+        """
+        if start < self._paged:
+            yield from self._file.iter_rows(start, self._paged)
+        for index in range(max(start - self._paged, 0), len(self._uids)):
+            yield [self._name_values[self._names[index]], str(self._priorities[index]),
+                   self._decode_date(self._due[index]), self._decode_date(self._done[index])]
+
+    def iter_names_and_dates(self, start: int = 0, stop: int = None):
+        """
+        Parameter:
+            start:      the first row
+            stop:       the row to stop before, None for the last row
+
+        Called By:      CompletedLogLines - ScrumbanInterface.py
+
+        Calls:          _decode_date()
+                        CompletedFile.iter_rows()
+
+        Modifies:       N/A
+
+        Return:         iterator[(str, str)]
+
+        Description:    iterate the name and completed date of the rows from
+                        start to stop without rebuilding the tasks, reading
+                        only those rows from the file if they are paged
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start < self._paged:
+            for fields in self._file.iter_rows(start, min(stop, self._paged)):
+                yield fields[0], fields[3] if len(fields) > 3 else ""
+        for index in range(max(start - self._paged, 0), max(stop - self._paged, 0)):
+            yield self._name_values[self._names[index]], self._decode_date(self._done[index])
+
+    def counts_per_day(self) -> dict:
+        """
+        Parameter:      N/A
+
+        Called By:      get_string_completed_counts() - ScrumbanBoard.py
+
+        Calls:          collections.Counter
+                        parse_date(), format_date() - ScrumbanMember.py
+                        CompletedFile.iter_rows()
+
+        Modifies:       N/A
+
+        Return:         dict[str, int]
+
+        Description:    return the number of tasks completed on each day, keyed by
+                        the MM/DD/YYYY date, in date order. Dates that aren't
+                        real calendar days come last. The completed column is
+                        counted as it is, paged rows by the date text in the
+                        file, so only the distinct values are decoded and the
+                        date codes are never added to.
+        """
+        # days: the count of each day ordinal, texts: the count of each unparsed date
+        days = Counter()
+        texts = Counter()
+        for code, count in Counter(self._done).items():
+            if code < 0:
+                texts[self._date_values[-code - 1]] += count
+            else:
+                days[code] += count
+
+        # paged rows are counted by the text in the file
+        if self._paged:
+            paged = Counter(fields[3] if len(fields) > 3 else "" for fields in self._file.iter_rows(0, self._paged))
+            for text, count in paged.items():
+                value = parse_date(text)
+                if isinstance(value, str):
+                    texts[value] += count
+                else:
+                    days[value] += count
+
+        counts = {format_date(day): days[day] for day in sorted(days)}
+        counts.update((text, texts[text]) for text in sorted(texts))
+        return counts
+
+    def counts_per_priority(self) -> dict:
+        """
+        Parameter:      N/A
+
+        Called By:      get_string_completed_counts() - ScrumbanBoard.py
+
+        Calls:          collections.Counter
+                        CompletedFile.iter_rows()
+
+        Modifies:       N/A
+
+        Return:         dict[int, int]
+
+        Description:    return the number of completed tasks of each priority, in
+                        priority order. Paged rows are counted by the priority
+                        text in the file without rebuilding their tasks.
+        """
+        counts = Counter(self._priorities)
+        if self._paged:
+            paged = Counter(fields[1] for fields in self._file.iter_rows(0, self._paged))
+            for text, count in paged.items():
+                counts[int(text)] += count
+        return {priority: counts[priority] for priority in sorted(counts)}
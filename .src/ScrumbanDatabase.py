@@ -0,0 +1,534 @@
+"""
+File: ScrumbanDatabase.py
+
+Description: This module is responsible for the optional SQLite storage backend
+             of the Virtual Scrumban System.
+
+             It completes several tasks:
+
+             1. Keeps the backlogs, members, assignments, completed tasks and
+                meeting notes in indexed tables of one database file
+             2. Imports the existing text files the first time it is used
+             3. Saves only the rows that changed since the last load or save
+
+Dependencies: sqlite3, os
+
+Date Created: 10/17/2026
+"""
+
+# used for the database file
+import sqlite3
+# used to check for the database file
+from os import path
+# used to date the meeting notes
+from datetime import date
+
+from ScrumbanHistory import ScrumbanHistory
+
+# where the database is kept
+database_path: str = ".sys_data/scrumban.db"
+
+# the version stored in the database once the text files have been imported
+schema_version: int = 1
+
+# the tables and indexes of the database
+schema: str = """
+CREATE TABLE IF NOT EXISTS tasks (
+    container   TEXT    NOT NULL,
+    position    INTEGER NOT NULL,
+    name        TEXT    NOT NULL,
+    priority    TEXT    NOT NULL,
+    due         TEXT    NOT NULL,
+    queued      INTEGER,
+    PRIMARY KEY (container, position)
+);
+CREATE INDEX IF NOT EXISTS tasks_name ON tasks (name);
+
+CREATE TABLE IF NOT EXISTS members (
+    position    INTEGER PRIMARY KEY,
+    name        TEXT    NOT NULL,
+    email       TEXT    NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS assignments (
+    member      INTEGER NOT NULL,
+    position    INTEGER NOT NULL,
+    name        TEXT    NOT NULL,
+    priority    TEXT    NOT NULL,
+    due         TEXT    NOT NULL,
+    PRIMARY KEY (member, position)
+);
+
+CREATE TABLE IF NOT EXISTS completions (
+    position    INTEGER PRIMARY KEY,
+    name        TEXT    NOT NULL,
+    priority    TEXT    NOT NULL,
+    due         TEXT    NOT NULL,
+    done        TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS completions_done ON completions (done);
+
+CREATE TABLE IF NOT EXISTS notes (
+    day         TEXT    PRIMARY KEY,
+    text        TEXT    NOT NULL
+);
+"""
+
+
+class ScrumbanDatabase(ScrumbanHistory):
+    """
+    ScrumbanHistory that keeps the board in a SQLite database instead of
+    rewriting the text files.
+
+    The lists handed to and from the rest of the system are the same as
+    ScrumbanHistory's, so VSS and the board don't know which backend is used.
+    Every row is keyed by where it sits on the board. The rows read by the
+    last load or save are remembered, so a save only inserts, updates and
+    deletes the rows whose key or fields changed, all in one transaction.
+
+    Used By:
+        VSS.py
+
+    Members:
+        Member Name:                : Type              : Default Val           -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.database_path          : str               : database_path         -> the path of the database file
+
+        self._connection            : Connection        : None                  -> the open database, None until it is first used
+
+        self._rows                  : dict[str, dict]   : None each             -> for each table, the rows as last loaded or saved,
+                                                                                   keyed by their primary key, None until read
+
+        self._importing             : bool              : False                 -> True while the board read from the text files
+                                                                                   hasn't been saved to the database yet
+
+        (and every member of ScrumbanHistory)
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _connect(self)                                              |   -> Connection
+                                                                                    |
+        Usage:          instance._connect()                                         |
+                                                                                    |
+        Description:    Open the database in WAL mode and create the tables         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _build_rows(self, tables: set)                              |   -> dict[str, dict]
+                                                                                    |
+        Usage:          instance._build_rows({"tasks"})                             |
+                                                                                    |
+        Description:    Key the rows of the tables from the string lists            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _sync_table(self, table, key_columns, value_columns, rows)  |   -> None
+                                                                                    |
+        Usage:          instance._sync_table("members", ..., rows)                  |
+                                                                                    |
+        Description:    Write the rows of one table that changed since last time    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    load_scrumban(self)                                         |   -> None
+                                                                                    |
+        Usage:          instance.load_scrumban()                                    |
+                                                                                    |
+        Description:    Read the board from the database, importing the text        |
+                        files if the database hasn't been written yet               |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    save_scrumban(self, parts: set = None)                      |   -> list[str]
+                                                                                    |
+        Usage:          instance.save_scrumban({"todo"})                            |
+                                                                                    |
+        Description:    Write the rows of the changed parts that changed since the  |
+                        last load or save, return the tables that were skipped      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    archive_completed_tasks(self, archive: CompletedArchive,    |   -> int
+                                                max_age_days: int)                  |
+        Usage:          instance.archive_completed_tasks(archive, 90)               |
+                                                                                    |
+        Description:    Completed tasks stay in their table, nothing is archived    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_data_files(self)                                        |   -> list[str]
+                                                                                    |
+        Usage:          instance.get_data_files()                                   |
+                                                                                    |
+        Description:    Return the paths of the database files                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    reset_system(self)                                          |   -> None
+                                                                                    |
+        Usage:          instance.reset_system()                                     |
+                                                                                    |
+        Description:    Close the database and delete the system data               |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    close(self)                                                 |   -> None
+                                                                                    |
+        Usage:          instance.close()                                            |
+                                                                                    |
+        Description:    Close the database                                          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, database_file: str = database_path):
+        super().__init__()
+
+        # where the database lives
+        self.database_path = database_file
+
+        # opened the first time the database is read or written
+        self._connection = None
+
+        # the rows of each table as they are in the database, None until read
+        self._rows = dict.fromkeys(("tasks", "members", "assignments", "completions"))
+
+        # set when the text files are read instead of the database
+        self._importing = False
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Parameter:      N/A
+
+        Called By:      load_scrumban(), save_scrumban() - ScrumbanDatabase.py
+
+        Calls:          sqlite3.connect()
+
+        Modifies:       self._connection
+
+        Return:         Connection
+
+        Description:    open the database the first time it is needed. WAL mode
+                        lets a save append its changes instead of rewriting
+                        pages in place, and NORMAL sync is safe with it. The
+                        autosave writes from its own thread, it never uses the
+                        connection at the same time as the interface thread.
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.database_path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(schema)
+        return self._connection
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def load_scrumban(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      startup - VSS.py
+
+        Calls:          load_scrumban(), set_completed_tasks() - ScrumbanHistory.py
+                        _connect(), _build_rows() - ScrumbanDatabase.py
+
+        Modifies:       self.project_backlog
+                        self.todo_backlog
+                        self.members
+                        self.completed_tasks
+                        self.queued_days
+                        self._rows
+                        self._importing
+
+        Return:         None
+
+        Description:    read every table into the same lists the text files
+                        are read into. Until the first save has written the
+                        database the text files are read instead, so they
+                        are imported the first time the board is saved.
+        """
+        # nothing saved yet, read the text files this once
+        if not path.exists(self.database_path) or \
+                self._connect().execute("PRAGMA user_version").fetchone()[0] < schema_version:
+            super().load_scrumban()
+            # the first save writes every table from these, not only the parts that changed
+            self.project_backlog = list(self.project_backlog)
+            self.todo_backlog = list(self.todo_backlog)
+            self.members = list(self.members)
+            self._importing = True
+            return
+
+        connection = self._connect()
+
+        # the project and todo backlogs in the order they were saved
+        self.project_backlog = []
+        self.todo_backlog = []
+        self.queued_days = {}
+        # name, priority, due, queued: the fields of each backlog task
+        for container, name, priority, due, queued in connection.execute(
+                "SELECT container, name, priority, due, queued FROM tasks ORDER BY container, position"):
+            if container == "project":
+                self.project_backlog.append([name, priority, due])
+                # only tasks that have waited have a queued day
+                if queued is not None:
+                    self.queued_days[name] = queued
+            else:
+                self.todo_backlog.append([name, priority, due])
+
+        # each member's tasks, tab delimited fields and ; delimited tasks as in the members file
+        assigned = {}
+        for member, name, priority, due in connection.execute(
+                "SELECT member, name, priority, due FROM assignments ORDER BY member, position"):
+            assigned.setdefault(member, []).append(f"{name}\t{priority}\t{due}")
+
+        # questions and concerns start blank at each meeting
+        self.members = [[name, email, ";".join(assigned.get(position, [])), ""]
+                        for position, name, email in connection.execute(
+                            "SELECT position, name, email FROM members ORDER BY position")]
+
+        self.set_completed_tasks([list(row) for row in connection.execute(
+            "SELECT name, priority, due, done FROM completions ORDER BY position")])
+
+        # remember what is in the database so a save only writes the changes
+        self._rows = self._build_rows(set(self._rows))
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _build_rows(self, tables: set) -> dict:
+        """
+        Parameter:      tables - the names of the tables to build the rows of
+
+        Called By:      load_scrumban(), save_scrumban() - ScrumbanDatabase.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         dict[str, dict[tuple, tuple]]
+
+        Description:    key the rows of the tables by their primary key from
+                        the string lists the board was saved into
+        """
+        rows = {table: {} for table in tables}
+
+        # position, task: each task of the backlogs in order
+        if "tasks" in tables:
+            for position, task in enumerate(self.project_backlog):
+                rows["tasks"][("project", position)] = (task[0], task[1], task[2], self.queued_days.get(task[0]))
+            for position, task in enumerate(self.todo_backlog):
+                rows["tasks"][("todo", position)] = (task[0], task[1], task[2], None)
+
+        # member_position, member: each member, with their tasks split out of the member row
+        if "members" in tables:
+            for member_position, member in enumerate(self.members):
+                rows["members"][(member_position,)] = (member[0].strip(), member[1].strip())
+                if len(member) > 2 and member[2] != "":
+                    for position, task in enumerate(member[2].split(";")):
+                        fields = task.split("\t")
+                        rows["assignments"][(member_position, position)] = (fields[0], fields[1], fields[2])
+
+        if "completions" in tables:
+            for position, task in enumerate(self.completed_tasks):
+                rows["completions"][(position,)] = (task[0], task[1], task[2], task[3] if len(task) > 3 else "")
+
+        return rows
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _sync_table(self, table: str, key_columns: tuple, value_columns: tuple, rows: dict) -> None:
+        """
+        Parameter:      table - the name of the table
+                        key_columns - the primary key columns of the table
+                        value_columns - the other columns of the table
+                        rows - the rows the table should hold, keyed by primary key
+
+        Called By:      save_scrumban() - ScrumbanDatabase.py
+
+        Calls:          executemany()
+
+        Modifies:       the table
+                        self._rows
+
+        Return:         None
+
+        Description:    delete the rows whose key is gone and insert or replace
+                        the rows that are new or whose fields changed, so the
+                        work done is proportional to the changes. A table that
+                        was never read, as when the board came from the boot
+                        snapshot, is cleared and written whole.
+        """
+        previous = self._rows[table]
+
+        # what the table holds is unknown, start it over
+        if previous is None:
+            self._connection.execute(f"DELETE FROM {table}")
+            previous = {}
+
+        # keys no longer on the board
+        removed = [key for key in previous if key not in rows]
+        # rows that are new or were edited
+        changed = [key + values for key, values in rows.items() if previous.get(key) != values]
+
+        if removed:
+            condition = " AND ".join(f"{column} = ?" for column in key_columns)
+            self._connection.executemany(f"DELETE FROM {table} WHERE {condition}", removed)
+        if changed:
+            columns = ", ".join(key_columns + value_columns)
+            marks = ", ".join("?" * (len(key_columns) + len(value_columns)))
+            self._connection.executemany(f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({marks})", changed)
+
+        self._rows[table] = rows
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def save_scrumban(self, parts: set = None) -> list:
+        """
+        Parameter:      parts - the parts of the board that changed since they
+                        were last saved, named as in ScrumbanBoard.py, None for all
+
+        Called By:      shutdown(), send_reports() - VSS.py
+
+        Calls:          _connect(), _build_rows(), _sync_table() - ScrumbanDatabase.py
+                        _data_lock(), _record_meeting() - ScrumbanHistory.py
+
+        Modifies:       the database
+                        self._rows
+                        self._importing
+                        the history of the meeting
+
+        Return:         list[str] - the tables that were skipped because their
+                        part of the board didn't change
+
+        Description:    write the rows that changed since the last load or save
+                        in one transaction. Tables of parts that didn't change
+                        aren't built or compared. The first save writes every
+                        row, which imports the text files read by load_scrumban.
+        """
+        # no other copy reads or writes the files until the save is done
+        with self._data_lock(True):
+            connection = self._connect()
+
+            # every table is written when the text files are imported
+            if parts is None or self._importing:
+                parts = {"project", "todo", "member", "completed", "notes"}
+
+            # tables: the tables holding the changed parts
+            tables = set()
+            if "project" in parts or "todo" in parts:
+                tables.add("tasks")
+            if "member" in parts:
+                tables.update(("members", "assignments"))
+            if "completed" in parts:
+                tables.add("completions")
+            rows = self._build_rows(tables)
+
+            # commit everything together, or nothing if the save fails part way
+            with connection:
+                if "tasks" in tables:
+                    self._sync_table("tasks", ("container", "position"), ("name", "priority", "due", "queued"),
+                                     rows["tasks"])
+                if "members" in tables:
+                    self._sync_table("members", ("position",), ("name", "email"), rows["members"])
+                    self._sync_table("assignments", ("member", "position"), ("name", "priority", "due"),
+                                     rows["assignments"])
+                if "completions" in tables:
+                    self._sync_table("completions", ("position",), ("name", "priority", "due", "done"),
+                                     rows["completions"])
+
+                # the notes of each meeting are kept by the day of the meeting
+                if "notes" in parts and self.general_notes != "":
+                    connection.execute("INSERT OR REPLACE INTO notes (day, text) VALUES (?, ?)",
+                                       (str(date.today()), self.general_notes))
+
+                # the text files have been imported
+                connection.execute(f"PRAGMA user_version = {schema_version}")
+            self._importing = False
+
+            # keep the database and its log as they are now in the history of this meeting
+            self._record_meeting(self.get_data_files())
+
+            # the tables that were left alone
+            return sorted(set(self._rows) - tables) + ([] if "notes" in parts else ["notes"])
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def archive_completed_tasks(self, archive, max_age_days: int) -> int:
+        """
+        Parameter:      archive - the CompletedArchive the old tasks would go to
+                        max_age_days - how many days a completed task is kept
+
+        Called By:      startup - VSS.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int - always 0
+
+        Description:    the completed tasks table is only read a page at a time
+                        already, so its old tasks are left where they are
+        """
+        return 0
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def get_data_files(self) -> list:
+        """
+        Parameter:      N/A
+
+        Called By:      startup, shutdown - VSS.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         list[str]
+
+        Description:    the board is read from the database and its write ahead
+                        log, and the limits from the system data file
+        """
+        return [".sys_data/sys_data.txt", self.database_path, self.database_path + "-wal"]
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def reset_system(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      startup - VSS.py
+
+        Calls:          close() - ScrumbanDatabase.py
+                        reset_system() - ScrumbanHistory.py
+
+        Modifies:       self._rows
+                        self._importing
+
+        Return:         None
+
+        Description:    close the database before its directory is deleted
+        """
+        self.close()
+        self._rows = dict.fromkeys(("tasks", "members", "assignments", "completions"))
+        self._importing = False
+        super().reset_system()
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def close(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      shutdown - VSS.py
+                        reset_system() - ScrumbanDatabase.py
+
+        Calls:          N/A
+
+        Modifies:       self._connection
+
+        Return:         None
+
+        Description:    close the database, the write ahead log is merged back
+                        into the database file when the last connection closes
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
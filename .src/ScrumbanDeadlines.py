@@ -0,0 +1,183 @@
+"""
+File: ScrumbanDeadlines.py
+
+Description: This module is responsible for knowing when the open tasks of the
+             Virtual Scrumban System are due.
+
+             It completes several tasks:
+
+             1. Keeps the open tasks sorted by due date as they move around the board
+             2. Finds the tasks that are overdue
+             3. Finds the tasks that are due within a number of days
+
+Dependencies: bisect
+
+Date Created: 10/17/2026
+"""
+
+# used to keep the index sorted and to search it
+from bisect import bisect_left, bisect_right, insort
+
+
+class DueDateIndex():
+    """
+    Sorted index of the open tasks by due date.
+
+    Entries are (due day ordinal, task stable id) pairs kept in sorted order, so
+    a query is two binary searches plus the k tasks it returns. Tasks without a
+    due date, or with a due date that isn't a real calendar day, are not indexed.
+
+    Used By:
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type                  : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self._entries       : list[(int, int)]      : []           -> (due day ordinal, stable id) of every indexed task, sorted
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    rebuild(self, tasks: iterable[Task])                        |   -> None
+                                                                                    |
+        Usage:          instance.rebuild([Task, Task])                              |
+                                                                                    |
+        Description:    Replace the index with the given tasks, sorting once        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    add(self, task: Task)                                       |   -> None
+                                                                                    |
+        Usage:          instance.add(Task)                                          |
+                                                                                    |
+        Description:    Index a task that has become open                           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    discard(self, task: Task)                                   |   -> None
+                                                                                    |
+        Usage:          instance.discard(Task)                                      |
+                                                                                    |
+        Description:    Stop indexing a task that is no longer open                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    overdue(self, today: int)                                   |   -> list[int] of stable ids
+                                                                                    |
+        Usage:          instance.overdue(738000)                                    |
+                                                                                    |
+        Description:    Return the tasks due before today, most overdue first       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    due_within(self, today: int, days: int)                     |   -> list[int] of stable ids
+                                                                                    |
+        Usage:          instance.due_within(738000, 7)                              |
+                                                                                    |
+        Description:    Return the tasks due from today through today + days        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self):
+        # (due ordinal, uid) of every indexed task in sorted order
+        self._entries = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, tasks) -> None:
+        """
+        Parameter:
+            tasks:      iterable of every open task
+
+        Called By:      __init__() - ScrumbanBoard.py
+
+        Calls:          [Task].get_due_ordinal()
+
+        Modifies:       self._entries
+
+        Return:         None
+
+        Description:    replace the index with the given tasks, sorting once
+                        instead of inserting each task
+        """
+        self._entries = sorted((task.get_due_ordinal(), task.get_uid()) for task in tasks
+                               if task.get_due_ordinal() is not None)
+
+    def add(self, task) -> None:
+        """
+        Parameter:
+            task:       a task that has become open
+
+        Called By:      completed_to_todo_by_uid() - ScrumbanBoard.py
+
+        Calls:          bisect.insort()
+
+        Modifies:       self._entries
+
+        Return:         None
+
+        Description:    index the task under its due date
+        """
+        due = task.get_due_ordinal()
+        if due is not None:
+            insort(self._entries, (due, task.get_uid()))
+
+    def discard(self, task) -> None:
+        """
+        Parameter:
+            task:       a task that is no longer open
+
+        Called By:      complete_task_by_uid() - ScrumbanBoard.py
+
+        Calls:          bisect.bisect_left()
+
+        Modifies:       self._entries
+
+        Return:         None
+
+        Description:    remove the task from the index if it is there
+        """
+        due = task.get_due_ordinal()
+        if due is None:
+            return
+        entry = (due, task.get_uid())
+        index = bisect_left(self._entries, entry)
+        if index < len(self._entries) and self._entries[index] == entry:
+            del self._entries[index]
+
+    def overdue(self, today: int) -> list:
+        """
+        Parameter:
+            today:      the day ordinal to check against
+
+        Called By:      get_overdue_tasks() - ScrumbanBoard.py
+
+        Calls:          bisect.bisect_left()
+
+        Modifies:       N/A
+
+        Return:         list[int]
+
+        Description:    return the stable ids of the tasks due before today,
+                        most overdue first
+        """
+        # every entry before the first one due today is overdue
+        end = bisect_left(self._entries, (today,))
+        return [uid for _, uid in self._entries[:end]]
+
+    def due_within(self, today: int, days: int) -> list:
+        """
+        Parameter:
+            today:      the day ordinal to start from
+            days:       how many days after today to include
+
+        Called By:      get_upcoming_tasks() - ScrumbanBoard.py
+
+        Calls:          bisect.bisect_left()
+                        bisect.bisect_right()
+
+        Modifies:       N/A
+
+        Return:         list[int]
+
+        Description:    return the stable ids of the tasks due from today through
+                        today + days, soonest first
+        """
+        start = bisect_left(self._entries, (today,))
+        # (day + 1,) sorts after every entry due on that day
+        end = bisect_right(self._entries, (today + days + 1,))
+        return [uid for _, uid in self._entries[start:end]]
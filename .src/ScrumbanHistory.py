@@ -12,7 +12,7 @@ Description: This module is responsible for maintaining long term storage for th
              4. Distributes email reports
 
 
-Dependencies: None
+Dependencies: ScrumbanWriter.py, ScrumbanCompleted.py, concurrent.futures
 
 Author(s): Nick Johnstone
 
@@ -29,9 +29,23 @@ from os import listdir, getcwd, mkdir, path
 # used to mark files tasks with timestamps
 from datetime import date
 # used to valid user files
-from re import search
+from re import compile as compile_pattern
+# used to read large user files without copying them
+from mmap import mmap, ACCESS_READ
 # used to clear system data
 from shutil import rmtree
+# used to read the files of the board at the same time
+from concurrent.futures import ThreadPoolExecutor
+# used when no lock is set
+from contextlib import nullcontext
+# used to write the files of a save together and crash safely
+from ScrumbanWriter import BatchWriter
+# used to page the completed tasks file instead of reading it all in
+from ScrumbanCompleted import CompletedFile, CompletedRows, build_completed_index, priority_range
+# used to find the completion day of the tasks to archive
+from ScrumbanMember import parse_date
+# used to version the saved files and upgrade old ones
+from ScrumbanSchema import format_header, is_header, migrate_files
 # used to build the email messages
 from email.message import EmailMessage
 # used to check network connection
@@ -39,6 +53,17 @@ import urllib.request
 # used to check network connection
 import urllib.error
 
+# the format of each line of a project backlog file: name, priority, due date
+task_line_pattern = compile_pattern(r"^[A-z0-9\s-]+,\s*(?P<priority>[0-9]+),\s*[0-9]+/[0-9]+/[0-9]+\s*$")
+# the format of each line of a members file: name, email
+member_line_pattern = compile_pattern(r"^[A-z\s-]+,\s*[A-z0-9-.]+@[A-z0-9.]+\s*$")
+
+# files at least this many bytes are read through mmap
+mmap_threshold: int = 1 << 20
+
+# at most this many errors are listed in one message
+max_reported_errors: int = 10
+
 
 class ScrumbanHistory():
     """
@@ -60,13 +85,17 @@ class ScrumbanHistory():
 
         self.agenda_path            : str               : ""                    -> Holds the agenda_path of the current agenda file
 
-        self.project_backlog        : list[list[str]]   : []                    -> Holds the list of raw string tasks on the project backlog
+        self.project_backlog        : iter[list[str]]   : []                    -> Holds the raw string tasks on the project backlog, streamed
+                                                                                   from the file once by the board when loaded, a list once set
 
-        self.todo_backlog           : list[list[str]]   : []                    -> Holds the list of raw string tasks on the todo backlog
+        self.todo_backlog           : iter[list[str]]   : []                    -> Holds the raw string tasks on the todo backlog, streamed
+                                                                                   from the file once by the board when loaded, a list once set
 
-        self.members                : list[list[str]]   : []                    -> Holds the list of raw string member data
+        self.members                : iter[list[str]]   : []                    -> Holds the raw string member data, streamed from the file
+                                                                                   once by the board when loaded, a list once set
 
-        self.completed_tasks        : list[list[str]]   : []                    -> Holds the list of raw string tasks that have been completed
+        self.completed_tasks        : CompletedRows     : []                    -> Holds the raw string tasks that have been completed, the
+                                                                                   ones read from the file are paged from it
 
         self.agenda                 : list[str]         : []                    -> Holds the list of agenda items for the current session
 
@@ -76,6 +105,35 @@ class ScrumbanHistory():
 
         self.general_notes          : str               : ""                    -> Holds the general meeting notes
 
+        self.at_risk_tasks          : list[str]         : []                    -> Holds the overdue and soon due tasks for the reports
+
+        self.completed_counts       : list[str]         : []                    -> Holds the completed tasks per day and per priority for
+                                                                                   the reports
+
+        self.queued_days            : dict[str, int]    : {}                    -> Holds the day ordinal each project backlog task was
+                                                                                   first queued, keyed by task name, so aging survives restarts
+
+        self._completed_written     : CompletedRows     : []                    -> Holds the completed tasks that are in the
+                                                                                   completed_tasks file, in file order
+
+        self._completed_appended_from : int             : None                  -> Holds the size the completed_tasks file had before
+                                                                                   the save appended to it, None if it was rewritten
+
+        self._completed_size        : int               : None                  -> Holds the size of the completed_tasks file after it was
+                                                                                   last read or written, None if it hasn't been
+
+        self._parsed_files          : dict[str, tuple]  : {}                    -> Holds the rows of each user file parsed while it was
+                                                                                   validated, with the size and mtime the file had
+
+        self.load_threads           : int               : 1                     -> The number of files load_scrumban reads at the same
+                                                                                   time, 1 to read them one after another
+
+        self.meetings               : MeetingStore      : None                  -> Where each save records the files of the meeting, None to
+                                                                                   keep no history of past meetings
+
+        self.lock                   : DataLock          : None                  -> Keeps other copies of the system from reading the files
+                                                                                   while they are saved, None if the files aren't shared
+
 
     Methods:
 
@@ -109,45 +167,107 @@ class ScrumbanHistory():
         Description:    Reads in data from self.completed_tasks_path and assigns    |
                         it to self.completed_tasks                                  |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    _save_project_backlog(self)                                 |   -> None
+        Declaration:    _read_lines(file_path: str)                                 |   -> iterator[(int, str)]
+                                                                                    |
+        Usage:          ScrumbanHistory._read_lines(str)                            |
+                                                                                    |
+        Description:    Static method that yields each line of a file with its line |
+                        number, reading large files through mmap                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _stream_rows(file_path: str)                                |   -> iterator[list[str]]
+                                                                                    |
+        Usage:          ScrumbanHistory._stream_rows(str)                           |
+                                                                                    |
+        Description:    Static method that yields the fields of each line of a file |
+                        as it is read                                               |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _parse_file(file_path: str, pattern, file_name: str)        |   -> (list[list[str]], list[str])
+                                                                                    |
+        Usage:          ScrumbanHistory._parse_file(str, task_line_pattern, str)    |
+                                                                                    |
+        Description:    Static method that splits each line of a file into fields   |
+                        and checks it against pattern in the same pass              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _check_valid_file(self, file_path, pattern, file_name,      |   -> str
+                                          encoding_error)                           |
+        Usage:          instance._check_valid_file(str, task_line_pattern, ...)     |
+                                                                                    |
+        Description:    Validates every line of a user file and keeps its rows      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _parsed_rows(self, file_path: str)                          |   -> iterable[list[str]]
+                                                                                    |
+        Usage:          instance._parsed_rows(str)                                  |
+                                                                                    |
+        Description:    Returns the rows of a file, parsed during validation if it  |
+                        hasn't changed since, otherwise streamed from it            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _data_lock(self, exclusive: bool)                           |   -> context manager
+                                                                                    |
+        Usage:          with instance._data_lock(True):                             |
+                                                                                    |
+        Description:    Holds the lock over the files for a save or a read          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _record_meeting(self, files: list[str])                     |   -> None
                                                                                     |
-        Usage:          instance._save_project_backlog(self)                        |
+        Usage:          instance._record_meeting(self.get_data_files())             |
+                                                                                    |
+        Description:    Records the saved files in the history of the meeting       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _save_project_backlog(self, writer: BatchWriter)            |   -> None
+                                                                                    |
+        Usage:          instance._save_project_backlog(writer)                      |
                                                                                     |
         Description:    Saves data from self.completed_tasks by                     |
                         writing it to self.completed_tasks_path                     |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    _save_members(self)                                         |   -> None
+        Declaration:    _save_members(self, writer: BatchWriter)                    |   -> None
                                                                                     |
-        Usage:          instance._save_members(self)                                |
+        Usage:          instance._save_members(writer)                              |
                                                                                     |
         Description:    Saves data from self.members by                             |
                         writing it to self.members_path                             |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    _save_todo_backlog(self)                                    |   -> None
+        Declaration:    _save_todo_backlog(self, writer: BatchWriter)               |   -> None
                                                                                     |
-        Usage:          instance._save_members(self)                                |
+        Usage:          instance._save_todo_backlog(writer)                         |
                                                                                     |
         Description:    Saves data from self.members by                             |
                         writing it to self.members_path                             |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    _save_completed_tasks(self)                                 |   -> None
+        Declaration:    _save_completed_tasks(self, writer: BatchWriter)            |   -> None
                                                                                     |
-        Usage:          instance._save_completed_tasks(self)                        |
+        Usage:          instance._save_completed_tasks(writer)                      |
                                                                                     |
-        Description:    Saves data from self.completed_tasks by                     |
-                        writing it to self.completed_tasks_path                     |
+        Description:    Appends the new tasks in self.completed_tasks to            |
+                        self.completed_tasks_path, or rewrites the file if an       |
+                        earlier completed task changed                              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _update_completed_title(self, writer: BatchWriter)          |   -> bool
+                                                                                    |
+        Usage:          instance._update_completed_title(writer)                    |
+                                                                                    |
+        Description:    Writes today's date into the title of the completed tasks   |
+                        file in place, False if the title can't be rewritten        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _format_task(task: list)                                    |   -> str
+                                                                                    |
+        Usage:          ScrumbanHistory._format_task(list)                          |
+                                                                                    |
+        Description:    Static method that returns the line of a task in the        |
+                        backlog and completed tasks files                           |
         ----------------------------------------------------------------------------|-------------------------------------------------
 
 
         Public:                                                                      Return:
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    check_history(self)                                         |   -> True if data is found
+        Declaration:    check_history(self, create: bool)                           |   -> True if data is found
                                                                                     |      False if no data found
-        Usage:          instance.check_history()                                    |
+        Usage:          instance.check_history(True)                                |
                                                                                     |
         Description:    Checks if there is system data already stored.              |
                         If True, return True                                        |
-                        If False, return False and create system data directory     |
+                        If False, return False and create the empty task files      |
+                        if create is True                                           |
         ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    reset_system(self)                                          |   -> None
                                                                                     |
@@ -156,13 +276,19 @@ class ScrumbanHistory():
         Description:    Resets the system data by deleting                          |
                         the system data directory                                   |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    check_valid_task_file(self, file_path: str)                 |   -> True if valid format
-                                                                                    |      False if invalid format
+        Declaration:    check_valid_task_file(self, file_path: str)                 |   -> "VALID" if valid format
+                                                                                    |      the errors if invalid format
         Usage:          instance.check_valid_task_file(str)                         |
                                                                                     |
-        Description:    Static method that validates task files using regex         |
-                        Opens the file whose path is stored in file_path and        |
-                        validates it                                                |
+        Description:    Validates every line of a task file using regex and keeps   |
+                        the parsed rows so loading doesn't read the file again      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    read_project_backlog_file(self)                             |   -> list of lists of strings, None if
+                                                                                    |      the file is missing or invalid
+        Usage:          instance.read_project_backlog_file()                        |
+                                                                                    |
+        Description:    Reads and validates the project backlog file as it is now   |
+                        without changing the project_backlog attribute              |
         ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    set_project_backlog_path(self, path: str)                   |   -> None
                                                                                     |
@@ -170,13 +296,12 @@ class ScrumbanHistory():
                                                                                     |
         Description:    sets the class attribute project_backlog_path to be path    |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    check_valid_member_file(file_path: str)                     |   -> True if valid format
-                                                                                    |      False if invalid format
+        Declaration:    check_valid_member_file(self, file_path: str)               |   -> "VALID" if valid format
+                                                                                    |      the errors if invalid format
         Usage:          instance.check_valid_member_file(str)                       |
                                                                                     |
-        Description:    Static method that validates member file using regex        |
-                        Opens the file whose path is stored in file_path and        |
-                        validates it                                                |
+        Description:    Validates every line of a member file using regex and keeps |
+                        the parsed rows so loading doesn't read the file again      |
         ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    set_members_path(self, path: str)                           |   -> None
                                                                                     |
@@ -210,6 +335,13 @@ class ScrumbanHistory():
                         self.todo_backlog_path                                      |
                         self.completed_tasks_path                                   |
         ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    upgrade_files(self)                                         |   -> list of the paths of the upgraded files
+                                                                                    |
+        Usage:          instance.upgrade_files()                                    |
+                                                                                    |
+        Description:    Upgrades each saved file in an older format to the current  |
+                        version, a line at a time                                   |
+        ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    load_agenda(self)                                           |   -> None
                                                                                     |
         Usage:          instance.load_agenda()                                      |
@@ -217,6 +349,20 @@ class ScrumbanHistory():
         Description:    Reads in data from self.agenda_path and assigns             |
                         it to self.agenda                                           |
         ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    archive_completed_tasks(self, archive: CompletedArchive,    |   -> int of the tasks archived
+                                                max_age_days: int)                  |
+        Usage:          instance.archive_completed_tasks(archive, 90)               |
+                                                                                    |
+        Description:    Moves the completed tasks older than max_age_days from      |
+                        self.completed_tasks_path into the archive                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    load_completed_tasks(self)                                  |   -> None
+                                                                                    |
+        Usage:          instance.load_completed_tasks()                             |
+                                                                                    |
+        Description:    Maps self.completed_tasks_path into self.completed_tasks    |
+                        again, for a board that didn't come from load_scrumban      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    load_scrumban(self)                                         |   -> None
                                                                                     |
         Usage:          instance.load_scrumban()                                    |
@@ -235,6 +381,8 @@ class ScrumbanHistory():
                         self.todo_backlog                                           |
                         self.completed_tasks                                        |
                         self.agenda                                                 |
+                                                                                    |
+                        Reads up to self.load_threads files at the same time        |
         ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    get_work_in_progress_limit(self)                            |   -> int that represents the
                                                                                     |      work in progress limit
@@ -320,11 +468,59 @@ class ScrumbanHistory():
                                                                                     |
         Description:    sets the general_notes attribute to general_notes           |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    load_scrumban(self)                                         |   -> None
+        Declaration:    set_load_threads(self, load_threads:int)                    |   -> None
                                                                                     |
-        Usage:          instance.load_scrumban()                                    |
+        Usage:          instance.set_load_threads(4)                                |
+                                                                                    |
+        Description:    sets the load_threads attribute to load_threads             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_meeting_store(self, meetings: MeetingStore)             |   -> None
+                                                                                    |
+        Usage:          instance.set_meeting_store(MeetingStore())                  |
+                                                                                    |
+        Description:    sets the meetings attribute to meetings                     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_data_lock(self, lock: DataLock)                         |   -> None
+                                                                                    |
+        Usage:          instance.set_data_lock(DataLock())                          |
                                                                                     |
-        Description:    Saves the data from:                                        |
+        Description:    sets the lock attribute to lock                             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_data_files(self)                                        |   -> list[str]
+                                                                                    |
+        Usage:          instance.get_data_files()                                   |
+                                                                                    |
+        Description:    returns the paths of the files the board is saved to        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_queued_days(self)                                       |   -> dict[str, int]
+                                                                                    |
+        Usage:          instance.get_queued_days()                                  |
+                                                                                    |
+        Description:    returns the queued_days attribute                           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_queued_days(self, queued_days:dict)                     |   -> None
+                                                                                    |
+        Usage:          instance.set_queued_days(dict)                              |
+                                                                                    |
+        Description:    sets the queued_days attribute to queued_days               |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_at_risk_tasks(self, at_risk_tasks:list)                 |   -> None
+                                                                                    |
+        Usage:          instance.set_at_risk_tasks(list)                            |
+                                                                                    |
+        Description:    sets the at_risk_tasks attribute to at_risk_tasks           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_completed_counts(self, completed_counts:list)           |   -> None
+                                                                                    |
+        Usage:          instance.set_completed_counts(list)                         |
+                                                                                    |
+        Description:    sets the completed_counts attribute to completed_counts     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    save_scrumban(self, parts: set = None)                      |   -> list[str] of the files that
+                                                                                    |      were skipped
+        Usage:          instance.save_scrumban({"todo", "member"})                  |
+                                                                                    |
+        Description:    Saves the data of the changed parts of the board from:      |
                         Files that are written to:                                  |
                         self.project_backlog_path                                   |
                         self.members_path                                           |
@@ -401,7 +597,7 @@ class ScrumbanHistory():
         # set the todo_backlog
         self.todo_backlog = todo_backlog
         # set the completed_tasks
-        self.completed_tasks = completed_tasks
+        self.set_completed_tasks(completed_tasks)
         # set the agenda
         self.agenda = agenda
 
@@ -413,12 +609,40 @@ class ScrumbanHistory():
         # set the general_notes
         self.general_notes = general_notes
 
+        # the overdue and soon due tasks are only known once the board is built
+        self.at_risk_tasks = []
+
+        # the completed task counts are only known once the board is built
+        self.completed_counts = []
+
+        # the day each project backlog task was queued, read from .sys_data
+        self.queued_days = {}
+
+        # the completed tasks already in the completed_tasks file and the file's size,
+        # so a save only appends the tasks completed since
+        self._completed_written = CompletedRows()
+        self._completed_size = None
+        self._completed_appended_from = None
+
+        # the user files parsed while they were validated
+        self._parsed_files = {}
+
+        # how many files load_scrumban reads at once
+        self.load_threads = 1
+
+        # the history of the files saved at each meeting, kept if set
+        self.meetings = None
+
+        # the lock over the files shared with other copies of the system, if set
+        self.lock = None
+
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
 
-    def check_history(self) -> bool:
+    def check_history(self, create: bool = True) -> bool:
         """
-        Parameter:      N/A
+        Parameter:      create - False to only check, as a read only copy
+                        doesn't create any files
 
         Called By:      startup - VSS.py
 
@@ -429,12 +653,19 @@ class ScrumbanHistory():
         Return:         boolean - True if sys_data does exist, False if sys_data
                         does not exist
 
-        Description:    Check if the sys_data directory exists and create files
+        Description:    Check if the system data has been saved and create files.
+                        The .sys_data directory is made as soon as the first
+                        files are loaded, but the system data is only saved
+                        at the end of the first meeting, so the project isn't
+                        set up until the sys_data file exists.
         """
-        # check if the sys_data directory exists
-        if ".sys_data" in listdir():
+        # check if the sys_data file exists
+        if path.isfile(".sys_data/sys_data.txt"):
             # if it does return True
             return True
+        # a read only copy leaves the files to the writer setting the project up
+        if not create:
+            return False
         # if not create the completed_tasks_path file
         completed = open(self.completed_tasks_path, "w")
         # close the file
@@ -456,7 +687,8 @@ class ScrumbanHistory():
 
         Called By:      startup - VSS.py
 
-        Calls:          None
+        Calls:          _data_lock
+                        write(), commit() - ScrumbanWriter.py
 
         Modifies:       None
 
@@ -466,28 +698,28 @@ class ScrumbanHistory():
                         order to later load the work_in_progress_limit,
                         todo_limit, project_backlog_path, and members_path
         """
-        # set the work in progress limit
-        self.work_in_progress_limit = work_in_progress_limit
-        # set the todo limit
-        self.todo_limit = todo_limit
-        # grab the current working directory
-        cwd = getcwd()
-        # create the absolute path for the .sys_data directory
-        sys_dir = cwd + "/.sys_data"
-        # check that the directory does not already exist
-        if ".sys_data" not in listdir():
-            # create the directory
-            mkdir(sys_dir)
-        # open the sys_data file
-        with open(sys_dir + "/sys_data.txt", "w") as sys_data:
-            # write the work in progress limit to the file
-            sys_data.write(f"{str(self.work_in_progress_limit)}\n")
-            # write the todo limit to the file
-            sys_data.write(f"{str(todo_limit)}\n")
-            # write the project_backlog_path to the file
-            sys_data.write(f"{str(self.project_backlog_path)}\n")
-            # write the members_path to the file
-            sys_data.write(f"{str(self.members_path)}\n")
+        # no other copy reads or writes the files until the save is done
+        with self._data_lock(True):
+            # set the work in progress limit
+            self.work_in_progress_limit = work_in_progress_limit
+            # set the todo limit
+            self.todo_limit = todo_limit
+            # grab the current working directory
+            cwd = getcwd()
+            # create the absolute path for the .sys_data directory
+            sys_dir = cwd + "/.sys_data"
+            # check that the directory does not already exist
+            if ".sys_data" not in listdir():
+                # create the directory
+                mkdir(sys_dir)
+            # writer: the sys_data file is replaced in one step
+            writer = BatchWriter()
+            # write the work in progress limit, the todo limit, the project_backlog_path
+            # and the members_path to the file
+            writer.write(sys_dir + "/sys_data.txt", format_header("sys_data") +
+                                                    f"{str(self.work_in_progress_limit)}\n{str(todo_limit)}\n"
+                                                    f"{str(self.project_backlog_path)}\n{str(self.members_path)}\n")
+            writer.commit()
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -515,6 +747,9 @@ class ScrumbanHistory():
         with open(".sys_data/sys_data.txt", "r") as sys_data:
             # read the file
             sys_data_list = sys_data.readlines()
+            # the lines are counted from after the version header
+            if sys_data_list and is_header(sys_data_list[0]):
+                sys_data_list = sys_data_list[1:]
             # set the work_in_progress_limit attribute
             self.work_in_progress_limit = int(sys_data_list[0])
             # set the todo_limit attribute
@@ -527,13 +762,45 @@ class ScrumbanHistory():
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
 
+    def upgrade_files(self) -> list:
+        """
+        Parameter:      N/A
+
+        Called By:      startup - VSS.py
+
+        Calls:          migrate_files() - ScrumbanSchema.py
+
+        Modifies:       the saved files
+
+        Return:         list[str] - the paths of the files that were upgraded
+
+        Description:    Upgrades every saved file written in an older format,
+                        including the files saved before the formats had a
+                        version, so the loaders only read the current formats.
+                        Each file is streamed into a temporary file and moved
+                        into place, so even a very large completed tasks file
+                        is upgraded in constant memory. Called after
+                        read_system_data, which reads every version of the
+                        system data, so the paths of the other files are known.
+                        The project backlog and members files the user gave
+                        are left alone until the system has saved them.
+        """
+        # files: the path and kind of each file the system saves
+        files = [(".sys_data/sys_data.txt", "sys_data"), (".sys_data/queued_days.txt", "queued_days"),
+                 (self.project_backlog_path, "project_backlog"), (self.members_path, "members"),
+                 (self.todo_backlog_path, "todo_backlog"), (self.completed_tasks_path, "completed_tasks")]
+        return migrate_files([(file_path, kind) for file_path, kind in files if file_path != ""])
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
     def reset_system(self) -> None:
         """
         Parameter:      N/A
 
         Called By:      startup - VSS.py
 
-        Calls:          None
+        Calls:          _data_lock
 
         Modifies:       None
 
@@ -542,71 +809,149 @@ class ScrumbanHistory():
         Description:    Deletes the .sys_data/ directory, in turn
                         resetting the system.
         """
-        # check that the is sys_data
-        if ".sys_data" in listdir():
-            # remove the sys_data directory, resetting the system
-            rmtree(".sys_data")
+        # no other copy reads or writes the files while they are removed
+        with self._data_lock(True):
+            # check that the is sys_data
+            if ".sys_data" in listdir():
+                # remove the sys_data directory, resetting the system
+                rmtree(".sys_data")
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
 
     @staticmethod
-    def check_valid_task_file(file_path:str) -> str:
+    def _read_lines(file_path: str):
         """
-        Parameter:      file_path - the absolute path of the tasks file
+        Parameter:      file_path - the path of the file
 
-        Called By:      startup - VSS.py
+        Called By:      _stream_rows, _parse_file - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          mmap.readline()
 
         Modifies:       None
 
-        Return:         str - represents the error message or "VALID" if valid
+        Return:         iterator[(int, str)] - each line number and line without
+                        its line ending
 
-        Description:    Checks that the tasks file is in the correct format
-                        specified in the SRS (using regex)
+        Description:    Reads the file once. Small files are read whole, large
+                        files are mapped into memory and read a line at a time
+                        so they are never copied in one piece. Raises
+                        UnicodeDecodeError if the file isn't text.
         """
-        # check if the file is empty
-        if path.getsize(file_path) == 0:
-            # return the error
-            return "File is empty"
-        # try the file encoding
-        try:
-            # open the file
-            with open(file_path, "r") as f:
+        # open the file in binary so it can be mapped
+        with open(file_path, "rb") as f:
+            # small file, read it in one call
+            if path.getsize(file_path) < mmap_threshold:
                 # go through each line of the file
-                for i, line in enumerate(f):
-                    # check the regex pattern against the line
-                    if not search(r"^[A-z0-9\s-]+,\s*[0-9]+,\s*[0-9]+/[0-9]+/[0-9]+\s*\n$", line):
-                        # return the error message and the line number
-                        return f"Error on line {i + 1} in project backlog"
-                    # return that it was valid
-                    return "VALID"
-        # incorrect file encoding
-        except UnicodeDecodeError:
-            # return the error
-            return "Invalid File Encoding For Project Backlog"
-        # should never make it here
-        return "WILL NEVER MAKE IT HERE UNLESS FATAL ERROR"
+                for i, line in enumerate(f.read().decode().splitlines()):
+                    yield i + 1, line
+                return
+            # large file, read each line straight out of the mapping
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as mapped:
+                # i: the line number of the next line
+                i = 1
+                # line: each line of the file, empty once the end is reached
+                for line in iter(mapped.readline, b""):
+                    yield i, line.decode().rstrip("\r\n")
+                    i += 1
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
 
     @staticmethod
-    def check_valid_member_file(file_path: str) -> str:
+    def _stream_rows(file_path: str):
         """
-        Parameter:      file_path - the absolute path of the members file
+        Parameter:      file_path - the path of the file
 
-        Called By:      startup - VSS.py
+        Called By:      _parsed_rows, _load_todo_backlog - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _read_lines
 
         Modifies:       None
 
-        Return:         str - represents the error message or "VALID" if valid
+        Return:         iterator[list[str]] - the fields of each line with
+                        whitespace stripped
+
+        Description:    Splits the lines of the file as they are read, so its
+                        rows are never held in a list. Blank lines and the
+                        version header are skipped. The file is only opened
+                        once the rows are read, but a missing file raises
+                        OSError here, while it is being loaded.
+        """
+        # raise for a missing file now rather than when the board reads it
+        path.getsize(file_path)
+        # the fields of each line that isn't blank or the version header
+        return ([field.strip() for field in line.split(",")]
+                for i, line in ScrumbanHistory._read_lines(file_path)
+                if line.strip() != "" and not (i == 1 and is_header(line)))
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    @staticmethod
+    def _parse_file(file_path: str, pattern, file_name: str) -> tuple:
+        """
+        Parameter:      file_path - the path of the file
+                        pattern - the compiled pattern every line must match,
+                        None to skip validation
+                        file_name - how the file is named in the error messages
+
+        Called By:      check_valid_task_file, check_valid_member_file,
+                        _parsed_rows - ScrumbanHistory.py
+
+        Calls:          _read_lines
+
+        Modifies:       None
+
+        Return:         (list[list[str]], list[str]) - the fields of each line
+                        with whitespace stripped, and an error for each line
+                        that doesn't match pattern
+
+        Description:    Validates and splits the lines of the file in a single
+                        pass. Blank lines are skipped. A priority the pattern
+                        matches must also fit in the completed priority column.
+        """
+        # rows: the fields of each line
+        rows = []
+        # errors: the error of each invalid line
+        errors = []
+        # go through each line of the file
+        for i, line in ScrumbanHistory._read_lines(file_path):
+            # skip blank lines and the version header
+            if line.strip() == "" or (i == 1 and is_header(line)):
+                continue
+            # check the pattern against the line
+            if pattern is not None:
+                match = pattern.match(line)
+                # a priority too big for the priority column is as invalid as a malformed line
+                if match is None or int(match.groupdict().get("priority") or 0) not in priority_range:
+                    # record the error message and the line number
+                    errors.append(f"Error on line {i} in {file_name}")
+                    continue
+            # split the line into fields and strip the whitespace from each
+            rows.append([field.strip() for field in line.split(",")])
+        return rows, errors
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
 
-        Description:    Checks that the members file is in the correct format
-                        specified in the SRS (using regex)
+    def _check_valid_file(self, file_path: str, pattern, file_name: str, encoding_error: str) -> str:
+        """
+        Parameter:      file_path - the absolute path of the file
+                        pattern - the compiled pattern every line must match
+                        file_name - how the file is named in the error messages
+                        encoding_error - the error if the file isn't text
+
+        Called By:      check_valid_task_file, check_valid_member_file - ScrumbanHistory.py
+
+        Calls:          _parse_file
+
+        Modifies:       self._parsed_files
+
+        Return:         str - represents the error messages or "VALID" if valid
+
+        Description:    Validates every line of the file and keeps the parsed
+                        rows of a valid file for loading
         """
         # check if the file is empty
         if path.getsize(file_path) == 0:
@@ -614,22 +959,118 @@ class ScrumbanHistory():
             return "File is empty"
         # try the file encoding
         try:
-            # open the file
-            with open(file_path, "r") as f:
-                # go through each line of the file
-                for i, line in enumerate(f):
-                    # check the regex pattern against the line
-                    if not search(r"^[A-z\s-]+,\s*[A-z0-9-.]+@[A-z0-9.]+\n$", line):
-                        # return the error message and the line number
-                        return f"Error on line {i + 1} in members file"
-                    # return that it was valid
-                    return "VALID"
+            rows, errors = self._parse_file(file_path, pattern, file_name)
         # incorrect file encoding
         except UnicodeDecodeError:
             # return the error
-            return "Invalid File Encoding For Member File"
-        # should never make it here
-        return "WILL NEVER MAKE IT HERE UNLESS FATAL ERROR"
+            return encoding_error
+        # list the first errors and how many more there are
+        if errors:
+            if len(errors) > max_reported_errors:
+                errors = errors[:max_reported_errors] + [f"and {len(errors) - max_reported_errors} more"]
+            return "\n".join(errors)
+        # keep the rows for as long as the file doesn't change
+        status = path.getsize(file_path), path.getmtime(file_path)
+        self._parsed_files[file_path] = (status, rows)
+        # return that it was valid
+        return "VALID"
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def check_valid_task_file(self, file_path:str) -> str:
+        """
+        Parameter:      file_path - the absolute path of the tasks file
+
+        Called By:      startup - VSS.py
+
+        Calls:          _check_valid_file
+
+        Modifies:       self._parsed_files
+
+        Return:         str - represents the error messages or "VALID" if valid
+
+        Description:    Checks that every line of the tasks file is in the
+                        correct format specified in the SRS (using regex)
+        """
+        return self._check_valid_file(file_path, task_line_pattern, "project backlog",
+                                      "Invalid File Encoding For Project Backlog")
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def read_project_backlog_file(self):
+        """
+        Parameter:      N/A
+
+        Called By:      _poll - ScrumbanWatcher.py
+
+        Calls:          _data_lock, _parse_file
+
+        Modifies:       None
+
+        Return:         list[list[str]] - the fields of each task in the file,
+                        None if the file is missing or any line is invalid
+
+        Description:    Reads the project backlog file with every line checked
+                        against the SRS format. A file being edited can be
+                        half written, so it is only used once it is all valid.
+        """
+        # the file isn't read while another copy is saving it
+        with self._data_lock(False):
+            try:
+                rows, errors = self._parse_file(self.project_backlog_path, task_line_pattern, "project backlog")
+            except (OSError, UnicodeDecodeError):
+                return None
+            return None if errors else rows
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def check_valid_member_file(self, file_path: str) -> str:
+        """
+        Parameter:      file_path - the absolute path of the members file
+
+        Called By:      startup - VSS.py
+
+        Calls:          _check_valid_file
+
+        Modifies:       self._parsed_files
+
+        Return:         str - represents the error messages or "VALID" if valid
+
+        Description:    Checks that every line of the members file is in the
+                        correct format specified in the SRS (using regex)
+        """
+        return self._check_valid_file(file_path, member_line_pattern, "members file",
+                                      "Invalid File Encoding For Member File")
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _parsed_rows(self, file_path: str):
+        """
+        Parameter:      file_path - the path of a project backlog or members file
+
+        Called By:      _load_project_backlog, _load_members - ScrumbanHistory.py
+
+        Calls:          _stream_rows
+
+        Modifies:       self._parsed_files
+
+        Return:         iterable[list[str]] - the fields of each line of the file
+
+        Description:    Returns the rows parsed when the file was validated if
+                        it hasn't changed since, otherwise streams them from
+                        the file without validating, as the system writes
+                        tasks into the members file that the SRS format doesn't
+                        allow
+        """
+        # the rows are only used once
+        status, rows = self._parsed_files.pop(file_path, (None, None))
+        if status == (path.getsize(file_path), path.getmtime(file_path)):
+            return rows
+        return self._stream_rows(file_path)
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -640,35 +1081,24 @@ class ScrumbanHistory():
 
         Called By:      load_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _parsed_rows
 
         Modifies:       self.project_backlog
 
         Return:         None
 
         Description:    Loads the contents of the project backlog file from the
-                        project_backlog_path into the project_backlog attribute
+                        project_backlog_path into the project_backlog attribute.
+                        The tasks are streamed to the board as it reads them,
+                        with more than one load thread they are read here.
         """
         # check that the project_backlog_path file exists
         if self.project_backlog_path != "":
-            # open the project backlog file
-            with open(self.project_backlog_path, "r") as project_backlog:
-                # go through each task
-                for task in project_backlog:
-                    # add the task to the project_backlog attribute
-                    self.project_backlog.append(task.strip().split(","))
-            # loop through each task
-            for i, task in enumerate(self.project_backlog):
-                # check if it is a blank task
-                if task == ['']:
-                    # remove the blank task
-                    self.project_backlog.pop(i)
-                    # skip the blank task
-                    continue
-                # loop through each field of the task
-                for j in range(len(task)):
-                    # strip the whitespace from each field
-                    task[j] = task[j].strip()
+            # the tasks with blank lines skipped and the whitespace stripped from each field
+            self.project_backlog = self._parsed_rows(self.project_backlog_path)
+            # read the file on this load thread rather than on the board's
+            if self.load_threads > 1:
+                self.project_backlog = list(self.project_backlog)
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -679,41 +1109,27 @@ class ScrumbanHistory():
 
         Called By:      load_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _parsed_rows
 
         Modifies:       self.members
 
         Return:         None
 
         Description:    Loads the contents of the members file from the
-                        members_path into the members attribute
+                        members_path into the members attribute. Each member
+                        is completed as the board reads it, with more than one
+                        load thread they are read here.
         """
         # check that the members_path file exists
         if self.members_path != "":
-            # open the members file
-            with open(self.members_path, "r") as members:
-                # loop through the members file
-                for member in members:
-                    # add each member to the members attribute
-                    self.members.append(member.strip().split(","))
-            # loop through each member
-            for i, member in enumerate(self.members):
-                # if the member does not exist
-                if member == ['']:
-                    # remove the member
-                    self.members.pop(i)
-                    # skip to the next member
-                    continue
-                # go through each field of the member
-                for j in range(len(member)):
-                    # strip the whitespace from the field
-                    member[j] = member[j].strip()
-                # if the member has no tasks
-                if len(member) == 2:
-                    # add an extra blank string
-                    member.append("")
-                # add the blank questions and concerns field (start of the meeting)
-                member.append("")
+            # the members with blank lines skipped and the whitespace stripped from each field,
+            # a blank tasks field for a member with no tasks and the blank questions and
+            # concerns field (start of the meeting)
+            self.members = (member + [""] * (3 - len(member)) + [""]
+                            for member in self._parsed_rows(self.members_path))
+            # read the file on this load thread rather than on the board's
+            if self.load_threads > 1:
+                self.members = list(self.members)
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -724,29 +1140,24 @@ class ScrumbanHistory():
 
         Called By:      load_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _stream_rows
 
         Modifies:       self.todo_backlog
 
         Return:         None
 
         Description:    Loads the todo backlog tasks from the file at
-                        todo_backlog_path into the todo_backlog attribute
+                        todo_backlog_path into the todo_backlog attribute. The
+                        tasks are streamed to the board as it reads them, with
+                        more than one load thread they are read here.
         """
         # checks that the todo_backlog_path file exists
         if self.todo_backlog_path != "":
-            # open the todo_backlog_path file
-            with open(self.todo_backlog_path, "r") as todo_log:
-                # loop through the tasks
-                for task in todo_log:
-                    # add the tasks to the todo_backlog attribute
-                    self.todo_backlog.append(task.strip().split(","))
-            # go through each of the tasks
-            for task in self.todo_backlog:
-                # go through the fields of the tasks
-                for i in range(len(task)):
-                    # strip the whitespace
-                    task[i] = task[i].strip()
+            # the tasks with blank lines skipped and the whitespace stripped from each field
+            self.todo_backlog = self._stream_rows(self.todo_backlog_path)
+            # read the file on this load thread rather than on the board's
+            if self.load_threads > 1:
+                self.todo_backlog = list(self.todo_backlog)
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -757,33 +1168,112 @@ class ScrumbanHistory():
 
         Called By:      load_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          CompletedFile - ScrumbanCompleted.py
 
         Modifies:       self.completed_tasks
+                        self._completed_written
+                        self._completed_size
 
         Return:         None
 
-        Description:    Loads the completed tasks from the file at
-                        completed_tasks_path into the completed_tasks attribute
+        Description:    Maps the completed tasks file at completed_tasks_path
+                        and its index into the completed_tasks attribute. The
+                        tasks are paged from the file as they are read, so
+                        they don't have to fit in memory.
         """
         # checks that the completed_tasks_path file exists
         if self.completed_tasks_path != "":
-            # open the completed_tasks_path file
-            with open(self.completed_tasks_path, "r") as completed_tasks:
-                # skip title
-                completed_tasks.readline()
-                # skip headers
-                completed_tasks.readline()
-                # loop through the tasks
-                for task in completed_tasks:
-                    # add the tasks to the completed_tasks attribute
-                    self.completed_tasks.append(task.strip().split(","))
-            # go through each of the tasks
-            for task in self.completed_tasks:
-                # go through the fields of the tasks
-                for i in range(len(task)):
-                    # strip the whitespace
-                    task[i] = task[i].strip()
+            # every row after the title and the headers, left in the file
+            completed_file = CompletedFile(self.completed_tasks_path)
+            self.completed_tasks = CompletedRows(completed_file, len(completed_file))
+            # remember what the file holds so the next save can append to it
+            self._completed_written = self.completed_tasks
+            self._completed_size = path.getsize(self.completed_tasks_path)
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def archive_completed_tasks(self, archive, max_age_days: int) -> int:
+        """
+        Parameter:      archive - the CompletedArchive the old tasks are moved to
+                        max_age_days - how many days a completed task stays in
+                        the completed tasks file
+
+        Called By:      startup - VSS.py
+
+        Calls:          _format_task
+                        CompletedFile - ScrumbanCompleted.py
+                        add() - ScrumbanArchive.py
+                        write(), commit() - ScrumbanWriter.py
+
+        Modifies:       the completed tasks file
+                        the archive
+
+        Return:         int - the number of tasks archived
+
+        Description: Moves the tasks at the start of the completed tasks file
+                     that were completed more than max_age_days ago into the
+                     archive and rewrites the file with the rest. Tasks are
+                     completed onto the end of the file, so the old ones are
+                     at its start and only they are read. The archive is
+                     flushed before the file is replaced, so a crash in between
+                     leaves the tasks in both, never in neither.
+        """
+        # check that the completed_tasks_path file exists
+        if self.completed_tasks_path == "" or not path.exists(self.completed_tasks_path):
+            return 0
+
+        # cutoff: the first day whose completed tasks stay in the file
+        cutoff = date.today().toordinal() - max_age_days
+        completed_file = CompletedFile(self.completed_tasks_path)
+
+        # old: how many tasks at the start of the file were completed before the cutoff
+        old = 0
+        for task in completed_file.iter_rows():
+            done = parse_date(task[3]) if len(task) > 3 else 0
+            # stop at the first recent task, or one without a real completion day
+            if isinstance(done, str) or done == 0 or done >= cutoff:
+                break
+            old += 1
+
+        # nothing to archive
+        if old == 0:
+            return 0
+
+        archive.add(completed_file.iter_rows(0, old))
+
+        # the version, the title, the headers and each task that stays
+        writer = BatchWriter()
+        writer.write(self.completed_tasks_path,
+                     format_header("completed_tasks") +
+                     f"Completed Tasks as of {date.today()}\n"
+                     "Task Name, Task Priority, Due Date, Completion Date\n"
+                     + "".join(self._format_task(task) for task in completed_file.iter_rows(old)))
+        writer.commit()
+        return old
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def load_completed_tasks(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      startup - VSS.py
+
+        Calls:          _load_completed_tasks
+
+        Modifies:       self.completed_tasks
+                        self._completed_written
+                        self._completed_size
+
+        Return:         None
+
+        Description: Maps the completed tasks file on its own, so a board kept
+                     in the boot snapshot can page its completed tasks from the
+                     file and later saves append to it
+        """
+        self._load_completed_tasks()
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -798,24 +1288,100 @@ class ScrumbanHistory():
                         _load_todo_backlog
                         _load_members
                         _load_completed_tasks
+                        _load_queued_days
 
         Modifies:       self.project_backlog
                         self.todo_backlog
                         self.members
                         self.completed_tasks
+                        self.queued_days
 
         Return:         None
 
-        Description: Calls private methods to load data in from files
+        Description: Calls private methods to load data in from files. Each
+                     method reads its own file into its own attribute, so with
+                     more than one load thread they run at the same time and
+                     the load takes as long as the slowest file. The results
+                     are collected in the order below, so the first error in
+                     that order is the one raised, as when run one by one.
+        """
+        # loaders: load project backlog, members, todo backlog, completed tasks
+        # and the days the project backlog tasks were queued
+        loaders = [self._load_project_backlog, self._load_members, self._load_todo_backlog,
+                   self._load_completed_tasks, self._load_queued_days]
+
+        # one after another
+        if self.load_threads <= 1:
+            for loader in loaders:
+                loader()
+            return
+
+        # all at once, waiting for each in order
+        with ThreadPoolExecutor(max_workers=min(self.load_threads, len(loaders))) as pool:
+            futures = [pool.submit(loader) for loader in loaders]
+            for future in futures:
+                future.result()
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _load_queued_days(self) -> None:
         """
-        # load project backlog
-        self._load_project_backlog()
-        # load members
-        self._load_members()
-        # load todo backlog
-        self._load_todo_backlog()
-        # load completed tasks
-        self._load_completed_tasks()
+        Parameter:      N/A
+
+        Called By:      load_scrumban - ScrumbanHistory.py
+
+        Calls:          None
+
+        Modifies:       self.queued_days
+
+        Return:         None
+
+        Description: Loads the day each project backlog task was first queued
+                     from .sys_data/queued_days.txt, one "name<tab>day ordinal"
+                     per line. A missing file means no task has aged yet.
+        """
+        # reset the attribute
+        self.queued_days = {}
+        # check that the file has been written
+        if not path.exists(".sys_data/queued_days.txt"):
+            return
+        # open the file
+        with open(".sys_data/queued_days.txt", "r") as queued_days:
+            # go through each line of the file
+            for line in queued_days:
+                # skip the version header
+                if is_header(line):
+                    continue
+                # split the name from the day
+                fields = line.rstrip("\n").rsplit("\t", 1)
+                # skip anything that isn't a name and a day
+                if len(fields) == 2 and fields[1].isdigit():
+                    self.queued_days[fields[0]] = int(fields[1])
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _save_queued_days(self, writer: BatchWriter) -> None:
+        """
+        Parameter:      writer - the batch the file is written in
+
+        Called By:      save_scrumban - ScrumbanHistory.py
+
+        Calls:          write() - ScrumbanWriter.py
+
+        Modifies:       None
+
+        Return:         None
+
+        Description: Saves the queued_days attribute to .sys_data/queued_days.txt
+        """
+        # the file lives with the rest of the system data
+        if ".sys_data" not in listdir():
+            return
+        # one "name<tab>day" line for each task name and day
+        writer.write(".sys_data/queued_days.txt", format_header("queued_days") +
+                     "".join(f"{name}\t{day}\n" for name, day in self.queued_days.items()))
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -846,13 +1412,14 @@ class ScrumbanHistory():
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
 
-    def _save_project_backlog(self) -> None:
+    def _save_project_backlog(self, writer: BatchWriter) -> None:
         """
-        Parameter:      N/A
+        Parameter:      writer - the batch the file is written in
 
         Called By:      save_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _format_task
+                        write() - ScrumbanWriter.py
 
         Modifies:       None
 
@@ -863,37 +1430,20 @@ class ScrumbanHistory():
         """
         # check if there is a project_backlog file in existence
         if self.project_backlog_path != "":
-            # open the file
-            with open(self.project_backlog_path, "w") as project_backlog:
-                # go through each task in the completed_tasks attribute
-                for task in self.project_backlog:
-                    # go through each field for the task
-                    for i in range(len(task)):
-                        # if there is a blank
-                        if task[i] == "":
-                            # skip it
-                            continue
-                        # if the first field
-                        elif i == 0:
-                            # write the task
-                            project_backlog.write(f"{task[i].strip()}")
-                        # if not the first field
-                        else:
-                            # write the task
-                            project_backlog.write(f", {task[i].strip()}")
-                    # write a new line
-                    project_backlog.write("\n")
-
-    # ------------------------------------------------------------------------ #
-    # ------------------------------------------------------------------------ #
-
-    def _save_members(self) -> None:
+            # the version header and one line for each task in the project_backlog attribute
+            writer.write(self.project_backlog_path, format_header("project_backlog") +
+                         "".join(self._format_task(task) for task in self.project_backlog))
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _save_members(self, writer: BatchWriter) -> None:
         """
-        Parameter:      N/A
+        Parameter:      writer - the batch the file is written in
 
         Called By:      save_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          write() - ScrumbanWriter.py
 
         Modifies:       None
 
@@ -904,32 +1454,30 @@ class ScrumbanHistory():
         """
         # check if the members file is in existence
         if self.members_path != "":
-            # load the data into the class from the file
-            with open(self.members_path, "w") as members:
-                # go through each member
-                for member in self.members:
-                    # write the members name
-                    members.write(f"{member[0].strip()}, ")
-                    # if the member does not have any tasks
-                    if member[2] == "":
-                        # only write the email
-                        members.write(f"{member[1].strip()}\n")
-                    else:
-                        # write the member's tasks
-                        members.write(f"{member[1].strip()}, ")
-                        # write the email
-                        members.write(f"{member[2]}\n")
+            # lines: the version header and the line of each member
+            lines = [format_header("members")]
+            # go through each member
+            for member in self.members:
+                # if the member does not have any tasks
+                if member[2] == "":
+                    # only write the name and email
+                    lines.append(f"{member[0].strip()}, {member[1].strip()}\n")
+                else:
+                    # write the name, the email and the member's tasks
+                    lines.append(f"{member[0].strip()}, {member[1].strip()}, {member[2]}\n")
+            writer.write(self.members_path, "".join(lines))
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
 
-    def _save_todo_backlog(self) -> None:
+    def _save_todo_backlog(self, writer: BatchWriter) -> None:
         """
-        Parameter:      N/A
+        Parameter:      writer - the batch the file is written in
 
         Called By:      save_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _format_task
+                        write() - ScrumbanWriter.py
 
         Modifies:       None
 
@@ -940,109 +1488,262 @@ class ScrumbanHistory():
         """
         # check if there is a todo backlog file in existence
         if self.todo_backlog_path != "":
-            # open the file
-            with open(self.todo_backlog_path, "w") as todo_log:
-                # go through each task in the completed_tasks attribute
-                for task in self.todo_backlog:
-                    # go through each field for the task
-                    for i in range(len(task)):
-                        # if there is a blank
-                        if task[i] == "":
-                            # skip it
-                            continue
-                        # if the first field
-                        elif i == 0:
-                            # write the task
-                            todo_log.write(f"{task[i].strip()}")
-                        # if not the first field
-                        else:
-                            # write the task
-                            todo_log.write(f", {task[i].strip()}")
-                    # write a new line
-                    todo_log.write("\n")
-
-    # ------------------------------------------------------------------------ #
-    # ------------------------------------------------------------------------ #
-
-    def _save_completed_tasks(self) -> None:
+            # the version header and one line for each task in the todo_backlog attribute
+            writer.write(self.todo_backlog_path, format_header("todo_backlog") +
+                         "".join(self._format_task(task) for task in self.todo_backlog))
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _save_completed_tasks(self, writer: BatchWriter) -> None:
         """
-        Parameter:      N/A
+        Parameter:      writer - the batch the file is written in
 
         Called By:      save_scrumban - ScrumbanHistory.py
 
-        Calls:          None
+        Calls:          _update_completed_title
+                        _format_task
+                        write(), append() - ScrumbanWriter.py
+                        starts_with(), rows_after() - ScrumbanCompleted.py
 
-        Modifies:       None
+        Modifies:       self._completed_written
+                        self._completed_size
+                        self._completed_appended_from
 
         Return:         None
 
         Description: Saves the contents of the completed_tasks attribute
-                     to the file in the completed_tasks_path attribute
+                     to the file in the completed_tasks_path attribute.
+                     Tasks are only ever completed onto the end of the list,
+                     so when the tasks already in the file are unchanged only
+                     the new ones are appended and the date in the title is
+                     rewritten in place. If an earlier task changed, such as
+                     one moved back to the todo backlog, or the file was changed
+                     outside the system, the file is compacted by rewriting it.
         """
         # check if there is a completed tasks file in existence
         if self.completed_tasks_path != "":
-            # open the file
-            with open(self.completed_tasks_path, "w") as completed_tasks:
-                completed_tasks.write(f"Completed Tasks as of {date.today()}\n")
-                completed_tasks.write("Task Name, Task Priority, Due Date, Completion Date\n")
-                # go through each task in the completed_tasks attribute
-                for task in self.completed_tasks:
-                    # go through each field for the task
-                    for i in range(len(task)):
-                        # if there is a blank
-                        if task[i] == "":
-                            # skip it
-                            continue
-                        # if the first field
-                        elif i == 0:
-                            # write the task
-                            completed_tasks.write(f"{task[i].strip()}")
-                        # if not the first field
-                        else:
-                            # write the task
-                            completed_tasks.write(f", {task[i].strip()}")
-                    # write a new line
-                    completed_tasks.write("\n")
-
-    # ------------------------------------------------------------------------ #
-    # ------------------------------------------------------------------------ #
-
-    def save_scrumban(self) -> None:
+            # the file is as it was last left and the tasks in it haven't changed
+            if self._completed_size is not None and path.exists(self.completed_tasks_path) \
+                    and path.getsize(self.completed_tasks_path) == self._completed_size \
+                    and self.completed_tasks.starts_with(self._completed_written) \
+                    and self._update_completed_title(writer):
+                # add each task completed since the last save to the end of the file
+                writer.append(self.completed_tasks_path,
+                              "".join(self._format_task(task)
+                                      for task in self.completed_tasks.rows_after(len(self._completed_written))))
+                self._completed_appended_from = self._completed_size
+            else:
+                # the version, the title, the headers and each task in the completed_tasks attribute
+                writer.write(self.completed_tasks_path,
+                             format_header("completed_tasks") +
+                             f"Completed Tasks as of {date.today()}\n"
+                             "Task Name, Task Priority, Due Date, Completion Date\n"
+                             + "".join(self._format_task(task) for task in self.completed_tasks))
+                self._completed_appended_from = None
+
+            # the file will hold every completed task once the batch is committed
+            self._completed_written = self.completed_tasks
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _update_completed_title(self, writer: BatchWriter) -> bool:
         """
-        Parameter:      N/A
+        Parameter:      writer - the batch the title is written in
+
+        Called By:      _save_completed_tasks - ScrumbanHistory.py
+
+        Calls:          overwrite() - ScrumbanWriter.py
+
+        Modifies:       None
+
+        Return:         bool - True if the title will be up to date, False if
+                        the file has to be rewritten
+
+        Description: Writes today's date into the "Completed Tasks as of" title
+                     of the completed tasks file. The date is always the same
+                     length, so the title is overwritten in place and the rest
+                     of the file is left alone. A file in an older format is
+                     rewritten instead, so it isn't appended to.
+        """
+        # header, title: the version header and the title the file should have
+        header = format_header("completed_tasks")
+        title = f"Completed Tasks as of {date.today()}\n"
+        # open the file to check its version, title and headers
+        with open(self.completed_tasks_path, "rb") as completed_tasks:
+            if completed_tasks.readline() != header.encode():
+                return False
+            # a title of another length can't be overwritten in place
+            if len(completed_tasks.readline()) != len(title) or not completed_tasks.readline():
+                return False
+        # overwrite the title, which starts after the version header
+        writer.overwrite(self.completed_tasks_path, len(header), title)
+        return True
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    @staticmethod
+    def _format_task(task: list) -> str:
+        """
+        Parameter:      task - the fields of a task
+
+        Called By:      _save_project_backlog, _save_todo_backlog,
+                        _save_completed_tasks - ScrumbanHistory.py
+
+        Calls:          None
+
+        Modifies:       None
+
+        Return:         str - the line of the file for the task
+
+        Description: Joins the fields of the task with ", ", skipping blank
+                     fields, and ends the line
+        """
+        return ", ".join(field.strip() for field in task if field != "") + "\n"
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def save_scrumban(self, parts: set = None) -> list:
+        """
+        Parameter:      parts - the parts of the board that changed since they
+                        were last saved, named as in ScrumbanBoard.py ("project",
+                        "todo", "member", "completed", "notes"), None for all
 
         Called By:      shutdown - VSS.py
 
-        Calls:          _save_project_backlog
+        Calls:          _data_lock
+                        _save_project_backlog
                         _save_todo_backlog
                         _save_members
                         _save_completed_tasks
+                        _save_queued_days
+                        _record_meeting
+                        commit() - ScrumbanWriter.py
+                        build_completed_index() - ScrumbanCompleted.py
+
+        Modifies:       self._completed_size
+                        the index of the completed_tasks file
+                        the history of the meeting
+
+        Return:         list[str] - the files that were skipped because their
+                        part of the board didn't change
+
+        Description: This method will save the state of the scrum into files.
+                     Only the files of the changed parts are written. Every
+                     file is written in one batch, so a crash leaves each file
+                     either as it was or fully saved.
+        """
+        # no other copy reads or writes the files until the save is done
+        with self._data_lock(True):
+            # writer: every file of this save, committed together
+            writer = BatchWriter()
+            # skipped: the files that already hold their part of the board
+            skipped = []
+            # part, file_name: each part of the board and the file it is saved to
+            for part, file_name in (("project", self.project_backlog_path), ("member", self.members_path),
+                                    ("todo", self.todo_backlog_path), ("completed", self.completed_tasks_path)):
+                # the part hasn't changed
+                if parts is not None and part not in parts:
+                    skipped.append(file_name)
+                    continue
+                # save the project backlog and the days its tasks were queued
+                if part == "project":
+                    self._save_project_backlog(writer)
+                    self._save_queued_days(writer)
+                # save the members
+                elif part == "member":
+                    self._save_members(writer)
+                # save the todo backlog
+                elif part == "todo":
+                    self._save_todo_backlog(writer)
+                # save the completed tasks
+                else:
+                    self._save_completed_tasks(writer)
+
+            # format date
+            date_list = str(date.today()).split('-')
+            formatted_date = f'{date_list[1]}-{date_list[2]}-{date_list[0]}'
+            # the notes haven't changed since they were last written
+            if parts is not None and "notes" not in parts:
+                skipped.append(f"General-Notes-{formatted_date}.txt")
+            # check if any general notes were written during the meeting
+            elif self.general_notes != "":
+                # the file header and the notes
+                writer.write(f"General-Notes-{formatted_date}.txt", f"General Notes for {date.today()}\n{self.general_notes}")
+
+            # write, flush and move every file into place together
+            writer.commit()
+
+            # the completed tasks file is appended to from its new size next time,
+            # and its index covers the rows that were just written
+            if (parts is None or "completed" in parts) and self.completed_tasks_path != "":
+                self._completed_size = path.getsize(self.completed_tasks_path)
+                build_completed_index(self.completed_tasks_path, appended_from=self._completed_appended_from)
+
+            # keep the files as they are now in the history of this meeting
+            self._record_meeting(self.get_data_files() + [f"General-Notes-{formatted_date}.txt"])
+
+            return skipped
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _data_lock(self, exclusive: bool):
+        """
+        Parameter:      exclusive - True for a save, False for a read
+
+        Called By:      save_scrumban, save_system_data, reset_system,
+                        read_project_backlog_file - ScrumbanHistory.py
+                        save_scrumban - ScrumbanDatabase.py
+
+        Calls:          shared(), exclusive() - ScrumbanLock.py
 
         Modifies:       None
 
+        Return:         context manager
+
+        Description: Returns the lock over the files held exclusive for a save
+                     or shared for a read, or a block that holds nothing if no
+                     lock is set
+        """
+        # the files aren't shared
+        if self.lock is None:
+            return nullcontext()
+        return self.lock.exclusive() if exclusive else self.lock.shared()
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def _record_meeting(self, files: list) -> None:
+        """
+        Parameter:      files - the paths of the files the board was saved to
+
+        Called By:      save_scrumban - ScrumbanHistory.py, ScrumbanDatabase.py
+
+        Calls:          record() - ScrumbanMeetings.py
+
+        Modifies:       the history of the meeting
+
         Return:         None
 
-        Description: This method will save the state of the scrum into files
-        """
-        # save the project backlog
-        self._save_project_backlog()
-        # save the members
-        self._save_members()
-        # save the todo backlog
-        self._save_todo_backlog()
-        # save the completed tasks
-        self._save_completed_tasks()
-        # check if any general notes were written during the meeting
-        if self.general_notes != "":
-            # format date
-            date_list = str(date.today()).split('-')
-            formatted_date = f'{date_list[1]}-{date_list[2]}-{date_list[0]}'
-            # create the file for the notes
-            with open(f"General-Notes-{formatted_date}.txt", "w") as general_notes:
-                # write the file header
-                general_notes.write(f"General Notes for {date.today()}\n")
-                # write the notes to a file
-                general_notes.write(self.general_notes)
+        Description: Records the files in the manifest of this meeting if a
+                     meeting store is set. The files are already saved, so a
+                     failure here is reported and the save still stands.
+        """
+        # no history is kept
+        if self.meetings is None:
+            return
+        try:
+            # the chunks the files share with earlier meetings aren't stored again
+            added = self.meetings.record(files)
+        except OSError as error:
+            print(f"MEETING HISTORY NOT RECORDED: {error}")
+            return
+        if added > 0:
+            print(f"MEETING HISTORY: {added} NEW CHUNKS")
 
     # ------------------------------------------------------------------------ #
     # ------------------------------------------------------------------------ #
@@ -1127,6 +1828,32 @@ class ScrumbanHistory():
                     report.write(f"{self.general_notes}\n")
                     # format line
                     report.write("*********************************************\n")
+                    # write at risk tasks header
+                    report.write("At Risk Tasks:\n\n")
+                    # if any task is overdue or due soon
+                    if self.at_risk_tasks:
+                        # write each at risk task on its own line
+                        for task in self.at_risk_tasks:
+                            report.write(f"{task}\n")
+                    # if nothing is at risk
+                    else:
+                        # write that no tasks are at risk
+                        report.write("No tasks are overdue or due soon\n")
+                    # format line
+                    report.write("*********************************************\n")
+                    # write completed tasks header
+                    report.write("Completed Tasks:\n\n")
+                    # if any task has been completed
+                    if self.completed_counts:
+                        # write each count on its own line
+                        for count in self.completed_counts:
+                            report.write(f"{count}\n")
+                    # if nothing has been completed
+                    else:
+                        # write that no tasks are completed
+                        report.write("No tasks have been completed\n")
+                    # format line
+                    report.write("*********************************************\n")
                 # create a blank email object
                 message = EmailMessage()
                 # fill in the subject
@@ -1205,7 +1932,8 @@ class ScrumbanHistory():
         Modifies:       N/A
 
         Return:         list of lists of strings that represents
-                        the project backlog
+                        the project backlog, streamed from its file after
+                        load_scrumban so it can only be read once
 
         Description: returns the self.project_backlog attribute
         """
@@ -1227,7 +1955,8 @@ class ScrumbanHistory():
         Modifies:       N/A
 
         Return:         list of lists of strings that represents
-                        the todo backlog
+                        the todo backlog, streamed from its file after
+                        load_scrumban so it can only be read once
 
         Description: returns the self.todo_backlog attribute
         """
@@ -1248,7 +1977,8 @@ class ScrumbanHistory():
         Modifies:       N/A
 
         Return:         list of lists of strings that represents
-                        the members
+                        the members, streamed from its file after
+                        load_scrumban so it can only be read once
 
         Description: returns the self.members attribute
         """
@@ -1269,7 +1999,7 @@ class ScrumbanHistory():
 
         Modifies:       N/A
 
-        Return:         list of lists of strings that represents
+        Return:         CompletedRows of lists of strings that represents
                         the completed tasks
 
         Description: returns the self.completed_tasks attribute
@@ -1466,12 +2196,13 @@ class ScrumbanHistory():
 
     def set_completed_tasks(self, completed_tasks:list) -> None:
         """
-        Parameter:      completed_tasks - list of lists of strings that
-                        representscompleted tasks
+        Parameter:      completed_tasks - list of lists of strings or
+                        CompletedRows that represents completed tasks
 
-        Called By:      shutdown - VSS.py
+        Called By:      __init__ - ScrumbanHistory.py
+                        shutdown - VSS.py
 
-        Calls:          None
+        Calls:          CompletedRows - ScrumbanCompleted.py
 
         Modifies:       self.completed_tasks
 
@@ -1479,7 +2210,9 @@ class ScrumbanHistory():
 
         Description: Sets the self.completed_tasks attribute with completed_tasks
         """
-        # set the attribute
+        # set the attribute, lists are wrapped so they compare like paged rows
+        if not isinstance(completed_tasks, CompletedRows):
+            completed_tasks = CompletedRows(rows=completed_tasks)
         self.completed_tasks = completed_tasks
 
     # ------------------------------------------------------------------------ #
@@ -1501,3 +2234,169 @@ class ScrumbanHistory():
         """
         # set the attribute
         self.general_notes = general_notes
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def set_at_risk_tasks(self, at_risk_tasks:list) -> None:
+        """
+        Parameter:      at_risk_tasks - list of strings that represents the
+                        overdue and soon due tasks
+
+        Called By:      send_reports - VSS.py
+
+        Calls:          None
+
+        Modifies:       self.at_risk_tasks
+
+        Return:         None
+
+        Description: Sets the self.at_risk_tasks attribute with at_risk_tasks
+        """
+        # set the attribute
+        self.at_risk_tasks = at_risk_tasks
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def set_completed_counts(self, completed_counts:list) -> None:
+        """
+        Parameter:      completed_counts - list of strings that represents the
+                        completed tasks per day and per priority
+
+        Called By:      send_reports - VSS.py
+
+        Calls:          None
+
+        Modifies:       self.completed_counts
+
+        Return:         None
+
+        Description: Sets the self.completed_counts attribute with completed_counts
+        """
+        # set the attribute
+        self.completed_counts = completed_counts
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def set_load_threads(self, load_threads:int) -> None:
+        """
+        Parameter:      load_threads - the number of files to read at once
+
+        Called By:      __init__ - VSS.py
+
+        Calls:          None
+
+        Modifies:       self.load_threads
+
+        Return:         None
+
+        Description: Sets the self.load_threads attribute with load_threads
+        """
+        # set the attribute
+        self.load_threads = load_threads
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def set_meeting_store(self, meetings) -> None:
+        """
+        Parameter:      meetings - the MeetingStore each save is recorded in,
+                        None to keep no history
+
+        Called By:      __init__ - VSS.py
+
+        Calls:          None
+
+        Modifies:       self.meetings
+
+        Return:         None
+
+        Description: Sets the self.meetings attribute with meetings
+        """
+        # set the attribute
+        self.meetings = meetings
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def set_data_lock(self, lock) -> None:
+        """
+        Parameter:      lock - the DataLock over the files, None if they aren't
+                        shared
+
+        Called By:      __init__ - VSS.py
+
+        Calls:          None
+
+        Modifies:       self.lock
+
+        Return:         None
+
+        Description: Sets the self.lock attribute with lock
+        """
+        # set the attribute
+        self.lock = lock
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def get_data_files(self) -> list:
+        """
+        Parameter:      N/A
+
+        Called By:      startup, shutdown - VSS.py
+
+        Calls:          None
+
+        Modifies:       None
+
+        Return:         list[str] - the paths of the files the board is saved to
+
+        Description: returns every file load_scrumban and read_system_data read
+                     the board from
+        """
+        return [".sys_data/sys_data.txt", ".sys_data/queued_days.txt", self.project_backlog_path,
+                self.members_path, self.todo_backlog_path, self.completed_tasks_path]
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def get_queued_days(self) -> dict:
+        """
+        Parameter:      N/A
+
+        Called By:      startup - VSS.py
+
+        Calls:          None
+
+        Modifies:       None
+
+        Return:         dict[str, int]
+
+        Description: Returns the queued_days attribute
+        """
+        # return the attribute
+        return self.queued_days
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------------------------------------------------------ #
+
+    def set_queued_days(self, queued_days:dict) -> None:
+        """
+        Parameter:      queued_days - dict of task name to the day ordinal the
+                        task was first queued
+
+        Called By:      shutdown, send_reports - VSS.py
+
+        Calls:          None
+
+        Modifies:       self.queued_days
+
+        Return:         None
+
+        Description: Sets the self.queued_days attribute with queued_days
+        """
+        # set the attribute
+        self.queued_days = queued_days
@@ -50,6 +50,12 @@ heading_2_font = ("Times", 16)
 body_font = ("Times", 20)
 task_font = ("Times", 20)
 
+# Tasks due within this many days are shown as at risk
+at_risk_days: int = 7
+
+# The most rows a pop-out window shows at once, the rest are a page away
+pop_out_page_size: int = 200
+
 
 class GetInitializingInfo(Tk):
     """
@@ -158,6 +164,9 @@ class ScrumbanInterface(Tk):
         self.project_backlog_button : Button            : None                  -> Holds an button to open the project
                                                                                 backlog window
 
+        self.at_risk_button         : Button            : None                  -> Holds the button to open the at risk
+                                                                                tasks window
+
         self.refresh_todo_button    : Button            : None                  -> Holds the button to refresh the todo
                                                                                 log to display its maximum number of
                                                                                 tasks
@@ -177,6 +186,9 @@ class ScrumbanInterface(Tk):
         self.project_backlog_window_: Bool              : False                  -> True if the window exists and false
         exists                                                                  if not
 
+        self.at_risk_window_exists  : Bool              : False                  -> True if the window exists and false
+                                                                                if not
+
         self.maximums_window        : Toplevel          : None                  -> Holds the window that displays what
                                                                                 the maximums are set to
 
@@ -189,6 +201,9 @@ class ScrumbanInterface(Tk):
         self.project_backlog_window : Toplevel          : None                  -> Holds the window that displays the
                                                                                 list of tasks in the project backlog
 
+        self.at_risk_window         : Toplevel          : None                  -> Holds the window that displays the
+                                                                                overdue and soon due tasks
+
         self.below_buttons_frame    : Frame             : Frame()               -> Holds the frame for everything in the
                                                                                 window below the button bar frame
 
@@ -207,6 +222,9 @@ class ScrumbanInterface(Tk):
         self.task_move_case         : Int               : 0                     -> An intefger that represents what
                                                                                 task movements can be done at some point
 
+        self.selected_task_uid      : Int               : None                  -> The stable id of the member task that
+                                                                                was selected last
+
         self.menu_bar               : Menu              : Menu()                -> Holds the menu bar and it's options
 
 
@@ -242,7 +260,7 @@ class ScrumbanInterface(Tk):
                                                                                     |
         Description:    Sets all other key bindings based on the task key bindings  |
         ----------------------------------------------------------------------------|-----------------------------------
-        Declaration:    _get_completed_log_as_strings(self)                         |   -> [Tasks name as strings]
+        Declaration:    _get_completed_log_as_strings(self)                         |   -> (Tasks name as strings)
                                                                                     |
         Usage:          instance._get_completed_log_as_strings(self)                |
                                                                                     |
@@ -285,6 +303,12 @@ class ScrumbanInterface(Tk):
                                                                                     |
         Description:    Opens a new window that shows the project backlog           |
         ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _at_risk_button_clicked(self)                               |   -> None
+                                                                                    |
+        Usage:          instance._at_risk_button_clicked()                          |
+                                                                                    |
+        Description:    Opens a new window that shows the overdue and soon due tasks|
+        ----------------------------------------------------------------------------|-----------------------------------
         Declaration:    _on_closing(self, window)                                   |   -> None
                                                                                     |
         Usage:          instance._on_closing(self.completed_log_window)             |
@@ -298,6 +322,12 @@ class ScrumbanInterface(Tk):
                                                                                     |
         Description:    Sets the task_move_case number                              |
         ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _member_task_selected(self, task_uid)                       |   -> None
+                                                                                    |
+        Usage:          Passed to each MemberInterface as its selection callback    |
+                                                                                    |
+        Description:    Remembers the stable id of the selected member task         |
+        ----------------------------------------------------------------------------|-----------------------------------
         Declaration:    _completed_to_todo(self, completed_task_index)              |   -> None
                                                                                     |
         Usage:          instance._completed_to_todo(2)                              |
@@ -329,12 +359,48 @@ class ScrumbanInterface(Tk):
                                                                                     |
         Description:    Moves a member's task to another member's task list         |
         ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _undo(self, event=None)                                     |   -> None
+                                                                                    |
+        Usage:          Binded to Control-z and the Undo menu option                |
+                                                                                    |
+        Description:    Undoes the last task move                                   |
+        ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _redo(self, event=None)                                     |   -> None
+                                                                                    |
+        Usage:          Binded to Control-y and the Redo menu option                |
+                                                                                    |
+        Description:    Redoes the last undone task move                            |
+        ----------------------------------------------------------------------------|-----------------------------------
         Declaration:    _fill_todo_data(self)                                       |   -> None
                                                                                     |
         Usage:          instance._fill_todo_data(self)                              |
                                                                                     |
         Description:    Fills the todo list box with tasks                          |
         ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _fill_all_data(self)                                        |   -> None
+                                                                                    |
+        Usage:          instance._fill_all_data()                                   |
+                                                                                    |
+        Description:    Fills the todo list, every member and any open task window  |
+        ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _auto_assign_clicked(self)                                  |   -> None
+                                                                                    |
+        Usage:          Its binded as the action of the Auto Assign Todo menu option|
+                                                                                    |
+        Description:    Assigns the todo list to the least loaded members           |
+        ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _apply_batch(self, ops)                                     |   -> None
+                                                                                    |
+        Usage:          instance._apply_batch([("assign_task", 12, 0)])             |
+                                                                                    |
+        Description:    Makes a batch of moves and redraws only what changed        |
+        ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _refresh_changes(self, changes)                             |   -> None
+                                                                                    |
+        Usage:          instance._refresh_changes(change_set)                       |
+                                                                                    |
+        Description:    Fills only the widgets named in a change set                |
+        ----------------------------------------------------------------------------|-----------------------------------
         Declaration:    _set_up_button_bar(self)                                    |   -> None
                                                                                     |
         Usage:          instance._set_up_button_bar()                               |
@@ -383,6 +449,12 @@ class ScrumbanInterface(Tk):
                                                                                     |
         Description:    Creates up a message box with the data the method is passed |
         ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    refresh_project_backlog(self)                               |   -> None
+                                                                                    |
+        Usage:          instance.refresh_project_backlog()                          |
+                                                                                    |
+        Description:    Refills the project backlog window if it is open            |
+        ----------------------------------------------------------------------------|-----------------------------------
         Declaration:    get_project_backlog_input(self)                             |   -> String that is a file path
                                                                                     |
         Usage:          instance.get_project_backlog_input()                        |
@@ -439,6 +511,7 @@ class ScrumbanInterface(Tk):
         self.completed_log_button = None
         self.agenda_button = None
         self.project_backlog_button = None
+        self.at_risk_button = None
         self.refresh_todo_button = None
         self.button_bar_frame = Frame(self, bg=button_bar_background_color, width=1, height=1)
         self._set_up_button_bar()
@@ -448,12 +521,14 @@ class ScrumbanInterface(Tk):
         self.completed_log_window_exists = False
         self.agenda_window_exists = False
         self.project_backlog_window_exists = False
+        self.at_risk_window_exists = False
 
         # Variables that hold instantiations for popout windows
         self.maximums_window = None
         self.completed_log_window = None
         self.agenda_window = None
         self.project_backlog_window = None
+        self.at_risk_window = None
 
         # Create the frame that all the widgets besides the button bar frame are placed
         self.below_buttons_frame = Frame(self, height=1, width=1)
@@ -475,6 +550,9 @@ class ScrumbanInterface(Tk):
         # _member_to_completed (case 0, 1, 2) respectively
         self.task_move_case: int = 0  # start with case nothing_is_picked
 
+        # The stable id of the last member task that was selected, set by the member interfaces
+        self.selected_task_uid = None
+
         # Set up the menu bar at the top of the desktop on macOS and top of the window for Windows and Linux
         self.menu_bar = Menu(self)
         self._set_up_menu_bar()
@@ -489,9 +567,8 @@ class ScrumbanInterface(Tk):
 
         Calls:          get_questions_concerns_text - MemberInterface
 
-                        get_members,
                         set_notes,
-                        set_qc - ScrumbanBoard
+                        set_member_qc - ScrumbanBoard
 
                         _save_text - Self
 
@@ -509,7 +586,7 @@ class ScrumbanInterface(Tk):
         member_index = 0
         for member_interface in self.member_interfaces:
             questions_concerns_text = member_interface.get_questions_concerns_text()
-            self.board_data.get_members()[member_index].set_qc(questions_concerns_text)
+            self.board_data.set_member_qc(member_index, questions_concerns_text)
             member_index += 1
             # save the members questions/concerns
         # Save the meeting notes text
@@ -529,6 +606,7 @@ class ScrumbanInterface(Tk):
                         _fill_todo_data
                         _set_key_bindings
                         _save_text
+                        Tk.bind - tkinter
 
         Modifies:       self.board_data
 
@@ -542,6 +620,9 @@ class ScrumbanInterface(Tk):
         self._set_up_members()
         self._fill_todo_data()
         self._set_key_bindings()
+        # Undo and redo work no matter what is selected
+        self.bind("<Control-z>", self._undo)
+        self.bind("<Control-y>", self._redo)
         self._save_text()
 
     def _set_unmap_key_bindings(self):
@@ -653,15 +734,12 @@ class ScrumbanInterface(Tk):
 
             self.bind('<Control-d>', self._member_to_complete)
 
-            # Get the member who's task is selected
-            member_index_with_selected_task = None
-            for member_index in range(len(self.member_interfaces)):
-                if self.member_interfaces[member_index].get_task_view().curselection() != ():
-                    member_index_with_selected_task = member_index
-
-            # Find the task in that member
-            member = self.member_interfaces[member_index_with_selected_task]
-            task_index = member.get_task_view().curselection()[0]
+            # Look up the member and position of the selected task by its id
+            location = self.board_data.locate_task(self.selected_task_uid)
+            if location is None or location[1] is None:
+                return
+            member_index_with_selected_task = location[1]
+            task_index = location[2]
 
             self.bind('<Control-t>', lambda event: self._member_to_todo(member_index_with_selected_task, task_index))
 
@@ -707,6 +785,24 @@ class ScrumbanInterface(Tk):
         """
         messagebox.showinfo(title=window_title, message=message)
 
+    def refresh_project_backlog(self):
+        """
+        Parameter:      None
+
+        Called By:      _poll - ScrumbanWatcher.py
+
+        Calls:          get_project_backlog() - ScrumbanBoard
+                        update_data - PopOutWindowInterface
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Shows the project backlog again after it was changed outside of the interface
+        """
+        if self.project_backlog_window_exists:
+            self.project_backlog_window.update_data([task.get_name() for task in self.board_data.get_project_backlog()])
+
     # END SETTERS ------------------------------------------------------------------------------------------------------
 
     # GETTERS ----------------------------------------------------------------------------------------------------------
@@ -757,18 +853,17 @@ class ScrumbanInterface(Tk):
                         _member_to_complete
 
         Calls:          get_completed() - ScrumbanBoard
+                        CompletedLogLines
 
         Modifies:       None
 
-        Return:         ["Completed task name Completed on: Data"]: List of strings
+        Return:         ("Completed task name Completed on: Data"): CompletedLogLines of strings
 
-        Description:    Returns the list of all the tasks that have been completed in the currently uploaded project.
+        Description:    Returns the tasks that have been completed in the currently uploaded project. The strings are
+                        built only for the page the window shows, straight from the completed store's columns or the
+                        completed tasks file.
         """
-        completed_list = []
-        list_of_completed = self.board_data.get_completed()
-        for task in list_of_completed:
-            completed_list.append(f"{task.get_name()}  |  Completed on: {task.get_done()}")
-        return completed_list
+        return CompletedLogLines(self.board_data.get_completed())
     # END GETTERS ------------------------------------------------------------------------------------------------------
 
     # EVENT HANDLERS ---------------------------------------------------------------------------------------------------
@@ -927,6 +1022,31 @@ class ScrumbanInterface(Tk):
         self.project_backlog_window_exists = True
         self.project_backlog_window.protocol("WM_DELETE_WINDOW", lambda: self._on_closing(self.project_backlog_window))
 
+    def _at_risk_button_clicked(self):
+        """
+        Parameter:      None
+
+        Called By:      _set_up_button_bar
+
+        Calls:          get_string_at_risk - ScrumbanBoard
+                        PopOutWindowInterface
+                        Toplevel.protocol : Tkinter
+
+        Modifies:       self.at_risk_window
+                        self.at_risk_window_exists
+
+        Return:         None
+
+        Description:    Handler if the at risk button is pressed. It creates a window with the overdue tasks and the
+                        tasks due within at_risk_days days.
+        """
+        if self.at_risk_window_exists:
+            return
+
+        self.at_risk_window = PopOutWindowInterface(self, "At Risk Tasks", self.board_data.get_string_at_risk(at_risk_days))
+        self.at_risk_window_exists = True
+        self.at_risk_window.protocol("WM_DELETE_WINDOW", lambda: self._on_closing(self.at_risk_window))
+
     def _on_closing(self, window):
         """
         Parameter:      None
@@ -935,12 +1055,14 @@ class ScrumbanInterface(Tk):
                         _maximums_button_clicked
                         _agenda_button_clicked
                         _project_backlog_button_clicked
+                        _at_risk_button_clicked
 
         Calls:          Tk.destroy - Tkinter
 
         Modifies:       self.completed_log_window_exists
                         self.agenda_window_exists
                         self.maximums_window_exits
+                        self.at_risk_window_exists
                         self.project_backlog_window_exists
 
         Return:         None
@@ -953,6 +1075,8 @@ class ScrumbanInterface(Tk):
             self.agenda_window_exists = False
         elif window == self.maximums_window:
             self.maximums_window_exits = False
+        elif window == self.at_risk_window:
+            self.at_risk_window_exists = False
         else:
             self.project_backlog_window_exists = False
 
@@ -1005,6 +1129,23 @@ class ScrumbanInterface(Tk):
 
         self._set_key_bindings()  # reset key bindings
 
+    def _member_task_selected(self, task_uid):
+        """
+        Parameter:      task_uid: the stable id of the task that was selected
+
+        Called By:      _task_view_selected - MemberInterface
+
+        Calls:          None
+
+        Modifies:       self.selected_task_uid
+
+        Return:         None
+
+        Description:    Remembers which member task is selected so it can be found on the board without checking every
+                        member's list box.
+        """
+        self.selected_task_uid = task_uid
+
     def _completed_to_todo(self, completed_task_index):
         """
         Parameter:      completed_task_index
@@ -1095,8 +1236,8 @@ class ScrumbanInterface(Tk):
 
         Called By:      Binded to button presses when an item in the member's task list is clicked in _set_key_bindinds
 
-        Calls:          complete_task - ScrumbanInterface
-                        fill_tasks_data, get_task_view - MemberInterface
+        Calls:          locate_task, complete_task_by_uid - ScrumbanBoard
+                        fill_tasks_data - MemberInterface
                         _get_completed_log_as_strings - Self
                         update_data - PopOutWindowINterface
 
@@ -1105,23 +1246,19 @@ class ScrumbanInterface(Tk):
 
         Return:         None
 
-        Description:    Moves a task in a member to the completed list. This function finds the selected task in the
-                        member.
+        Description:    Moves a task in a member to the completed list. This function finds the selected task by its
+                        id.
         """
-        # Get the member who's task is selected
-        member_index_with_selected_task = None
-        for member_index in range(len(self.member_interfaces)):
-            if self.member_interfaces[member_index].get_task_view().curselection() != ():
-                member_index_with_selected_task = member_index
-
-        # Find the task in that member
-        member = self.member_interfaces[member_index_with_selected_task]
-        task_index = member.get_task_view().curselection()[0]
+        # Look up the member that holds the selected task
+        location = self.board_data.locate_task(self.selected_task_uid)
+        if location is None or location[1] is None:
+            return
 
-        self.board_data.complete_task(member_index_with_selected_task, task_index)
+        if self.board_data.complete_task_by_uid(self.selected_task_uid) == 1:
+            return
 
         # Update the view
-        member.fill_tasks_data()
+        self.member_interfaces[location[1]].fill_tasks_data()
 
         # Update the completed list if it is open
         if self.completed_log_window_exists:
@@ -1157,6 +1294,99 @@ class ScrumbanInterface(Tk):
         self.member_interfaces[from_member_index].fill_tasks_data()
         self.member_interfaces[to_member_index].fill_tasks_data()
 
+    def _undo(self, event=None):
+        """
+        Parameter:      event - implicitly sent event from Tkinter, None from the menu
+
+        Called By:      Binded to control+z in set_board_data and the Undo option in _set_up_menu_bar
+
+        Calls:          undo - ScrumbanBoard
+                        messagebox.showinfo - Tkinter
+                        _fill_all_data - self
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Undoes the last task move and redraws the board
+        """
+        if self.board_data.undo() == 1:
+            messagebox.showinfo(title="Nothing to undo", message="There are no task moves to undo")
+            return
+
+        self._fill_all_data()
+
+    def _redo(self, event=None):
+        """
+        Parameter:      event - implicitly sent event from Tkinter, None from the menu
+
+        Called By:      Binded to control+y in set_board_data and the Redo option in _set_up_menu_bar
+
+        Calls:          redo - ScrumbanBoard
+                        messagebox.showinfo - Tkinter
+                        _fill_all_data - self
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Redoes the last undone task move and redraws the board
+        """
+        if self.board_data.redo() == 1:
+            messagebox.showinfo(title="Nothing to redo", message="There are no undone task moves to redo")
+            return
+
+        self._fill_all_data()
+
+    def _auto_assign_clicked(self):
+        """
+        Parameter:      None
+
+        Called By:      Event handler for the Auto Assign Todo option in _set_up_menu_bar
+
+        Calls:          auto_assign - ScrumbanBoard
+                        messagebox.showinfo - Tkinter
+                        _refresh_changes - self
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Hands out the todo list by priority to the members with the fewest tasks, then refills each
+                        affected widget once
+        """
+        changes = self.board_data.auto_assign()
+        if not changes["todo"]:
+            messagebox.showinfo(title="Nothing assigned",
+                                message="The todo list is empty or every member has the maximum number of tasks")
+            return
+
+        self._refresh_changes(changes)
+
+    def _apply_batch(self, ops):
+        """
+        Parameter:      ops: list of moves in the form taken by apply_batch - ScrumbanBoard
+
+        Called By:      None
+
+        Calls:          apply_batch - ScrumbanBoard
+                        messagebox.showinfo - Tkinter
+                        _refresh_changes - self
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Makes every move in ops or none of them, then refills each affected widget once
+        """
+        changes = self.board_data.apply_batch(ops)
+        if changes is None:
+            messagebox.showinfo(title="ERROR: Moves not made",
+                                message="The moves would go over a task limit, so none of them were made")
+            return
+
+        self._refresh_changes(changes)
+
     # END EVENT HANDLERS -----------------------------------------------------------------------------------------------
 
     # FILL DATA --------------------------------------------------------------------------------------------------------
@@ -1184,6 +1414,67 @@ class ScrumbanInterface(Tk):
         for task in self.board_data.get_todo():
             self.todo_list_box.insert(END, task.get_name())
 
+    def _fill_all_data(self):
+        """
+        Parameter:      None
+
+        Called By:      _undo,
+                        _redo
+
+        Calls:          _fill_todo_data
+                        _get_completed_log_as_strings - self
+                        fill_tasks_data - MemberInterface
+                        update_data - PopOutWindowInterface
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Fills the todo list, every member's tasks and any open completed log or project backlog window
+                        from the Scrumban Board instance. Used when a move may have touched any of them.
+        """
+        self._fill_todo_data()
+
+        for member_interface in self.member_interfaces:
+            member_interface.fill_tasks_data()
+
+        # Update the completed list if it is open
+        if self.completed_log_window_exists:
+            self.completed_log_window.update_data(self._get_completed_log_as_strings())
+
+        # Update the backlog if it is open
+        if self.project_backlog_window_exists:
+            self.project_backlog_window.update_data([task.get_name() for task in self.board_data.get_project_backlog()])
+
+    def _refresh_changes(self, changes):
+        """
+        Parameter:      changes: change set returned by apply_batch - ScrumbanBoard
+
+        Called By:      _apply_batch
+                        _auto_assign_clicked
+
+        Calls:          _fill_todo_data
+                        _get_completed_log_as_strings - self
+                        fill_tasks_data - MemberInterface
+                        update_data - PopOutWindowInterface
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Refills only the todo list, members and completed log window that the change set names, each
+                        one once no matter how many moves touched it
+        """
+        if changes["todo"]:
+            self._fill_todo_data()
+
+        for member_index in sorted(changes["members"]):
+            self.member_interfaces[member_index].fill_tasks_data()
+
+        # Update the completed list if it is open
+        if changes["completed"] and self.completed_log_window_exists:
+            self.completed_log_window.update_data(self._get_completed_log_as_strings())
+
     # END FILL DATA ----------------------------------------------------------------------------------------------------
 
     # SETUP METHODS ----------------------------------------------------------------------------------------------------
@@ -1201,6 +1492,7 @@ class ScrumbanInterface(Tk):
                         self.completed_log_button
                         self.agenda_button
                         self.project_backlog_button
+                        self.at_risk_button
                         self.maximums_button
 
         Return:         None
@@ -1221,6 +1513,8 @@ class ScrumbanInterface(Tk):
                                     command=self._agenda_button_clicked).pack(side=RIGHT)
         self.project_backlog_button = Button(self.button_bar_frame, text="Show Project Backlog",
                                              command=self._project_backlog_button_clicked).pack(side=RIGHT)
+        self.at_risk_button = Button(self.button_bar_frame, text="Show At Risk",
+                                     command=self._at_risk_button_clicked).pack(side=RIGHT)
         self.maximums_button = Button(self.button_bar_frame, text="Show Maximums",
                                       command=self._maximums_button_clicked).pack(side=RIGHT)
 
@@ -1333,7 +1627,8 @@ class ScrumbanInterface(Tk):
         # for member_index in range(len(self.members)):
         members = self.board_data.get_members()
         for member_index in range(len(members)):
-            self.member_interfaces.append(MemberInterface(members_content_frame, members[member_index], member_index))
+            self.member_interfaces.append(MemberInterface(members_content_frame, members[member_index], member_index,
+                                                          self._member_task_selected))
         # END INTERFACE WITH DATA SIDE ---------------------------------------------------------------------------------
 
         # update members_content_frame height so it's no longer 0 ( height is 0 when it has just been created )
@@ -1372,6 +1667,10 @@ class ScrumbanInterface(Tk):
         # Add options to hte import drop down
         import_menu.add_command(label="Import Agenda", command=self.import_agenda_clicked)
         import_menu.add_command(label="Project Reset", command=self.project_reset_clicked)
+        import_menu.add_separator()
+        import_menu.add_command(label="Auto Assign Todo", command=self._auto_assign_clicked)
+        import_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self._undo)
+        import_menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self._redo)
 
     def import_agenda_clicked(self):
         """
@@ -1412,9 +1711,16 @@ class ScrumbanInterface(Tk):
 
         Description:    Event handler that resets the program so the user can import a new project
         """
+        # only the copy saving the project can remove its files
+        if self.vss.read_only:
+            self.set_message_box("Read Only", "The project can only be reset by the copy saving it.")
+            return
         are_they_sure = askyesno("Are you sure?", "Are you sure you want to reset the project. All current project \
         DATA WILL BE LOST. SYSTEM WILL QUIT. Restart to re-import data")
         if are_they_sure:
+            # don't let an autosave write into the files being removed
+            if self.vss.autosave is not None:
+                self.vss.autosave.flush()
             self.vss.history.reset_system()
             sys.exit()
 
@@ -1424,9 +1730,38 @@ class ScrumbanInterface(Tk):
 # ******************************************************************************************************************** #
 
 
+class CompletedLogLines():
+    """
+    The lines of the completed log window, built only for the rows that are asked for.
+
+    Used by:
+        ScrumbanInterface
+        PopOutWindowInterface
+
+    Members:
+        Member Name:                : Type              : Default Val           -> Description
+        ----------------------------------------------------------------------------------------------------------------
+        self.completed              : CompletedStore    : completed             -> The completed backlog of the board
+    """
+    def __init__(self, completed):
+        self.completed = completed
+
+    def __len__(self):
+        return len(self.completed)
+
+    def __getitem__(self, rows: slice):
+        # Only a page of rows is ever read, starting from the first row of the page
+        start, stop, _ = rows.indices(len(self.completed))
+        return [f"{name}  |  Completed on: {done}" for name, done in self.completed.iter_names_and_dates(start, stop)]
+
+
+# ******************************************************************************************************************** #
+
+
 class PopOutWindowInterface(Toplevel):
     """
-    Outlines the structure for pop-out window interface. It can display any list of data as strings
+    Outlines the structure for pop-out window interface. It can display any list of data as strings. Long lists are
+    shown one page at a time, so only the rows of the page are built.
 
     Used by:
         ScrumbanInterface
@@ -1443,7 +1778,14 @@ class PopOutWindowInterface(Toplevel):
 
         self.label                  : Label             : Label()               -> The label with the title of the win
 
-        self.items_list_widget      : Listbox           : Listbox()             -> The list that holds all the data
+        self.items_list_widget      : Listbox           : Listbox()             -> The list that holds the data of the page
+
+        self.page_start             : int               : 0                     -> The index of the first item on the page
+
+        self.page_frame             : Frame             : Frame()               -> Holds the page buttons, only shown
+                                                                                when there is more than one page
+
+        self.page_label             : Label             : Label()               -> Shows which items are on the page
 
     Methods:
         Public:                                                                      Return:
@@ -1461,12 +1803,28 @@ class PopOutWindowInterface(Toplevel):
                                                                                     |
         Description:    Takes an updated version of the data list and fills the list|
         ----------------------------------------------------------------------------|-----------------------------------
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _fill_page(self)                                            |   -> None
+                                                                                    |
+        Usage:          instance._fill_page()                                       |
+                                                                                    |
+        Description:    Fills the list with the items of the current page           |
+        ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _turn_page(self, pages)                                     |   -> None
+                                                                                    |
+        Usage:          instance._turn_page(1)                                      |
+                                                                                    |
+        Description:    Moves forward or back by pages and fills the list           |
+        ----------------------------------------------------------------------------|-----------------------------------
     """
     def __init__(self, master_window, window_title: str, items_list: [str], width=350, height=700):
         """
         Parameter:      master_window - A Scrumban Interface window,
                         window_title - A title for the top of the window
-                        items_list - The data that fills the data
+                        items_list - The data that fills the data, a list or anything that can be sliced and
+                                     has a length
                         width - Setable window size with a default
                         height - Setable window size with a default
 
@@ -1503,6 +1861,14 @@ class PopOutWindowInterface(Toplevel):
         self.label = Label(self.top_frame, text=window_title, font=heading_1_font)
         self.label.pack(side=TOP, fill=X, expand=False)
 
+        # Page buttons, packed below the list when there is more than one page
+        self.page_start = 0
+        self.page_frame = Frame(self.top_frame)
+        Button(self.page_frame, text="Previous", command=lambda: self._turn_page(-1)).pack(side=LEFT)
+        self.page_label = Label(self.page_frame, font=body_font)
+        self.page_label.pack(side=LEFT, fill=X, expand=True)
+        Button(self.page_frame, text="Next", command=lambda: self._turn_page(1)).pack(side=RIGHT)
+
         # Display list of items
         self.items_list_widget = Listbox(self.top_frame, font=body_font)
         self.items_list_widget.pack(fill=BOTH, expand=True)
@@ -1522,9 +1888,9 @@ class PopOutWindowInterface(Toplevel):
         Return:         None
 
         Description:    Public method to get the current selection index in a tuple like this (1, ) if the selected
-                        index 1
+                        index 1. The index is into the whole data list, not the page.
         """
-        return self.items_list_widget.curselection()
+        return tuple(self.page_start + index for index in self.items_list_widget.curselection())
 
     def update_data(self, completed_list):
         """
@@ -1540,18 +1906,67 @@ class PopOutWindowInterface(Toplevel):
 
         Return:         None
 
-        Description:    Updates the data stored in the poopout window
+        Description:    Updates the data stored in the poopout window, staying on the same page if it still exists
         """
-        # First empty the view
-        self.items_list_widget.delete(0, END)
-
         # update the items_list
         self.items_list = completed_list
 
-        # Refill it with updated data
-        for item in self.items_list:
+        # Stay on the page, or the last page if the list got shorter
+        last_page_start = max(len(self.items_list) - 1, 0) // pop_out_page_size * pop_out_page_size
+        self.page_start = min(self.page_start, last_page_start)
+
+        # The page buttons are only needed when the list doesn't fit on one page
+        if len(self.items_list) > pop_out_page_size:
+            self.page_frame.pack(side=BOTTOM, fill=X)
+        else:
+            self.page_frame.pack_forget()
+
+        self._fill_page()
+
+    def _fill_page(self):
+        """
+        Parameter:      None
+
+        Called By:      update_data, _turn_page
+
+        Calls:          Listbox.delete
+                        Listbox.insert - Tkinter
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Fills the list with the items of the current page, only those items are read from the data
+        """
+        # First empty the view
+        self.items_list_widget.delete(0, END)
+
+        # Refill it with the page
+        page_end = min(self.page_start + pop_out_page_size, len(self.items_list))
+        for item in self.items_list[self.page_start:page_end]:
             self.items_list_widget.insert(END, item)
 
+        self.page_label.config(text=f"{self.page_start + 1} - {page_end} of {len(self.items_list)}")
+
+    def _turn_page(self, pages):
+        """
+        Parameter:      pages - how many pages to move, negative to move back
+
+        Called By:      None. It is a handler function binded to the page buttons.
+
+        Calls:          _fill_page
+
+        Modifies:       self.page_start
+
+        Return:         None
+
+        Description:    Moves forward or back by pages, stopping at the first and last page
+        """
+        page_start = self.page_start + pages * pop_out_page_size
+        if 0 <= page_start < len(self.items_list):
+            self.page_start = page_start
+            self._fill_page()
+
 
 # ******************************************************************************************************************** #
 
@@ -1596,6 +2011,12 @@ class MemberInterface(Frame):
         self.questions_concerns_text: string            : None                  -> Hold the text that is being typed as
                                                                                 a string
 
+        self.task_uids              : [int]             : []                    -> The stable ids of the tasks in the
+                                                                                task view, in the same order
+
+        self.on_task_selected       : function          : on_task_selected      -> Called with the stable id of a task
+                                                                                when it is selected in the task view
+
     Methods:
         Private:                                                                     Return:
         ----------------------------------------------------------------------------|-----------------------------------
@@ -1627,13 +2048,20 @@ class MemberInterface(Frame):
                                                                                     |
         Description:    Gets up to data data to fill the member's tasks             |
         ----------------------------------------------------------------------------|-----------------------------------
+        Declaration:    _task_view_selected(self, event)                            |   -> None
+                                                                                    |
+        Usage:          Its binded to <<ListboxSelect>> on the task view            |
+                                                                                    |
+        Description:    Passes the stable id of the selected task to the callback   |
+        ----------------------------------------------------------------------------|-----------------------------------
     """
-    def __init__(self, parent: ScrumbanInterface, member_data, member_index):
+    def __init__(self, parent: ScrumbanInterface, member_data, member_index, on_task_selected=None):
         """
         Parameter:      parent is an instance of ScrumbanInterface
                         member_data is ScrumbanMembers
                         member_index and intereger value that returns the index of the member in the member list in the
                         interface
+                        on_task_selected is called with the stable id of a task when it is selected
 
         Called By:      None
 
@@ -1670,6 +2098,10 @@ class MemberInterface(Frame):
         # Create the task list
         self.task_view = Listbox(self.tasks_frame, font=task_font)  # width=200
         self.task_view.pack(side=LEFT, padx=1, pady=1, fill=X, expand=True)
+        # The stable ids of the tasks in the list, and who to tell when one is selected
+        self.task_uids = []
+        self.on_task_selected = on_task_selected
+        self.task_view.bind("<<ListboxSelect>>", self._task_view_selected)
 
         # Create frame for Questions/Concerns
         self.questions_concerns_frame = Frame(self, bg=member_background_color)  # height=100)
@@ -1736,6 +2168,7 @@ class MemberInterface(Frame):
                         _member_to_todo
                         _member_to_complete
                         _member_to_member
+                        _fill_all_data - ScrumbanInterface
 
         Calls:          task_view - self
 
@@ -1747,6 +2180,7 @@ class MemberInterface(Frame):
         """
         # First, empty the tasks
         self.task_view.delete(0, END)
+        self.task_uids = []
 
         print("FILLING TASK DATA")
 
@@ -1754,6 +2188,26 @@ class MemberInterface(Frame):
         for task in self.member_data.get_tasks():
             task_name = task.get_name()
             self.task_view.insert(END, task_name)
+            self.task_uids.append(task.get_uid())
+
+    def _task_view_selected(self, event):
+        """
+        Parameter:      event - implicitly sent event from Tkinter
+
+        Called By:      Binded to <<ListboxSelect>> on the task view
+
+        Calls:          on_task_selected
+
+        Modifies:       None
+
+        Return:         None
+
+        Description:    Passes the stable id of the selected task to on_task_selected
+        """
+        current_selection = self.task_view.curselection()
+        # Selecting in another list box clears this one, ignore that
+        if current_selection != () and self.on_task_selected is not None:
+            self.on_task_selected(self.task_uids[current_selection[0]])
 
     def _fill_questions_concerns_data(self):
         """
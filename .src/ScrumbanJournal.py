@@ -0,0 +1,301 @@
+"""
+File: ScrumbanJournal.py
+
+Description: This module is responsible for the event sourced storage mode of the
+             Virtual Scrumban System.
+
+             It completes several tasks:
+
+             1. Appends every change made to the board to an operation journal
+             2. Writes a compact snapshot of the board every few hundred changes
+             3. Rebuilds the board at boot from the latest snapshot and the
+                journal entries written after it
+
+Dependencies: json, os
+
+Date Created: 10/17/2026
+"""
+
+# used to encode the journal entries and snapshots
+import json
+# used to replace the snapshot atomically and flush files to disk
+from os import fsync, makedirs, path, replace
+
+from ScrumbanBoard import Board
+
+# where the journal and the snapshot are kept
+journal_path: str = ".sys_data/journal.log"
+snapshot_path: str = ".sys_data/snapshot.json"
+
+
+class BoardJournal():
+    """
+    Append-only journal of the changes made to a Board, compacted into periodic
+    snapshots.
+
+    Each change is one JSON line tagged with an increasing sequence number. A
+    snapshot records the whole board and the sequence number of the last change
+    it includes, so entries at or below that number are skipped on replay. This
+    keeps a crash between writing a snapshot and truncating the journal harmless.
+
+    Used By:
+        VSS.py
+
+    Members:
+        Member Name:                : Type          : Default Val          -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.journal_path           : str           : journal_path         -> the path of the journal file
+
+        self.snapshot_path          : str           : snapshot_path        -> the path of the snapshot file
+
+        self.snapshot_interval      : int           : 500                  -> how many journal entries are written before the
+                                                                              board is snapshotted and the journal truncated
+
+        self.sequence               : int           : 0                    -> the sequence number of the last change recorded
+
+        self.entries_since_snapshot : int           : 0                    -> the number of journal entries after the snapshot
+
+        self.board                  : Board         : None                 -> the board being journaled
+
+        self._file                  : file          : None                 -> the journal opened for appending
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    has_snapshot(self)                                          |   -> bool
+                                                                                    |
+        Usage:          instance.has_snapshot()                                     |
+                                                                                    |
+        Description:    Return True if a board can be loaded from the journal       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    load(self)                                                  |   -> Board
+                                                                                    |
+        Usage:          instance.load()                                             |
+                                                                                    |
+        Description:    Rebuild the board from the snapshot and the journal tail    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    attach(self, board: Board, snapshot: bool = False)          |   -> None
+                                                                                    |
+        Usage:          instance.attach(board, True)                                |
+                                                                                    |
+        Description:    Start journaling the changes made to board                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    record(self, entry: dict)                                   |   -> None
+                                                                                    |
+        Usage:          instance.record({"op": "notes", "text": ""})                |
+                                                                                    |
+        Description:    Append one change to the journal                            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    snapshot(self)                                              |   -> None
+                                                                                    |
+        Usage:          instance.snapshot()                                         |
+                                                                                    |
+        Description:    Write the whole board and truncate the journal              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    close(self)                                                 |   -> None
+                                                                                    |
+        Usage:          instance.close()                                            |
+                                                                                    |
+        Description:    Flush the journal to disk and stop journaling               |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, journal_file: str = journal_path, snapshot_file: str = snapshot_path,
+                 snapshot_interval: int = 500):
+        # where the journal and snapshot live
+        self.journal_path = journal_file
+        self.snapshot_path = snapshot_file
+
+        # how many entries are kept before compacting
+        self.snapshot_interval = snapshot_interval
+
+        # the last sequence number written and how many entries follow the snapshot
+        self.sequence = 0
+        self.entries_since_snapshot = 0
+
+        # the board and the open journal, set by attach
+        self.board = None
+        self._file = None
+
+    def has_snapshot(self) -> bool:
+        """
+        Parameter:      N/A
+
+        Called By:      startup() - VSS.py
+
+        Calls:          os.path.exists()
+
+        Modifies:       N/A
+
+        Return:         bool
+
+        Description:    return True if a snapshot has been written, every
+                        journal is started by writing one
+        """
+        return path.exists(self.snapshot_path)
+
+    def load(self) -> Board:
+        """
+        Parameter:      N/A
+
+        Called By:      startup() - VSS.py
+
+        Calls:          from_state(), apply_entry() - ScrumbanBoard.py
+
+        Modifies:       self.sequence
+                        self.entries_since_snapshot
+
+        Return:         Board
+
+        Description:    build the board from the snapshot, then replay the
+                        journal entries written after it. A torn last line left
+                        by a crash is ignored.
+        """
+        with open(self.snapshot_path, "r") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+
+        board = Board.from_state(snapshot["board"])
+        self.sequence = snapshot["sequence"]
+        self.entries_since_snapshot = 0
+
+        # no journal means nothing has changed since the snapshot
+        if not path.exists(self.journal_path):
+            return board
+
+        with open(self.journal_path, "r") as journal_file:
+            # line: each journal entry in the order it was written
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # only the last line can be torn, nothing follows it
+                    break
+
+                # the snapshot already includes this change
+                if entry["seq"] <= self.sequence:
+                    continue
+
+                board.apply_entry(entry)
+                self.sequence = entry["seq"]
+                self.entries_since_snapshot += 1
+
+        return board
+
+    def attach(self, board: Board, snapshot: bool = False) -> None:
+        """
+        Parameter:
+            board:      the board to journal
+            snapshot:   True to snapshot the board even if there is a snapshot,
+                        as when it was changed since it was loaded
+
+        Called By:      startup() - VSS.py
+
+        Calls:          snapshot()
+
+        Modifies:       self.board
+                        self._file
+                        board.journal
+
+        Return:         None
+
+        Description:    start journaling every change made to board. A board
+                        that wasn't loaded from a snapshot gets one first so
+                        the journal always has a starting point. A board that
+                        was changed outside the journal after it was loaded,
+                        as by starting the meeting, gets one so a crash
+                        replays to the same board.
+        """
+        self.board = board
+
+        makedirs(path.dirname(self.journal_path), exist_ok=True)
+        self._file = open(self.journal_path, "a")
+
+        if snapshot or not self.has_snapshot():
+            self.snapshot()
+
+        board.journal = self
+
+    def record(self, entry: dict) -> None:
+        """
+        Parameter:
+            entry:      the change, an "op" key and the fields it needs
+
+        Called By:      _record() - ScrumbanBoard.py
+
+        Calls:          snapshot()
+
+        Modifies:       self.sequence
+                        self.entries_since_snapshot
+                        the journal file
+
+        Return:         None
+
+        Description:    append the change to the journal as one line. Once
+                        snapshot_interval entries follow the snapshot the board
+                        is snapshotted, so the journal stays short.
+        """
+        self.sequence += 1
+        entry["seq"] = self.sequence
+        self._file.write(json.dumps(entry) + "\n")
+        # hand the line to the OS so a crash of the program doesn't lose it
+        self._file.flush()
+
+        self.entries_since_snapshot += 1
+        if self.entries_since_snapshot >= self.snapshot_interval:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      attach(), record() - ScrumbanJournal.py
+
+        Calls:          get_state() - ScrumbanBoard.py
+                        os.replace(), os.fsync()
+
+        Modifies:       self.entries_since_snapshot
+                        the snapshot file
+                        the journal file
+
+        Return:         None
+
+        Description:    write the whole board to a temporary file, move it over
+                        the old snapshot in one step and only then empty the
+                        journal
+        """
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w") as snapshot_file:
+            json.dump({"sequence": self.sequence, "board": self.board.get_state()}, snapshot_file)
+            snapshot_file.flush()
+            fsync(snapshot_file.fileno())
+        replace(temp_path, self.snapshot_path)
+
+        # every entry is in the snapshot now
+        self._file.seek(0)
+        self._file.truncate()
+        self.entries_since_snapshot = 0
+
+    def close(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      shutdown() - VSS.py
+
+        Calls:          os.fsync()
+
+        Modifies:       self._file
+                        self.board.journal
+
+        Return:         None
+
+        Description:    make sure every entry is on disk and stop journaling
+        """
+        if self._file is None:
+            return
+
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self.board.journal = None
@@ -0,0 +1,258 @@
+"""
+File: ScrumbanLock.py
+
+Description: This module is responsible for sharing a project directory
+             between several running copies of the Virtual Scrumban System.
+
+             It completes several tasks:
+
+             1. Lets one copy at a time be the writer of the project, the
+                others can only attach read only
+             2. Takes a shared lock while the saved files are read, so a copy
+                never reads the files of a save that is half done
+             3. Takes an exclusive lock while the files are written, so no
+                other copy reads or writes them at the same time
+
+             The locks are advisory fcntl locks on lock files next to
+             .sys_data, so resetting the project doesn't remove them. On
+             systems without fcntl only the threads of one copy are kept
+             apart.
+
+Dependencies: fcntl, threading, contextlib, os
+
+Date Created: 10/17/2026
+"""
+
+# used to lock the lock files, only on systems that have it
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+# used to keep the threads of this copy apart
+from threading import RLock
+# used to hold a lock for a block
+from contextlib import contextmanager
+# used to name the copy holding the writer lock
+from os import getpid
+
+# locked shared while the saved files are read and exclusive while they are written
+data_lock_path: str = ".vss_data.lock"
+
+# locked by the writer of the project for as long as it runs
+writer_lock_path: str = ".vss_writer.lock"
+
+
+class DataLock():
+    """
+    Advisory locks over the saved files of a project.
+
+    The data lock is shared by readers and exclusive for a writer. Within
+    one copy the lock is held by one thread at a time and can be taken again
+    by the thread holding it, so a save can call other saves. A shared lock
+    can't be turned into an exclusive one, as two readers doing so would
+    wait on each other forever.
+
+    The writer lock is taken without waiting when the system starts and kept
+    until it quits. A copy that can't get it only reads.
+
+    Used By:
+        VSS.py
+        ScrumbanHistory.py
+
+    Members:
+        Member Name:        : Type          : Default Val          -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.data_path      : str           : data_lock_path       -> the path of the data lock file
+        self.writer_path    : str           : writer_lock_path     -> the path of the writer lock file
+        self._thread_lock   : RLock         : -                    -> keeps the threads of this copy apart
+        self._data_file     : file          : None                 -> the open data lock file while it is locked
+        self._writer_file   : file          : None                 -> the open writer lock file while this copy is the writer
+        self._depth         : int           : 0                    -> how many times the holding thread took the data lock
+        self._exclusive     : bool          : False                -> True if the data lock is held exclusive
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _hold(self, exclusive: bool)                                |   -> context manager
+                                                                                    |
+        Usage:          with instance._hold(True):                                  |
+                                                                                    |
+        Description:    Hold the data lock for the block                            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    shared(self)                                                |   -> context manager
+                                                                                    |
+        Usage:          with instance.shared():                                     |
+                                                                                    |
+        Description:    Hold the data lock shared while the files are read          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    exclusive(self)                                             |   -> context manager
+                                                                                    |
+        Usage:          with instance.exclusive():                                  |
+                                                                                    |
+        Description:    Hold the data lock exclusive while the files are written    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    acquire_writer(self)                                        |   -> bool
+                                                                                    |
+        Usage:          instance.acquire_writer()                                   |
+                                                                                    |
+        Description:    Become the writer of the project if no other copy is        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    release_writer(self)                                        |   -> None
+                                                                                    |
+        Usage:          instance.release_writer()                                   |
+                                                                                    |
+        Description:    Let another copy become the writer                          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, data_path: str = data_lock_path, writer_path: str = writer_lock_path):
+        # where the lock files live
+        self.data_path = data_path
+        self.writer_path = writer_path
+
+        # the data lock, held by one thread of this copy at a time
+        self._thread_lock = RLock()
+        self._data_file = None
+        self._depth = 0
+        self._exclusive = False
+
+        # the writer lock, held from acquire_writer until release_writer
+        self._writer_file = None
+
+    @contextmanager
+    def _hold(self, exclusive: bool):
+        """
+        Parameter:
+            exclusive:  True to keep out every other copy, False to only keep
+                        out a writer
+
+        Called By:      shared(), exclusive() - ScrumbanLock.py
+
+        Calls:          fcntl.flock()
+
+        Modifies:       self._data_file
+                        self._depth
+                        self._exclusive
+
+        Return:         context manager
+
+        Description:    lock the data lock file for the block, waiting for the
+                        copies that hold it in a way that conflicts. The thread
+                        holding the lock can take it again, only the outermost
+                        block locks and unlocks the file. Raises RuntimeError
+                        for an exclusive lock inside a shared one.
+        """
+        with self._thread_lock:
+            if self._depth == 0:
+                self._data_file = open(self.data_path, "a")
+                if fcntl is not None:
+                    fcntl.flock(self._data_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                self._exclusive = exclusive
+            elif exclusive and not self._exclusive:
+                raise RuntimeError("the saved files can't be written while they are being read")
+
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    # closing the file unlocks it
+                    self._data_file.close()
+                    self._data_file = None
+
+    def shared(self):
+        """
+        Parameter:      N/A
+
+        Called By:      startup() - VSS.py
+                        read_project_backlog_file() - ScrumbanHistory.py
+
+        Calls:          _hold()
+
+        Modifies:       N/A
+
+        Return:         context manager
+
+        Description:    hold the data lock shared for the block, any number of
+                        copies can read at once but none can write
+        """
+        return self._hold(False)
+
+    def exclusive(self):
+        """
+        Parameter:      N/A
+
+        Called By:      startup(), shutdown() - VSS.py
+                        save_scrumban(), save_system_data(),
+                        reset_system() - ScrumbanHistory.py
+
+        Calls:          _hold()
+
+        Modifies:       N/A
+
+        Return:         context manager
+
+        Description:    hold the data lock exclusive for the block, no other
+                        copy reads or writes the files until it ends
+        """
+        return self._hold(True)
+
+    def acquire_writer(self) -> bool:
+        """
+        Parameter:      N/A
+
+        Called By:      __init__() - VSS.py
+
+        Calls:          fcntl.flock()
+
+        Modifies:       self._writer_file
+
+        Return:         bool - True if this copy is now the writer
+
+        Description:    take the writer lock without waiting and keep it. The
+                        process id of the writer is written into the lock file
+                        so it can be found. The lock is let go when the copy
+                        exits, even if it crashes.
+        """
+        if self._writer_file is not None:
+            return True
+
+        writer_file = open(self.writer_path, "a+")
+        if fcntl is not None:
+            try:
+                fcntl.flock(writer_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                writer_file.close()
+                return False
+
+        writer_file.seek(0)
+        writer_file.truncate()
+        writer_file.write(f"{getpid()}\n")
+        writer_file.flush()
+        self._writer_file = writer_file
+        return True
+
+    def release_writer(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      shutdown() - VSS.py
+
+        Calls:          N/A
+
+        Modifies:       self._writer_file
+
+        Return:         None
+
+        Description:    let go of the writer lock so the next copy to start can
+                        be the writer
+        """
+        if self._writer_file is not None:
+            # closing the file unlocks it
+            self._writer_file.close()
+            self._writer_file = None
@@ -0,0 +1,451 @@
+"""
+File: ScrumbanMeetings.py
+
+Description: This module is responsible for the history of what the board of
+             the Virtual Scrumban System looked like at each meeting.
+
+             It completes several tasks:
+
+             1. Splits each saved file into chunks at line boundaries picked by
+                the content of the lines, so an edit only changes the chunks
+                around it
+             2. Stores each chunk once, compressed and named by the hash of
+                its contents, so the data that didn't change between meetings
+                is shared by all of them
+             3. Records a manifest for each meeting of the chunks of every
+                file as it was last saved in that meeting
+             4. Restores the files of any past meeting, and removes the chunks
+                no meeting uses any more
+
+Dependencies: hashlib, json, zlib, os, datetime
+
+Date Created: 10/17/2026
+"""
+
+# used to name each chunk by its contents
+from hashlib import sha256
+# used to write the manifests
+import json
+# used to compress the chunks and pick the chunk boundaries
+from zlib import compress, crc32, decompress
+# used to find, write and remove the chunks and manifests
+from os import fsync, listdir, makedirs, path, remove, replace, stat
+# used to name the meeting
+from datetime import datetime
+
+# where the chunks and manifests are kept
+meetings_directory: str = ".sys_data/meetings"
+
+# the smallest and largest a chunk gets, in bytes. Files smaller than
+# min_chunk, as most team files are, are a single chunk
+min_chunk: int = 8192
+max_chunk: int = 65536
+
+# a line whose crc32 has none of these bits set ends a chunk past min_chunk,
+# about one line in 64
+boundary_mask: int = 0x3F
+
+
+def _chunks(file_path: str):
+    """
+    Parameter:
+        file_path:  the path of the file
+
+    Called By:      record() - ScrumbanMeetings.py
+
+    Calls:          zlib.crc32()
+
+    Modifies:       N/A
+
+    Return:         iterator[bytes]
+
+    Description:    yield the contents of the file in chunks that end at a line
+                    picked by its contents. The same lines end the same chunks
+                    wherever they are in the file, so a line added or removed
+                    only changes the chunk it is in. A line longer than
+                    max_chunk is cut into pieces of max_chunk.
+    """
+    # chunk: the lines of the chunk being built, size: their length in bytes
+    chunk = []
+    size = 0
+    with open(file_path, "rb") as chunked_file:
+        # line: each line of the file with its line ending
+        for line in chunked_file:
+            # piece: each max_chunk of the line
+            for start in range(0, len(line), max_chunk):
+                piece = line[start:start + max_chunk]
+                chunk.append(piece)
+                size += len(piece)
+                if size >= max_chunk or (size >= min_chunk and crc32(piece) & boundary_mask == 0):
+                    yield b"".join(chunk)
+                    chunk = []
+                    size = 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+class MeetingStore():
+    """
+    Content addressed store of the saved files of every meeting.
+
+    Each chunk is kept once in objects/ under the sha256 of its contents, and
+    each meeting has a manifest in manifests/ listing the chunks of every file
+    as it was last saved in the meeting. A save in the same meeting replaces
+    its manifest, so there is one per meeting. A file whose size and
+    modification time haven't changed since the last save isn't read again.
+
+    Used By:
+        ScrumbanHistory.py
+        VSS.py
+
+    Members:
+        Member Name:        : Type          : Default Val          -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.directory      : str           : meetings_directory   -> the directory holding the chunks and manifests
+        self.meeting        : str           : the time it started  -> the name of this meeting's manifest, YYYY-MM-DD_HH-MM-SS
+        self._known         : dict          : None                 -> the size, modification time and chunks of each file last
+                                                                      recorded, read from the newest manifest at the first record
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _object_path(self, digest: str)                             |   -> str
+                                                                                    |
+        Usage:          instance._object_path(digest)                               |
+                                                                                    |
+        Description:    Return the path of the chunk with the hash digest           |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _manifest_path(self, meeting: str)                          |   -> str
+                                                                                    |
+        Usage:          instance._manifest_path(meeting)                            |
+                                                                                    |
+        Description:    Return the path of the manifest of a meeting                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _put(self, chunk: bytes)                                    |   -> (str, bool)
+                                                                                    |
+        Usage:          instance._put(chunk)                                        |
+                                                                                    |
+        Description:    Store a chunk if it isn't stored yet, return its hash       |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    record(self, files: list[str])                              |   -> int
+                                                                                    |
+        Usage:          instance.record(history.get_data_files())                   |
+                                                                                    |
+        Description:    Record the files as this meeting's manifest, return the     |
+                        number of new chunks stored                                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_meetings(self)                                          |   -> list[str]
+                                                                                    |
+        Usage:          instance.get_meetings()                                     |
+                                                                                    |
+        Description:    Return the recorded meetings, oldest first                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    read_manifest(self, meeting: str)                           |   -> dict
+                                                                                    |
+        Usage:          instance.read_manifest("2026-10-17_09-00-00")               |
+                                                                                    |
+        Description:    Return the manifest of a meeting                            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    iter_file(self, meeting: str, file_path: str)               |   -> iterator[bytes]
+                                                                                    |
+        Usage:          instance.iter_file(meeting, "todo_backlog.txt")             |
+                                                                                    |
+        Description:    Stream a file as it was in a meeting, a chunk at a time     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    restore(self, meeting: str, directory: str)                 |   -> list[str]
+                                                                                    |
+        Usage:          instance.restore(meeting, "old_board")                      |
+                                                                                    |
+        Description:    Write every file of a meeting into directory                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    collect_garbage(self)                                       |   -> int
+                                                                                    |
+        Usage:          instance.collect_garbage()                                  |
+                                                                                    |
+        Description:    Remove the chunks no manifest uses, return how many         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, directory: str = meetings_directory):
+        # where the chunks and manifests live
+        self.directory = directory
+
+        # the meeting is named by the time the system started
+        self.meeting = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+        # the files as last recorded, read on the first record
+        self._known = None
+
+    def _object_path(self, digest: str) -> str:
+        """
+        Parameter:
+            digest:     the sha256 of a chunk in hex
+
+        Called By:      _put(), iter_file() - ScrumbanMeetings.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         str
+
+        Description:    return the path of the chunk, the first two characters
+                        of the hash name its directory so none gets too large
+        """
+        return path.join(self.directory, "objects", digest[:2], digest[2:])
+
+    def _manifest_path(self, meeting: str) -> str:
+        """
+        Parameter:
+            meeting:    the name of a meeting
+
+        Called By:      record(), read_manifest() - ScrumbanMeetings.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         str
+
+        Description:    return the path of the manifest of the meeting
+        """
+        return path.join(self.directory, "manifests", meeting + ".json")
+
+    def _put(self, chunk: bytes) -> tuple:
+        """
+        Parameter:
+            chunk:      the contents of a chunk
+
+        Called By:      record() - ScrumbanMeetings.py
+
+        Calls:          _object_path()
+                        hashlib.sha256(), zlib.compress()
+                        os.fsync(), os.replace()
+
+        Modifies:       the objects directory
+
+        Return:         (str, bool) - the hash of the chunk and whether it was
+                        new
+
+        Description:    store the chunk compressed under its hash unless a
+                        chunk with that hash is already stored. It is flushed to
+                        disk before the manifest that uses it is written.
+        """
+        digest = sha256(chunk).hexdigest()
+        object_path = self._object_path(digest)
+        if path.exists(object_path):
+            return digest, False
+
+        makedirs(path.dirname(object_path), exist_ok=True)
+        temp_path = object_path + ".tmp"
+        with open(temp_path, "wb") as object_file:
+            object_file.write(compress(chunk))
+            object_file.flush()
+            fsync(object_file.fileno())
+        replace(temp_path, object_path)
+        return digest, True
+
+    def record(self, files: list) -> int:
+        """
+        Parameter:
+            files:      the paths of the files the board was just saved to
+
+        Called By:      _record_meeting() - ScrumbanHistory.py
+
+        Calls:          _chunks(), _put(), _manifest_path(), get_meetings(),
+                        read_manifest()
+                        json.dump(), os.fsync(), os.replace()
+
+        Modifies:       the objects and manifests directories
+                        self._known
+
+        Return:         int - the number of chunks that weren't stored yet
+
+        Description:    write this meeting's manifest of the files. A file that
+                        has the size and modification time it had at the last
+                        record keeps its chunks without being read, the others
+                        are chunked and only their new chunks are stored. A
+                        missing file is left out. The manifest replaces the one
+                        of an earlier save in the same meeting in one step.
+        """
+        # the files as the newest meeting recorded them
+        if self._known is None:
+            meetings = self.get_meetings()
+            self._known = self.read_manifest(meetings[-1])["files"] if meetings else {}
+
+        # entries: the size, modification time and chunks of each file
+        entries = {}
+        # added: the chunks stored by this record
+        added = 0
+        # file_path: each file the board was saved to
+        for file_path in files:
+            try:
+                status = stat(file_path)
+            except OSError:
+                continue
+
+            known = self._known.get(file_path)
+            if known is not None and (known["size"], known["mtime_ns"]) == (status.st_size, status.st_mtime_ns):
+                entries[file_path] = known
+                continue
+
+            digests = []
+            # chunk: each chunk of the file as it is now
+            for chunk in _chunks(file_path):
+                digest, new = self._put(chunk)
+                digests.append(digest)
+                added += new
+            entries[file_path] = {"size": status.st_size, "mtime_ns": status.st_mtime_ns, "chunks": digests}
+
+        manifest_path = self._manifest_path(self.meeting)
+        makedirs(path.dirname(manifest_path), exist_ok=True)
+        temp_path = manifest_path + ".tmp"
+        with open(temp_path, "w") as manifest_file:
+            json.dump({"meeting": self.meeting, "saved": datetime.now().isoformat(timespec="seconds"),
+                       "files": entries}, manifest_file)
+            manifest_file.flush()
+            fsync(manifest_file.fileno())
+        replace(temp_path, manifest_path)
+
+        self._known = entries
+        return added
+
+    def get_meetings(self) -> list:
+        """
+        Parameter:      N/A
+
+        Called By:      record() - ScrumbanMeetings.py
+                        __main__ - VSS.py
+
+        Calls:          os.listdir()
+
+        Modifies:       N/A
+
+        Return:         list[str]
+
+        Description:    return the name of every recorded meeting, oldest
+                        first as the names start with the time
+        """
+        manifests = path.join(self.directory, "manifests")
+        if not path.isdir(manifests):
+            return []
+        return sorted(name[:-len(".json")] for name in listdir(manifests) if name.endswith(".json"))
+
+    def read_manifest(self, meeting: str) -> dict:
+        """
+        Parameter:
+            meeting:    the name of a recorded meeting
+
+        Called By:      record(), iter_file(), restore(),
+                        collect_garbage() - ScrumbanMeetings.py
+
+        Calls:          _manifest_path()
+                        json.load()
+
+        Modifies:       N/A
+
+        Return:         dict - the meeting, the time it was saved and the
+                        size, modification time and chunks of each file
+
+        Description:    return the manifest of the meeting, raises OSError if
+                        the meeting wasn't recorded
+        """
+        with open(self._manifest_path(meeting), "r") as manifest_file:
+            return json.load(manifest_file)
+
+    def iter_file(self, meeting: str, file_path: str):
+        """
+        Parameter:
+            meeting:    the name of a recorded meeting
+            file_path:  the path of a file as it was saved, as listed in the
+                        manifest
+
+        Called By:      restore() - ScrumbanMeetings.py
+
+        Calls:          read_manifest(), _object_path()
+                        zlib.decompress(), hashlib.sha256()
+
+        Modifies:       N/A
+
+        Return:         iterator[bytes]
+
+        Description:    yield the contents of the file as it was in the
+                        meeting, one chunk at a time. Raises KeyError if the
+                        meeting didn't save the file and ValueError if a chunk
+                        doesn't match its hash.
+        """
+        # digest: the hash of each chunk of the file in order
+        for digest in self.read_manifest(meeting)["files"][file_path]["chunks"]:
+            with open(self._object_path(digest), "rb") as object_file:
+                chunk = decompress(object_file.read())
+            if sha256(chunk).hexdigest() != digest:
+                raise ValueError(f"chunk {digest} of {file_path} is damaged")
+            yield chunk
+
+    def restore(self, meeting: str, directory: str) -> list:
+        """
+        Parameter:
+            meeting:    the name of a recorded meeting
+            directory:  where to write the files
+
+        Called By:      __main__ - VSS.py
+
+        Calls:          read_manifest(), iter_file()
+
+        Modifies:       the files in directory
+
+        Return:         list[str] - the paths of the files written
+
+        Description:    write each file of the meeting into directory under
+                        its own name, so the board of the meeting can be
+                        looked at without touching the files in use
+        """
+        makedirs(directory, exist_ok=True)
+        restored = []
+        # file_path: each file the meeting saved
+        for file_path in self.read_manifest(meeting)["files"]:
+            target = path.join(directory, path.basename(file_path))
+            with open(target, "wb") as restored_file:
+                restored_file.writelines(self.iter_file(meeting, file_path))
+            restored.append(target)
+        return restored
+
+    def collect_garbage(self) -> int:
+        """
+        Parameter:      N/A
+
+        Called By:      shutdown() - VSS.py
+
+        Calls:          get_meetings(), read_manifest()
+                        os.listdir(), os.remove()
+
+        Modifies:       the objects directory
+
+        Return:         int - the number of chunks removed
+
+        Description:    remove the chunks that no manifest uses any more, the
+                        ones only an earlier save of a meeting used, and the
+                        temporary files of an interrupted save
+        """
+        objects = path.join(self.directory, "objects")
+        if not path.isdir(objects):
+            return 0
+
+        # used: the hash of every chunk a manifest uses
+        used = set()
+        for meeting in self.get_meetings():
+            for entry in self.read_manifest(meeting)["files"].values():
+                used.update(entry["chunks"])
+
+        removed = 0
+        # prefix: the first two characters of the hashes of each directory
+        for prefix in listdir(objects):
+            for name in listdir(path.join(objects, prefix)):
+                if prefix + name not in used:
+                    remove(path.join(objects, prefix, name))
+                    removed += 1
+        return removed
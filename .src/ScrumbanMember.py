@@ -11,6 +11,65 @@ Last Edited:
 """
 from datetime import date
 
+
+def parse_date(text:str):
+    """
+    Parameter:
+        text:       a date in the form MM/DD/YYYY, or ""
+
+    Called By:      __init__() - ScrumbanMember.py (Task Class)
+
+    Calls:          datetime.date.toordinal()
+
+    Modifies:       N/A
+
+    Return:         int or str
+
+    Description:    convert a MM/DD/YYYY date into its day ordinal, 0 for a
+                    blank date. Text that isn't a real calendar day with a four
+                    digit year is returned unchanged so it is never lost.
+    """
+    # a blank date is stored as 0
+    if text == "":
+        return 0
+    fields = text.split('/')
+    # only convert dates that format back to the same day
+    if len(fields) != 3 or len(fields[2]) != 4:
+        return text
+    try:
+        return date(int(fields[2]), int(fields[0]), int(fields[1])).toordinal()
+    except ValueError:
+        return text
+
+# ----------------------------------------------------------- #
+# ----------------------------------------------------------- #
+
+def format_date(value) -> str:
+    """
+    Parameter:
+        value:      a day ordinal from parse_date(), or unparsed text
+
+    Called By:      get_due(), get_done() - ScrumbanMember.py (Task Class)
+
+    Calls:          datetime.date.fromordinal()
+
+    Modifies:       N/A
+
+    Return:         str
+
+    Description:    convert a day ordinal back into a MM/DD/YYYY string, "" for 0
+    """
+    # unparsed text is kept as it was read
+    if isinstance(value, str):
+        return value
+    if value == 0:
+        return ""
+    day = date.fromordinal(value)
+    return f'{day.month:02d}/{day.day:02d}/{day.year}'
+
+#=========================================================================#
+#=========================================================================#
+
 class Task():
     """
     Encapsulate task data for the ScrumbanBoard module.
@@ -23,11 +82,13 @@ class Task():
         ------------------------------------------------------------------------------------------------------------------------------------------
         self.name           : str       : -            -> a name or descriptor of the task
 
-        self.priority       : str       : -            -> the task's numeric priority (0-99+)
+        self.priority       : int       : -            -> the task's numeric priority (0-99+)
+
+        self.due_date       : int       : -            -> the task's due date as a day ordinal, 0 if it has none
 
-        self.due_date       : str       : -            -> the task's due date in the form MM/DD/YYYY
+        self.completed_date : int       : -            -> the task's completed date as a day ordinal, 0 if not completed
 
-        self.complete_date  : str       : -            -> the task's completed date in the form MM/DD/YYYY
+        self.uid            : int       : None         -> the task's stable id, assigned by the Board that holds it
 
     Methods:
 
@@ -51,6 +112,12 @@ class Task():
                                                                                     |
         Description:    Return the priority of the task                             |
         ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_priority_value(self)                                    |   -> priority of the task as an int
+                                                                                    |
+        Usage:          instance.get_priority_value()                               |
+                                                                                    |
+        Description:    Return the parsed priority of the task for comparisons      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
         Declaration:    get_due(self)                                               |   -> date task must be completed by (MM/DD/YYYY)
                                                                                     |      as a string
         Usage:          instance.get_due()                                          |
@@ -63,7 +130,31 @@ class Task():
                                                                                     |
         Description:    Return the date the task was completed                      |
         ----------------------------------------------------------------------------|-------------------------------------------------
-        Declaration:    set_completed_date(self)                                    |   -> None
+        Declaration:    get_due_ordinal(self)                                       |   -> day ordinal of the due date or None
+                                                                                    |
+        Usage:          instance.get_due_ordinal()                                  |
+                                                                                    |
+        Description:    Return the due date as a day ordinal for comparisons        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_done_ordinal(self)                                      |   -> day ordinal of the completed date
+                                                                                    |      or None
+        Usage:          instance.get_done_ordinal()                                 |
+                                                                                    |
+        Description:    Return the completed date as a day ordinal for comparisons  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_uid(self)                                               |   -> stable id of the task as an int
+                                                                                    |
+        Usage:          instance.get_uid()                                          |
+                                                                                    |
+        Description:    Return the id the Board uses to locate the task             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_uid(self, uid:int)                                      |   -> None
+                                                                                    |
+        Usage:          instance.set_uid(int)                                       |
+                                                                                    |
+        Description:    Set the id the Board uses to locate the task                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_completed_date(self, done=None)                         |   -> None
                                                                                     |
         Usage:          instance.set_completed_date()                               |
                                                                                     |
@@ -84,11 +175,16 @@ class Task():
         ----------------------------------------------------------------------------|-------------------------------------------------
 
     """
-    def __init__(self, name:str, priority:str, due:str, done_date:str):
+    # fixed attribute layout, tasks are the most numerous objects in the system
+    __slots__ = ("name", "priority", "due_date", "completed_date", "uid")
+
+    def __init__(self, name:str, priority:str, due:str, done_date:str, uid:int = None):
         self.name = name
-        self.priority = priority
-        self.due_date = due
-        self.completed_date = done_date
+        # parse once here so sorting and reporting never re-parse
+        self.priority = int(priority)
+        self.due_date = parse_date(due)
+        self.completed_date = parse_date(done_date)
+        self.uid = uid
 
     # ----------------------------------------------------------- #
     # ----------------------------------------------------------- #
@@ -130,6 +226,25 @@ class Task():
 
         Description:    return the priority of the Task instance.
         """
+        return str(self.priority)
+
+    # ----------------------------------------------------------- #
+    # ----------------------------------------------------------- #
+
+    def get_priority_value(self) -> int:
+        """
+        Parameter:      N/A
+
+        Called By:      push(), heapify() - ScrumbanQueue.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return the priority of the Task instance as an int.
+        """
         return self.priority
 
     # ----------------------------------------------------------- #
@@ -149,7 +264,7 @@ class Task():
 
         Description:    return the due date of the Task MM/DD/YYYY.
         """
-        return self.due_date
+        return format_date(self.due_date)
 
     # ----------------------------------------------------------- #
     # ----------------------------------------------------------- #
@@ -168,16 +283,102 @@ class Task():
 
         Description:    return the completed date of the Task MM/DD/YYYY.
         """
+        return format_date(self.completed_date)
+
+    # ----------------------------------------------------------- #
+    # ----------------------------------------------------------- #
+
+    def get_due_ordinal(self):
+        """
+        Parameter:      N/A
+
+        Called By:      N/A
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int or None
+
+        Description:    return the due date of the Task as a day ordinal, None
+                        if the task has no due date or it isn't a real date.
+        """
+        if isinstance(self.due_date, str) or self.due_date == 0:
+            return None
+        return self.due_date
+
+    # ----------------------------------------------------------- #
+    # ----------------------------------------------------------- #
+
+    def get_done_ordinal(self):
+        """
+        Parameter:      N/A
+
+        Called By:      N/A
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int or None
+
+        Description:    return the completed date of the Task as a day ordinal,
+                        None if the task has not been completed.
+        """
+        if isinstance(self.completed_date, str) or self.completed_date == 0:
+            return None
         return self.completed_date
 
     # ----------------------------------------------------------- #
     # ----------------------------------------------------------- #
 
-    def set_completed_date(self) -> None:
+    def get_uid(self) -> int:
         """
         Parameter:      N/A
 
-        Called By:      complete_task() - ScrumbanBoard.py
+        Called By:      Board - ScrumbanBoard.py
+                        fill_tasks_data() - ScrumbanInterface.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return the stable id of the Task instance, None if
+                        the task has not been added to a Board.
+        """
+        return self.uid
+
+    # ----------------------------------------------------------- #
+    # ----------------------------------------------------------- #
+
+    def set_uid(self, uid:int) -> None:
+        """
+        Parameter:
+            uid:        the stable id for the task
+
+        Called By:      _register_task() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       self.uid
+
+        Return:         None
+
+        Description:    set the stable id of the Task instance
+        """
+        self.uid = uid
+
+    # ----------------------------------------------------------- #
+    # ----------------------------------------------------------- #
+
+    def set_completed_date(self, done=None) -> None:
+        """
+        Parameter:      done: the day ordinal (or unparsed date text) to
+                        use, None for the current date
+
+        Called By:      _relocate() - ScrumbanBoard.py
 
         Calls:          datetime.date.today()
 
@@ -186,11 +387,11 @@ class Task():
         Return:         None
 
         Description:    set the completed data for the Task to the
-                        current date MM/DD/YYYY
+                        current date, or to done when a move is undone
         """
-        # re-format for consistency
-        date_list = str(date.today()).split('-')
-        self.completed_date = f'{date_list[1]}/{date_list[2]}/{date_list[0]}'
+        if done is None:
+            done = date.today().toordinal()
+        self.completed_date = done
 
     # ----------------------------------------------------------- #
     # ----------------------------------------------------------- #
@@ -210,7 +411,7 @@ class Task():
         Description:    create and return a string representation of all
                         Task instance's data as a single, tab-delimited str
         """
-        return f'{self.name}\t{self.priority}\t{self.due_date}\t{self.completed_date}'
+        return f'{self.name}\t{self.priority}\t{self.get_due()}\t{self.get_done()}'
 
     # ----------------------------------------------------------- #
     # ----------------------------------------------------------- #
@@ -219,7 +420,7 @@ class Task():
         """
         Parameter:      N/A
 
-        Called By:      get_string_project_backlog() - ScrumbanBoard.py
+        Called By:      get_string_todo() - ScrumbanBoard.py
 
         Calls:          N/A
 
@@ -230,7 +431,7 @@ class Task():
         Description:    create and return a list representation of all
                         Task instance's data
         """
-        return [self.name, self.priority, self.due_date, self.completed_date]
+        return [self.name, str(self.priority), self.get_due(), self.get_done()]
 
 #=========================================================================#
 #=========================================================================#
@@ -449,7 +650,7 @@ class ScrumbanMember():
             questions_concerns:     string to set questions_concerns
                                     field to
 
-        Called By:      save_text() - ScrumbanInterface.py
+        Called By:      set_member_qc(), apply_entry() - ScrumbanBoard.py
 
         Calls:          N/A
 
@@ -0,0 +1,822 @@
+"""
+File: ScrumbanQueue.py
+
+Description: This module is responsible for holding the project backlog of the
+             Virtual Scrumban System in priority order.
+
+             It completes several tasks:
+
+             1. Bulk loads the project backlog in linear time
+             2. Pushes and pops tasks in logarithmic time
+             3. Iterates the backlog in priority order for display and saving
+             4. Ages waiting tasks so low priorities are not starved
+             5. Copies the backlog for a save, so it is sorted and formatted
+                on the thread that writes it
+
+Dependencies: heapq
+
+Date Created: 10/17/2026
+"""
+
+# used to keep the backlog as a binary heap
+import heapq
+# used to stamp tasks with the day they were queued
+from datetime import date
+# used to number tasks in the order they were queued
+from itertools import count
+
+from ScrumbanMember import format_date
+
+
+class AgingPolicy():
+    """
+    Rule for raising the priority of a task the longer it waits in the project
+    backlog.
+
+    Every interval_days days a task waits, its effective priority number drops
+    by step, but never below floor. The task's own priority is not changed, so
+    the files keep the priority the user gave it.
+
+    Used By:
+        ScrumbanQueue.py
+        VSS.py
+
+    Members:
+        Member Name:        : Type      : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.interval_days  : int       : 7            -> how many days a task waits for each step
+
+        self.step           : int       : 1            -> how much the priority number drops each interval
+
+        self.floor          : int       : 1            -> the lowest priority number aging can reach
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    effective(self, priority: int, queued: int, today: int)     |   -> int
+                                                                                    |
+        Usage:          instance.effective(4, 738000, 738014)                       |
+                                                                                    |
+        Description:    Return the priority a task has after waiting                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    next_boundary(self, priority: int, queued: int, today: int) |   -> int or None
+                                                                                    |
+        Usage:          instance.next_boundary(4, 738000, 738014)                   |
+                                                                                    |
+        Description:    Return the day the effective priority next changes          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, interval_days: int = 7, step: int = 1, floor: int = 1):
+        self.interval_days = interval_days
+        self.step = step
+        self.floor = floor
+
+    def effective(self, priority: int, queued: int, today: int) -> int:
+        """
+        Parameter:
+            priority:   the task's own priority
+            queued:     the day ordinal the task was queued
+            today:      the day ordinal to age the task to
+
+        Called By:      _effective() - ScrumbanQueue.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return the task's priority after aging, a task that
+                        already beats the floor is never made worse
+        """
+        intervals = max(0, (today - queued) // self.interval_days)
+        return min(priority, max(self.floor, priority - self.step * intervals))
+
+    def next_boundary(self, priority: int, queued: int, today: int):
+        """
+        Parameter:
+            priority:   the task's own priority
+            queued:     the day ordinal the task was queued
+            today:      the day ordinal the task has been aged to
+
+        Called By:      _schedule() - ScrumbanQueue.py
+
+        Calls:          effective()
+
+        Modifies:       N/A
+
+        Return:         int or None
+
+        Description:    return the first day after today on which the effective
+                        priority changes, None once it has reached the floor or
+                        if the policy never changes it
+        """
+        if self.step <= 0 or self.effective(priority, queued, today) <= self.floor:
+            return None
+        intervals = max(0, (today - queued) // self.interval_days)
+        return queued + self.interval_days * (intervals + 1)
+
+
+class TaskQueue():
+    """
+    Priority queue of Task objects used for the project backlog.
+
+    Tasks are ordered by their effective priority (lowest number first) and
+    tasks with the same effective priority keep the order they were queued in.
+    Without an aging policy the effective priority is the task's own priority.
+
+    With an aging policy a second heap holds the day each task's effective
+    priority next changes. Aging only visits the tasks that crossed a boundary:
+    each one gets a new heap entry and its old entry is marked dead, to be
+    dropped when it reaches the top of the heap.
+
+    Used By:
+        ScrumbanBoard.py
+
+    Members:
+        Member Name:        : Type                  : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self._heap          : list[list]            : []           -> binary heap of [effective priority, sequence number, serial,
+                                                                      Task] entries, the Task is None in a dead entry
+
+        self._sequence      : itertools.count       : count()      -> hands out increasing sequence numbers so equal priorities
+                                                                      stay in insertion order
+
+        self._serial        : itertools.count       : count()      -> numbers every heap entry so a dead entry and a live one
+                                                                      for the same place are never compared on their Task
+
+        self._tasks         : dict[int, Task]       : {}           -> the queued tasks keyed by their stable id
+
+        self._entries       : dict[int, list]       : {}           -> the live heap entry of each queued task
+
+        self._queued        : dict[int, int]        : {}           -> the day ordinal each queued task was first queued
+
+        self._dead          : int                   : 0            -> the number of dead entries in the heap
+
+        self._policy        : AgingPolicy           : None         -> how tasks age, None if they don't
+
+        self._boundaries    : list[tuple]           : []           -> heap of (day, stable id) for the day each task's effective
+                                                                      priority next changes
+
+        self._next_boundary : dict[int, int]        : {}           -> the boundary day currently scheduled for each task
+
+        self._day           : int                   : today        -> the day ordinal the queue has been aged to
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    push(self, task: Task, place: tuple = None)                 |   -> None
+                                                                                    |
+        Usage:          instance.push(Task)                                         |
+                                                                                    |
+        Description:    Add a task to the queue in O(log n)                         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    remove(self, uid: int)                                      |   -> ((int, int), Task) place and task
+                                                                                    |
+        Usage:          instance.remove(12)                                         |
+                                                                                    |
+        Description:    Remove a task by its stable id in amortized O(log n)        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    pop(self)                                                   |   -> Task with the highest priority
+                                                                                    |
+        Usage:          instance.pop()                                              |
+                                                                                    |
+        Description:    Remove and return the next task in O(log n)                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    peek(self)                                                  |   -> Task with the highest priority
+                                                                                    |
+        Usage:          instance.peek()                                             |
+                                                                                    |
+        Description:    Return the next task without removing it                    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    heapify(self, tasks: iterable[Task])                        |   -> None
+                                                                                    |
+        Usage:          instance.heapify([Task, Task])                              |
+                                                                                    |
+        Description:    Add many tasks at once in O(n)                              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get(self, uid: int)                                         |   -> Task with the id uid or None
+                                                                                    |
+        Usage:          instance.get(12)                                            |
+                                                                                    |
+        Description:    Find a queued task by its stable id in O(1)                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    tasks(self)                                                 |   -> iterable of the queued Tasks
+                                                                                    |
+        Usage:          instance.tasks()                                            |
+                                                                                    |
+        Description:    Return the queued tasks in no particular order              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    entries(self)                                               |   -> iterator of (int, Task, int)
+                                                                                    |
+        Usage:          instance.entries()                                          |
+                                                                                    |
+        Description:    Iterate the sequence number, task and queued day of every   |
+                        queued task                                                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    rows(self)                                                  |   -> BacklogRows
+                                                                                    |
+        Usage:          instance.rows()                                             |
+                                                                                    |
+        Description:    Copy the queue for saving without sorting it                |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    restore(self, entries: iterable[(int, Task, int)])          |   -> None
+                                                                                    |
+        Usage:          instance.restore([(0, Task, 738000)])                       |
+                                                                                    |
+        Description:    Add tasks with the sequence numbers and queued days they    |
+                        were saved with                                             |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_queued_days(self, days: dict[int, int])                 |   -> None
+                                                                                    |
+        Usage:          instance.set_queued_days({12: 738000})                      |
+                                                                                    |
+        Description:    Set the day queued tasks were first queued                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    get_queued_day(self, uid: int)                              |   -> int
+                                                                                    |
+        Usage:          instance.get_queued_day(12)                                 |
+                                                                                    |
+        Description:    Return the day a task was first queued                      |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    set_policy(self, policy: AgingPolicy, today: int = None)    |   -> None
+                                                                                    |
+        Usage:          instance.set_policy(AgingPolicy(7))                         |
+                                                                                    |
+        Description:    Start or stop aging, recomputing every task once            |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    age(self, today: int = None)                                |   -> int
+                                                                                    |
+        Usage:          instance.age()                                              |
+                                                                                    |
+        Description:    Reorder the tasks that crossed an aging boundary, return    |
+                        how many were reordered                                     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, tasks=(), policy: AgingPolicy = None):
+        # the heap of [effective priority, sequence, serial, task] entries
+        self._heap = []
+
+        # sequence numbers keep equal priorities in insertion order
+        self._sequence = count()
+
+        # serial numbers tell apart entries with the same priority and sequence,
+        # as a removed task leaves a dead entry that an undo can queue it beside
+        self._serial = count()
+
+        # the queued tasks and their live heap entries keyed by their stable id
+        self._tasks = {}
+        self._entries = {}
+
+        # the day each queued task was queued. A task that leaves takes its day
+        # with it, so an undo that returns it doesn't reset its age
+        self._queued = {}
+
+        # the number of entries removed or replaced by aging that are still in the heap
+        self._dead = 0
+
+        # how tasks age and when each one next changes
+        self._policy = policy
+        self._boundaries = []
+        self._next_boundary = {}
+        self._day = date.today().toordinal()
+
+        # bulk load any tasks given to the constructor
+        self.heapify(tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __bool__(self) -> bool:
+        return len(self._tasks) > 0
+
+    def __contains__(self, uid: int) -> bool:
+        return uid in self._tasks
+
+    def __iter__(self):
+        """
+        Parameter:      N/A
+
+        Called By:      _project_backlog_button_clicked() - ScrumbanInterface.py
+                        _refresh_todo_button_clicked() - ScrumbanInterface.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         iterator[Task]
+
+        Description:    iterate the tasks in the order they would be popped,
+                        without changing the queue
+        """
+        # the live entries are unique on (priority, sequence) so the tasks
+        # themselves are never compared
+        for entry in sorted(self._entries.values()):
+            yield entry[3]
+
+    def _effective(self, task, today: int) -> int:
+        """
+        Parameter:
+            task:       a queued task
+            today:      the day ordinal to age the task to
+
+        Called By:      _add(), set_policy(), age() - ScrumbanQueue.py
+
+        Calls:          [AgingPolicy].effective()
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return the priority the task is ordered by
+        """
+        if self._policy is None:
+            return task.get_priority_value()
+        return self._policy.effective(task.get_priority_value(), self._queued[task.get_uid()], today)
+
+    def _schedule(self, task, today: int) -> None:
+        """
+        Parameter:
+            task:       a queued task
+            today:      the day ordinal the task has been aged to
+
+        Called By:      push(), heapify(), restore(), set_policy(), age()
+                        - ScrumbanQueue.py
+
+        Calls:          [AgingPolicy].next_boundary()
+                        heapq.heappush()
+
+        Modifies:       self._boundaries
+                        self._next_boundary
+
+        Return:         None
+
+        Description:    remember the next day the task's effective priority
+                        changes, if it ever does
+        """
+        uid = task.get_uid()
+        self._next_boundary.pop(uid, None)
+        if self._policy is None:
+            return
+
+        boundary = self._policy.next_boundary(task.get_priority_value(), self._queued[uid], today)
+        if boundary is not None:
+            self._next_boundary[uid] = boundary
+            heapq.heappush(self._boundaries, (boundary, uid))
+
+    def _add(self, task, sequence: int, today: int) -> list:
+        """
+        Parameter:
+            task:       the task being queued
+            sequence:   its sequence number
+            today:      the day ordinal to age it to
+
+        Called By:      push(), heapify(), restore() - ScrumbanQueue.py
+
+        Calls:          _effective()
+
+        Modifies:       self._tasks
+                        self._entries
+                        self._queued
+
+        Return:         list
+
+        Description:    record the task and return its heap entry, which the
+                        caller puts in the heap
+        """
+        uid = task.get_uid()
+        self._queued.setdefault(uid, date.today().toordinal())
+        self._tasks[uid] = task
+        entry = [self._effective(task, today), sequence, next(self._serial), task]
+        self._entries[uid] = entry
+        return entry
+
+    def _prune(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      remove(), peek(), age() - ScrumbanQueue.py
+
+        Calls:          heapq.heappop(), heapq.heapify()
+
+        Modifies:       self._heap
+                        self._dead
+
+        Return:         None
+
+        Description:    drop dead entries from the top of the heap, and rebuild
+                        the heap without them once they outnumber the live ones
+        """
+        if self._dead > len(self._tasks):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+            self._dead = 0
+            return
+
+        while self._heap and self._heap[0][3] is None:
+            heapq.heappop(self._heap)
+            self._dead -= 1
+
+    def push(self, task, place: tuple = None) -> None:
+        """
+        Parameter:
+            task:       Task to add to the queue
+            place:      the (sequence number, queued day) remove() returned
+                        for the task, None to queue it today behind tasks
+                        with the same priority
+
+        Called By:      _place() - ScrumbanBoard.py
+
+        Calls:          _add(), _schedule()
+                        heapq.heappush()
+
+        Modifies:       self._heap
+                        self._tasks
+                        self._queued
+
+        Return:         None
+
+        Description:    add a task to the queue behind any queued tasks with
+                        the same priority, or back in its old place and with
+                        its old age when an undo returns it
+        """
+        if place is None:
+            sequence = next(self._sequence)
+        else:
+            sequence, self._queued[task.get_uid()] = place
+        heapq.heappush(self._heap, self._add(task, sequence, self._day))
+        self._schedule(task, self._day)
+
+    def remove(self, uid: int):
+        """
+        Parameter:
+            uid:        the stable id of the queued task to remove
+
+        Called By:      pop() - ScrumbanQueue.py
+                        _take() - ScrumbanBoard.py
+
+        Calls:          _prune()
+
+        Modifies:       self._heap
+                        self._tasks
+                        self._queued
+                        self._dead
+
+        Return:         ((int, int), Task)
+
+        Description:    remove the task with the id uid and return its sequence
+                        number and queued day with it so it can be queued again
+                        in the same place at the same age. The queue keeps
+                        nothing of a task once it leaves. The task's entry is
+                        left in the heap marked dead, the same as an entry
+                        replaced by aging, and dropped when it reaches the top
+                        or the heap is rebuilt. This costs O(log n) amortized
+                        wherever the task is queued.
+        """
+        task = self._tasks.pop(uid)
+        entry = self._entries.pop(uid)
+        queued = self._queued.pop(uid)
+        self._next_boundary.pop(uid, None)
+
+        # kill the entry, the heap doesn't need to move for it
+        entry[3] = None
+        self._dead += 1
+        self._prune()
+        return (entry[1], queued), task
+
+    def pop(self):
+        """
+        Parameter:      N/A
+
+        Called By:      __init__() - ScrumbanBoard.py
+
+        Calls:          peek(), remove()
+
+        Modifies:       self._heap
+                        self._tasks
+
+        Return:         Task
+
+        Description:    remove and return the task with the highest priority,
+                        raises IndexError if the queue is empty
+        """
+        return self.remove(self.peek().get_uid())[1]
+
+    def peek(self):
+        """
+        Parameter:      N/A
+
+        Called By:      backlog_to_todo() - ScrumbanBoard.py
+
+        Calls:          _prune()
+
+        Modifies:       self._heap
+
+        Return:         Task
+
+        Description:    return the task with the highest priority without
+                        removing it, raises IndexError if the queue is empty
+        """
+        self._prune()
+        return self._heap[0][3]
+
+    def heapify(self, tasks) -> None:
+        """
+        Parameter:
+            tasks:      iterable of Tasks to add to the queue
+
+        Called By:      __init__() - ScrumbanQueue.py
+                        __init__() - ScrumbanBoard.py
+
+        Calls:          _add(), _schedule()
+                        heapq.heapify()
+
+        Modifies:       self._heap
+                        self._tasks
+
+        Return:         None
+
+        Description:    add every task in tasks to the queue, rebuilding the
+                        heap once instead of pushing each task
+        """
+        # task: each task being added, numbered in the order given
+        for task in tasks:
+            self._heap.append(self._add(task, next(self._sequence), self._day))
+            self._schedule(task, self._day)
+
+        # restore the heap property in linear time
+        heapq.heapify(self._heap)
+
+    def get(self, uid: int):
+        """
+        Parameter:
+            uid:        the stable id of the task to find
+
+        Called By:      get_task() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         Task or None
+
+        Description:    return the queued task with the id uid, or None if
+                        no such task is queued
+        """
+        return self._tasks.get(uid)
+
+    def tasks(self):
+        """
+        Parameter:      N/A
+
+        Called By:      __init__() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         iterable[Task]
+
+        Description:    return the queued tasks in no particular order, for
+                        callers that don't need them sorted
+        """
+        return self._tasks.values()
+
+    def entries(self):
+        """
+        Parameter:      N/A
+
+        Called By:      get_state() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         iterator[(int, Task, int)]
+
+        Description:    iterate the sequence number, task and queued day of
+                        every queued task, which is enough to restore the queue
+        """
+        for uid, entry in self._entries.items():
+            yield entry[1], entry[3], self._queued[uid]
+
+    def rows(self):
+        """
+        Parameter:      N/A
+
+        Called By:      get_string_project_backlog() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         BacklogRows
+
+        Description:    copy the place and fields of every queued task in
+                        O(n), leaving the sort and the formatting for whoever
+                        iterates the copy. The copy doesn't change with the
+                        queue or its tasks, so it can be handed to another
+                        thread.
+        """
+        return BacklogRows([(entry[0], entry[1], entry[3].name, entry[3].priority,
+                             entry[3].due_date, entry[3].completed_date)
+                            for entry in self._entries.values()])
+
+    def restore(self, entries) -> None:
+        """
+        Parameter:
+            entries:    iterable of (sequence number, Task, queued day) from
+                        entries()
+
+        Called By:      from_state() - ScrumbanBoard.py
+
+        Calls:          _add(), _schedule()
+                        heapq.heapify()
+
+        Modifies:       self._heap
+                        self._tasks
+                        self._queued
+                        self._sequence
+
+        Return:         None
+
+        Description:    add the tasks back with their saved sequence numbers and
+                        queued days so they keep their order and age, and carry
+                        on numbering after the largest sequence number
+        """
+        # last: the largest sequence number restored
+        last = -1
+        for sequence, task, queued in entries:
+            self._queued[task.get_uid()] = queued
+            self._heap.append(self._add(task, sequence, self._day))
+            self._schedule(task, self._day)
+            last = max(last, sequence)
+
+        heapq.heapify(self._heap)
+        self._sequence = count(max(last + 1, next(self._sequence)))
+
+    def set_queued_days(self, days: dict) -> None:
+        """
+        Parameter:
+            days:       the day ordinal each task was first queued, keyed by
+                        stable id
+
+        Called By:      __init__() - ScrumbanBoard.py
+
+        Calls:          set_policy()
+
+        Modifies:       self._queued
+
+        Return:         None
+
+        Description:    set the day the tasks were queued, as read back from the
+                        files, and reorder the queue for their ages
+        """
+        self._queued.update(days)
+        self.set_policy(self._policy, self._day)
+
+    def get_queued_day(self, uid: int) -> int:
+        """
+        Parameter:
+            uid:        the stable id of a task that has been queued
+
+        Called By:      get_queued_days() - ScrumbanBoard.py
+
+        Calls:          N/A
+
+        Modifies:       N/A
+
+        Return:         int
+
+        Description:    return the day ordinal the task was first queued
+        """
+        return self._queued[uid]
+
+    def set_policy(self, policy: AgingPolicy, today: int = None) -> None:
+        """
+        Parameter:
+            policy:     how tasks age, None to order by priority alone
+            today:      the day ordinal to age the tasks to, defaults to today
+
+        Called By:      set_queued_days() - ScrumbanQueue.py
+                        set_aging_policy() - ScrumbanBoard.py
+
+        Calls:          _effective(), _schedule()
+                        heapq.heapify()
+
+        Modifies:       self._policy
+                        self._heap
+                        self._boundaries
+                        self._day
+
+        Return:         None
+
+        Description:    age every task to today under the new policy and
+                        rebuild both heaps in linear time. This is the one
+                        place every task is visited, after it age only touches
+                        the tasks that cross a boundary.
+        """
+        self._policy = policy
+        self._day = date.today().toordinal() if today is None else today
+
+        self._boundaries = []
+        self._next_boundary = {}
+        # entry: each live entry, given its aged priority
+        for entry in self._entries.values():
+            entry[0] = self._effective(entry[3], self._day)
+            self._schedule(entry[3], self._day)
+
+        # the dead entries are dropped by rebuilding from the live ones
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+        self._dead = 0
+
+    def age(self, today: int = None) -> int:
+        """
+        Parameter:
+            today:      the day ordinal to age the tasks to, defaults to today
+
+        Called By:      backlog_to_todo() - ScrumbanBoard.py
+
+        Calls:          _effective(), _schedule(), _prune()
+                        heapq.heappop(), heapq.heappush()
+
+        Modifies:       self._heap
+                        self._boundaries
+                        self._day
+
+        Return:         int
+
+        Description:    move every task whose effective priority changed since
+                        the last aging to its new place. Each one costs
+                        O(log n), so aging is proportional to the tasks that
+                        crossed a boundary, not the size of the backlog.
+        """
+        self._day = date.today().toordinal() if today is None else today
+
+        # moved: how many tasks changed place
+        moved = 0
+        while self._boundaries and self._boundaries[0][0] <= self._day:
+            boundary, uid = heapq.heappop(self._boundaries)
+
+            # the task left the queue or was rescheduled since
+            if self._next_boundary.get(uid) != boundary:
+                continue
+
+            # kill the old entry and push the task at its new priority
+            entry = self._entries[uid]
+            task = entry[3]
+            entry[3] = None
+            self._dead += 1
+
+            new_entry = [self._effective(task, self._day), entry[1], next(self._serial), task]
+            self._entries[uid] = new_entry
+            heapq.heappush(self._heap, new_entry)
+            self._schedule(task, self._day)
+            moved += 1
+
+        self._prune()
+        return moved
+
+
+class BacklogRows():
+    """
+    The string rows of the project backlog as they are passed from the board
+    to the history, in the same form as Task.listify().
+
+    The rows are copied from the queue in no particular order, and are only
+    sorted into priority order and formatted the first time they are
+    iterated. An autosave iterates them on its background thread, so the
+    interface thread never sorts the backlog to save it.
+
+    Used By:
+        ScrumbanQueue.py
+        ScrumbanWatcher.py
+
+    Members:
+        Member Name:        : Type              : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self._entries       : list[tuple]       : -            -> (effective priority, sequence number, name, priority, due date,
+                                                                  completed date) of each task
+
+        self._rows          : list[list[str]]   : None         -> the formatted rows in priority order, None until first iterated
+    """
+
+    def __init__(self, entries: list):
+        # the copied tasks, unique on (effective priority, sequence)
+        self._entries = entries
+        self._rows = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        # sort and format once, later passes reuse the rows
+        if self._rows is None:
+            self._rows = [[name, str(priority), format_date(due), format_date(done)]
+                          for _, _, name, priority, due, done in sorted(self._entries)]
+        return iter(self._rows)
@@ -0,0 +1,254 @@
+"""
+File: ScrumbanSchema.py
+
+Description: This module is responsible for the versions of the file formats
+             of the Virtual Scrumban System.
+
+             It completes several tasks:
+
+             1. Names the current version of each file the system saves, and
+                writes it as the first line of the file
+             2. Reads the version of a saved file, files from before versions
+                were written are version 0
+             3. Leaves the files the user gives the system as they are until
+                the system saves them
+             4. Upgrades an old file one version at a time as a stream of
+                lines into a temporary file, so a file of any size is upgraded
+                in constant memory and is only replaced once it is complete
+
+Dependencies: os, shutil
+
+Date Created: 10/17/2026
+"""
+
+# used to replace an upgraded file and flush it to disk
+from os import fsync, path, replace
+# used to keep the permissions of an upgraded file
+from shutil import copymode
+
+# the start of the first line of every versioned file
+header_prefix: str = "#VSS "
+
+# the current version of the format of each kind of file
+file_versions: dict = {
+    "project_backlog": 1,
+    "members": 1,
+    "todo_backlog": 1,
+    "completed_tasks": 1,
+    "completed_archive": 1,
+    "sys_data": 1,
+    "queued_days": 1,
+}
+
+# the kinds of file the user writes and gives the system, one without a header
+# hasn't been saved by the system yet and is read as the user wrote it
+input_kinds: set = {"project_backlog", "members"}
+
+
+def _header(kind: str, version: int) -> str:
+    """
+    Parameter:
+        kind:       the kind of file, a key of file_versions
+        version:    the version of its format
+
+    Called By:      format_header(), _add_header() - ScrumbanSchema.py
+
+    Calls:          N/A
+
+    Modifies:       N/A
+
+    Return:         str
+
+    Description:    return the first line of a file of kind at version
+    """
+    return f"{header_prefix}{kind} {version}\n"
+
+
+def format_header(kind: str) -> str:
+    """
+    Parameter:
+        kind:       the kind of file, a key of file_versions
+
+    Called By:      the save methods - ScrumbanHistory.py
+                    add() - ScrumbanArchive.py
+
+    Calls:          _header()
+
+    Modifies:       N/A
+
+    Return:         str
+
+    Description:    return the first line of a file of kind saved now
+    """
+    return _header(kind, file_versions[kind])
+
+
+def is_header(line) -> bool:
+    """
+    Parameter:
+        line:       a line of a file, str or bytes
+
+    Called By:      the load methods - ScrumbanHistory.py
+                    build_completed_index() - ScrumbanCompleted.py
+                    iter_tasks() - ScrumbanArchive.py
+
+    Calls:          N/A
+
+    Modifies:       N/A
+
+    Return:         bool
+
+    Description:    return True if line is a version header, which the readers
+                    skip
+    """
+    if isinstance(line, bytes):
+        return line.startswith(header_prefix.encode())
+    return line.startswith(header_prefix)
+
+
+def parse_header(line: str, kind: str) -> int:
+    """
+    Parameter:
+        line:       the first line of a file
+        kind:       the kind of file it should be
+
+    Called By:      read_version() - ScrumbanSchema.py
+
+    Calls:          is_header()
+
+    Modifies:       N/A
+
+    Return:         int
+
+    Description:    return the version of the format the file is in, 0 if it
+                    has no header. Raises ValueError if the header is for
+                    another kind of file or a version newer than this system
+                    knows, as upgrading it could only lose data.
+    """
+    if not is_header(line):
+        return 0
+
+    fields = line.split()
+    if len(fields) != 3 or fields[1] != kind or not fields[2].isdigit():
+        raise ValueError(f"'{line.strip()}' is not a {kind} header")
+
+    version = int(fields[2])
+    if version > file_versions[kind]:
+        raise ValueError(f"the {kind} file is version {version}, this system reads up to {file_versions[kind]}")
+    return version
+
+
+def read_version(file_path: str, kind: str) -> int:
+    """
+    Parameter:
+        file_path:  the path of the file
+        kind:       the kind of file it is
+
+    Called By:      migrate_file() - ScrumbanSchema.py
+
+    Calls:          parse_header()
+
+    Modifies:       N/A
+
+    Return:         int
+
+    Description:    return the version of the format of the file from its
+                    first line, only that line is read
+    """
+    with open(file_path, "r") as versioned_file:
+        return parse_header(versioned_file.readline(), kind)
+
+
+def _add_header(kind: str):
+    """
+    Parameter:
+        kind:       the kind of file
+
+    Called By:      migrations - ScrumbanSchema.py
+
+    Calls:          _header()
+
+    Modifies:       N/A
+
+    Return:         function
+
+    Description:    return the migration from version 0 to version 1, which
+                    only puts the header in front of the lines
+    """
+    def migrate(lines):
+        yield _header(kind, 1)
+        yield from lines
+    return migrate
+
+
+# migrations[kind][version]: a generator that turns the lines of a file of kind
+# at version, header included, into the lines of the next version
+migrations: dict = {kind: [_add_header(kind)] for kind in file_versions}
+
+
+def migrate_file(file_path: str, kind: str) -> int:
+    """
+    Parameter:
+        file_path:  the path of the file
+        kind:       the kind of file it is
+
+    Called By:      migrate_files() - ScrumbanSchema.py
+
+    Calls:          read_version()
+                    each migration of kind from the file's version on
+                    os.fsync(), os.replace(), shutil.copymode()
+
+    Modifies:       the file
+
+    Return:         int - the number of versions the file was upgraded by
+
+    Description:    upgrade the file to the current version of its kind. The
+                    migrations are chained as generators over the lines of
+                    the file, so each line is read, upgraded and written
+                    before the next one is read. The upgraded file is written
+                    to a temporary file and only moved over the old one once
+                    it is on disk. A missing or empty file is left alone, and
+                    so is an input file the system hasn't saved, it gets its
+                    header when the system first saves it.
+    """
+    if not path.exists(file_path) or path.getsize(file_path) == 0:
+        return 0
+
+    version = read_version(file_path, kind)
+    if version == file_versions[kind] or (version == 0 and kind in input_kinds):
+        return 0
+
+    temp_path = file_path + ".tmp"
+    # newline="" keeps the line endings of the file as they are
+    with open(file_path, "r", newline="") as source, open(temp_path, "w", newline="") as target:
+        # lines: the lines of the file, upgraded by each step in turn
+        lines = iter(source)
+        for step in migrations[kind][version:]:
+            lines = step(lines)
+        target.writelines(lines)
+        target.flush()
+        fsync(target.fileno())
+
+    # the upgraded file keeps the permissions the user gave it
+    copymode(file_path, temp_path)
+    replace(temp_path, file_path)
+    return file_versions[kind] - version
+
+
+def migrate_files(files: list) -> list:
+    """
+    Parameter:
+        files:      (path, kind) of each file to upgrade
+
+    Called By:      upgrade_files() - ScrumbanHistory.py
+
+    Calls:          migrate_file()
+
+    Modifies:       the files
+
+    Return:         list[str] - the paths of the files that were upgraded
+
+    Description:    upgrade each file to the current version of its kind, one
+                    file at a time
+    """
+    return [file_path for file_path, kind in files if migrate_file(file_path, kind) > 0]
@@ -0,0 +1,175 @@
+"""
+File: ScrumbanSnapshot.py
+
+Description: This module is responsible for the fast warm start of the Virtual
+             Scrumban System.
+
+             It completes several tasks:
+
+             1. Writes the fully built board into a binary snapshot when the
+                system shuts down, together with the size and modification
+                time of every file the board was saved to
+             2. Loads the board straight from the snapshot at the next boot if
+                none of those files changed, instead of parsing them again
+
+Dependencies: pickle, os
+
+Date Created: 10/17/2026
+"""
+
+# used to write the board in binary
+import pickle
+# used to check the saved files and replace the snapshot atomically
+from os import fsync, makedirs, path, replace, stat
+
+from ScrumbanBoard import Board
+
+# where the snapshot is kept
+boot_snapshot_path: str = ".sys_data/boot_snapshot.bin"
+
+# raised when the layout of the snapshot changes so old snapshots are ignored
+snapshot_version: int = 1
+
+
+class BootSnapshot():
+    """
+    Binary copy of the board as it was last saved, keyed by the files it was
+    saved to.
+
+    The key is the size and modification time of each file. Any change to a
+    file, by the system or by hand, changes the key and the snapshot is
+    ignored, so the board is only ever loaded from the snapshot when parsing
+    the files would have built the same board.
+
+    Used By:
+        VSS.py
+
+    Members:
+        Member Name:        : Type          : Default Val          -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.snapshot_path  : str           : boot_snapshot_path   -> the path of the snapshot file
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _file_key(files: list[str])                                 |   -> list[tuple]
+                                                                                    |
+        Usage:          BootSnapshot._file_key(files)                               |
+                                                                                    |
+        Description:    Static method that returns the path, size and modification |
+                        time of each file, None for a missing file                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    save(self, board: Board, files: list[str])                  |   -> None
+                                                                                    |
+        Usage:          instance.save(board, files)                                 |
+                                                                                    |
+        Description:    Write the board keyed by the files it was just saved to     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    load(self, files: list[str])                                |   -> Board or None
+                                                                                    |
+        Usage:          instance.load(files)                                        |
+                                                                                    |
+        Description:    Return the board if none of the files changed, else None    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, snapshot_file: str = boot_snapshot_path):
+        # where the snapshot lives
+        self.snapshot_path = snapshot_file
+
+    @staticmethod
+    def _file_key(files: list) -> list:
+        """
+        Parameter:
+            files:      the paths of the files the board is saved to
+
+        Called By:      save(), load() - ScrumbanSnapshot.py
+
+        Calls:          os.stat()
+
+        Modifies:       N/A
+
+        Return:         list[tuple]
+
+        Description:    return (path, size, modification time in nanoseconds)
+                        for each file, or (path, None, None) if it is missing
+        """
+        key = []
+        # file_path: each file the board is saved to
+        for file_path in files:
+            try:
+                status = stat(file_path)
+            except OSError:
+                key.append((file_path, None, None))
+                continue
+            key.append((file_path, status.st_size, status.st_mtime_ns))
+        return key
+
+    def save(self, board: Board, files: list) -> None:
+        """
+        Parameter:
+            board:      the board that was just saved
+            files:      the paths of the files it was saved to
+
+        Called By:      shutdown() - VSS.py
+
+        Calls:          _file_key()
+                        pickle.dump(), os.fsync(), os.replace()
+
+        Modifies:       the snapshot file
+
+        Return:         None
+
+        Description:    write the board and the key of the files to a temporary
+                        file and move it over the old snapshot in one step
+        """
+        makedirs(path.dirname(self.snapshot_path), exist_ok=True)
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "wb") as snapshot_file:
+            # the key goes first so a stale board is never unpickled
+            pickle.dump((snapshot_version, self._file_key(files)), snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(board, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            snapshot_file.flush()
+            fsync(snapshot_file.fileno())
+        replace(temp_path, self.snapshot_path)
+
+    def load(self, files: list):
+        """
+        Parameter:
+            files:      the paths of the files the board is saved to
+
+        Called By:      startup() - VSS.py
+
+        Calls:          _file_key()
+                        start_meeting() - ScrumbanBoard.py
+                        pickle.load()
+
+        Modifies:       N/A
+
+        Return:         Board or None
+
+        Description:    return the board from the snapshot, reset for a new
+                        meeting, if every file is as it was when the snapshot
+                        was written. Return None if there is no usable snapshot
+                        so the files are parsed instead.
+        """
+        if not path.exists(self.snapshot_path):
+            return None
+
+        try:
+            with open(self.snapshot_path, "rb") as snapshot_file:
+                # the key is read first, the board only if the files haven't changed
+                version, key = pickle.load(snapshot_file)
+                if version != snapshot_version or key != self._file_key(files):
+                    return None
+                board = pickle.load(snapshot_file)
+        except Exception:
+            # a damaged snapshot is only a missed shortcut
+            return None
+
+        board.start_meeting()
+        return board
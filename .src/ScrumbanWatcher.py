@@ -0,0 +1,272 @@
+"""
+File: ScrumbanWatcher.py
+
+Description: This module is responsible for picking up the edits made to the
+             project backlog file while the Virtual Scrumban System is open.
+
+             It completes several tasks:
+
+             1. Polls the size and modification time of the project backlog
+                file from the interface event loop
+             2. Waits for an edited file to settle and be valid before it is
+                read, and ignores the files the system saves itself
+             3. Diffs the file against the tasks it held before by task name,
+                and applies only the inserted, removed and changed tasks to
+                the board
+
+Dependencies: os
+
+Date Created: 10/17/2026
+"""
+
+# used to check whether the file changed
+from os import stat
+
+from ScrumbanMember import parse_date
+from ScrumbanQueue import BacklogRows
+
+# how often the file is checked, in milliseconds
+poll_interval: int = 1000
+
+
+def _file_status(file_path: str):
+    """
+    Parameter:
+        file_path:  the path of the file
+
+    Called By:      start(), _poll() - ScrumbanWatcher.py
+
+    Calls:          os.stat()
+
+    Modifies:       N/A
+
+    Return:         (int, int) or None
+
+    Description:    return the size and modification time in nanoseconds of
+                    the file, None if it doesn't exist
+    """
+    try:
+        status = stat(file_path)
+    except OSError:
+        return None
+    return status.st_size, status.st_mtime_ns
+
+
+def _keyed(rows: list) -> dict:
+    """
+    Parameter:
+        rows:       the fields of each task, name, priority and due date first
+
+    Called By:      diff_backlog(), _reload() - ScrumbanWatcher.py
+
+    Calls:          parse_date() - ScrumbanMember.py
+
+    Modifies:       N/A
+
+    Return:         dict[str, (int, int)]
+
+    Description:    return the priority and due date of each task by name, in
+                    the form the board keeps them so "1/2/2026" and
+                    "01/02/2026" are the same day
+    """
+    return {row[0]: (int(row[1]), parse_date(row[2])) for row in rows}
+
+
+def diff_backlog(old_rows: list, new_rows: list) -> tuple:
+    """
+    Parameter:
+        old_rows:   the tasks the file held before
+        new_rows:   the tasks the file holds now
+
+    Called By:      _reload() - ScrumbanWatcher.py
+
+    Calls:          _keyed()
+
+    Modifies:       N/A
+
+    Return:         (list[list[str]], list[str], list[list[str]])
+
+    Description:    return the rows of the tasks added to the file, the names
+                    of the tasks taken out of it and the rows of the tasks
+                    whose priority or due date changed, in file order
+    """
+    old = _keyed(old_rows)
+    new = _keyed(new_rows)
+
+    inserted = [row for row in new_rows if row[0] not in old]
+    removed = [row[0] for row in old_rows if row[0] not in new]
+    changed = [row for row in new_rows if row[0] in old and old[row[0]] != new[row[0]]]
+    return inserted, removed, changed
+
+
+class BacklogWatcher():
+    """
+    Live reload of the project backlog file.
+
+    The file is checked every poll_interval milliseconds. A change is read
+    once the file has had the same size and modification time for two polls,
+    so an editor that is still writing it isn't read half way. A file the
+    system saved itself holds what history last wrote and is only taken as
+    the new starting point.
+
+    Used By:
+        VSS.py
+
+    Members:
+        Member Name:        : Type              : Default Val   -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self.system         : VSS               : -             -> the system whose board the edits are applied to
+        self._rows          : list[list[str]]   : []            -> the tasks the file held when it was last read
+        self._status        : (int, int)        : None          -> the size and modification time of the file when it was last read
+        self._changed       : (int, int)        : None          -> the size and modification time seen at the last poll while they
+                                                                   differ from self._status
+        self._window        : Tk                : None          -> the window whose event loop runs the polls
+
+    Methods:
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _poll(self)                                                 |   -> None
+                                                                                    |
+        Usage:          window.after(poll_interval, instance._poll)                 |
+                                                                                    |
+        Description:    Check the file and reload it once its change settled        |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _reload(self, status: (int, int))                           |   -> int
+                                                                                    |
+        Usage:          instance._reload(status)                                    |
+                                                                                    |
+        Description:    Apply the changes in the file to the board, return how      |
+                        many tasks changed                                          |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    start(self, window: Tk)                                     |   -> None
+                                                                                    |
+        Usage:          instance.start(interface)                                   |
+                                                                                    |
+        Description:    Read the file as it is and start polling it                 |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self, system):
+        # the system whose board is kept up to date
+        self.system = system
+
+        # the file as it was last read
+        self._rows = []
+        self._status = None
+        self._changed = None
+
+        # the window whose event loop polls the file
+        self._window = None
+
+    def start(self, window) -> None:
+        """
+        Parameter:
+            window:     the Tk window whose event loop runs the polls
+
+        Called By:      startup() - VSS.py
+
+        Calls:          _file_status()
+                        read_project_backlog_file() - ScrumbanHistory.py
+                        after() - tkinter
+
+        Modifies:       self._rows
+                        self._status
+                        self._window
+
+        Return:         None
+
+        Description:    take the file as it is now as the starting point and
+                        check it every poll_interval milliseconds
+        """
+        history = self.system.history
+        self._status = _file_status(history.get_project_backlog_path())
+        self._rows = history.read_project_backlog_file() or []
+
+        self._window = window
+        window.after(poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      the Tk event loop
+
+        Calls:          _file_status(), _reload()
+                        is_saving() - ScrumbanAutosave.py
+                        after() - tkinter
+
+        Modifies:       self._changed
+
+        Return:         None
+
+        Description:    reload the file once it has changed and looked the
+                        same for two polls. While an autosave is writing, the
+                        file and history may not agree, so it waits for it.
+        """
+        status = _file_status(self.system.history.get_project_backlog_path())
+        autosave = self.system.autosave
+
+        if status is not None and status != self._status:
+            if status == self._changed and (autosave is None or not autosave.is_saving()):
+                self._reload(status)
+            else:
+                self._changed = status
+
+        self._window.after(poll_interval, self._poll)
+
+    def _reload(self, status) -> int:
+        """
+        Parameter:
+            status:     the size and modification time of the file being read
+
+        Called By:      _poll() - ScrumbanWatcher.py
+
+        Calls:          diff_backlog(), _keyed()
+                        read_project_backlog_file(), get_project_backlog(),
+                        set_project_backlog() - ScrumbanHistory.py
+                        apply_backlog_changes() - ScrumbanBoard.py
+                        refresh_project_backlog() - ScrumbanInterface.py
+
+        Modifies:       self._rows
+                        self._status
+                        self.system.board
+                        self.system.history
+
+        Return:         int - the number of tasks changed on the board
+
+        Description:    read the file and apply what changed since it was
+                        last read to the board. An invalid file is left until
+                        it is edited again. A file holding what history last
+                        wrote was saved by the system, the board already has
+                        it.
+        """
+        self._status = status
+        history = self.system.history
+
+        rows = history.read_project_backlog_file()
+        if rows is None:
+            print("PROJECT BACKLOG NOT RELOADED: THE FILE HAS INVALID LINES")
+            return 0
+
+        # the system's own save, only the starting point moves. Until the
+        # project backlog is first saved history only holds the rows the
+        # board was streamed from, which have been read.
+        saved = history.get_project_backlog()
+        if isinstance(saved, (list, BacklogRows)) and _keyed(rows) == _keyed(saved):
+            self._rows = rows
+            return 0
+
+        inserted, removed, changed = diff_backlog(self._rows, rows)
+        self._rows = rows
+
+        applied = self.system.board.apply_backlog_changes(inserted, removed, changed)
+        # history holds the file as it is now until the board is saved over it
+        history.set_project_backlog(rows)
+        if applied:
+            self.system.interface.refresh_project_backlog()
+            print(f"RELOADED PROJECT BACKLOG: {len(inserted)} ADDED, {len(removed)} REMOVED, {len(changed)} CHANGED")
+        return applied
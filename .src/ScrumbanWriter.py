@@ -0,0 +1,205 @@
+"""
+File: ScrumbanWriter.py
+
+Description: This module is responsible for writing the files of the Virtual
+             Scrumban System safely.
+
+             It completes several tasks:
+
+             1. Collects everything one save writes, one buffer per file
+             2. Writes each rewritten file to a temporary file and moves it over
+                the old one, so a crash never leaves a half written file
+             3. Flushes the whole save to disk together
+
+Dependencies: os, shutil
+
+Date Created: 10/17/2026
+"""
+
+# used to flush files to disk and move them into place
+from os import close, fsync, open as os_open, path, replace, O_RDONLY
+# used to keep the permissions of the files being replaced
+from shutil import copymode
+
+
+class BatchWriter():
+    """
+    Group of file writes that are committed together.
+
+    Nothing touches the disk until commit. Files that are rewritten are built
+    in memory, written in one call to a temporary file next to the target and
+    renamed over it once every file of the batch has been flushed, so each
+    file is either the old version or the new one. Appends and in place
+    overwrites of existing files are also written in one call each. Every file
+    of the batch is flushed before anything is renamed, and each directory
+    holding a renamed file is flushed once at the end.
+
+    Used By:
+        ScrumbanHistory.py
+
+    Members:
+        Member Name:        : Type              : Default Val  -> Description
+        ------------------------------------------------------------------------------------------------------------------------------------------
+        self._writes        : dict[str, str]    : {}           -> the whole new contents of each file being rewritten
+
+        self._appends       : dict[str, str]    : {}           -> the text added to the end of each file being appended to
+
+        self._overwrites    : dict[str, list]   : {}           -> (offset, text) written in place over each existing file
+
+    Methods:
+
+        Public:                                                                      Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    write(self, file_path: str, text: str)                      |   -> None
+                                                                                    |
+        Usage:          instance.write("todo_backlog.txt", "Task, 1, 1/1/2022\n")   |
+                                                                                    |
+        Description:    Replace the contents of a file                              |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    append(self, file_path: str, text: str)                     |   -> None
+                                                                                    |
+        Usage:          instance.append("completed_tasks.csv", "Task, ...\n")       |
+                                                                                    |
+        Description:    Add text to the end of a file                               |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    overwrite(self, file_path: str, offset: int, text: str)     |   -> None
+                                                                                    |
+        Usage:          instance.overwrite("completed_tasks.csv", 0, title)         |
+                                                                                    |
+        Description:    Write text over an existing file at offset                  |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    commit(self)                                                |   -> None
+                                                                                    |
+        Usage:          instance.commit()                                           |
+                                                                                    |
+        Description:    Write, flush and move every file of the batch into place    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+    """
+
+    def __init__(self):
+        # the pending changes, keyed by file path
+        self._writes = {}
+        self._appends = {}
+        self._overwrites = {}
+
+    def write(self, file_path: str, text: str) -> None:
+        """
+        Parameter:
+            file_path:  the file to replace
+            text:       its new contents
+
+        Called By:      _save_project_backlog(), _save_members(), _save_todo_backlog(),
+                        _save_completed_tasks(), _save_queued_days(), save_scrumban(),
+                        save_system_data() - ScrumbanHistory.py
+
+        Calls:          N/A
+
+        Modifies:       self._writes
+
+        Return:         None
+
+        Description:    replace the contents of the file when the batch commits
+        """
+        self._writes[file_path] = text
+
+    def append(self, file_path: str, text: str) -> None:
+        """
+        Parameter:
+            file_path:  an existing file
+            text:       the text to add to its end
+
+        Called By:      _save_completed_tasks() - ScrumbanHistory.py
+
+        Calls:          N/A
+
+        Modifies:       self._appends
+
+        Return:         None
+
+        Description:    add text to the end of the file when the batch commits
+        """
+        self._appends[file_path] = self._appends.get(file_path, "") + text
+
+    def overwrite(self, file_path: str, offset: int, text: str) -> None:
+        """
+        Parameter:
+            file_path:  an existing file
+            offset:     the byte where text starts
+            text:       the text to write over the file
+
+        Called By:      _update_completed_title() - ScrumbanHistory.py
+
+        Calls:          N/A
+
+        Modifies:       self._overwrites
+
+        Return:         None
+
+        Description:    write text over the file at offset when the batch
+                        commits, the length of the file doesn't change unless
+                        text runs past its end
+        """
+        self._overwrites.setdefault(file_path, []).append((offset, text))
+
+    def commit(self) -> None:
+        """
+        Parameter:      N/A
+
+        Called By:      save_scrumban(), save_system_data() - ScrumbanHistory.py
+
+        Calls:          os.fsync(), os.replace(), shutil.copymode()
+
+        Modifies:       self._writes
+                        self._appends
+                        self._overwrites
+                        the files of the batch
+
+        Return:         None
+
+        Description:    write every file of the batch with one write call each
+                        and flush them to disk. Rewritten files go to a
+                        temporary file first and are only renamed over their
+                        targets once every file is on disk. The directories of
+                        the renamed files are flushed last so the renames
+                        survive a crash too.
+        """
+        # temporaries: (temporary file, target file) of each rewritten file
+        temporaries = []
+        for file_path, text in self._writes.items():
+            temp_path = file_path + ".tmp"
+            with open(temp_path, "w") as temp_file:
+                temp_file.write(text)
+                temp_file.flush()
+                fsync(temp_file.fileno())
+            # a replaced file keeps the permissions the user gave it
+            if path.exists(file_path):
+                copymode(file_path, temp_path)
+            temporaries.append((temp_path, file_path))
+
+        # file_path: each existing file written to in place
+        for file_path in self._overwrites.keys() | self._appends.keys():
+            with open(file_path, "r+b") as target_file:
+                for offset, text in self._overwrites.get(file_path, ()):
+                    target_file.seek(offset)
+                    target_file.write(text.encode())
+                if file_path in self._appends:
+                    target_file.seek(0, 2)
+                    target_file.write(self._appends[file_path].encode())
+                target_file.flush()
+                fsync(target_file.fileno())
+
+        # every file is on disk, move the new versions into place
+        for temp_path, file_path in temporaries:
+            replace(temp_path, file_path)
+
+        # directory: each directory holding a renamed file, flushed once
+        for directory in {path.dirname(path.abspath(file_path)) for _, file_path in temporaries}:
+            descriptor = os_open(directory, O_RDONLY)
+            try:
+                fsync(descriptor)
+            finally:
+                close(descriptor)
+
+        self._writes = {}
+        self._appends = {}
+        self._overwrites = {}
@@ -5,10 +5,20 @@ Date:   02/16/2022
 Last Edit: 02/16/   Sam Gebhardt    Created File
 """
 import sys
+from argparse import ArgumentParser, ArgumentTypeError
 from os import path
-from ScrumbanInterface import ScrumbanInterface, GetInitializingInfo
+from ScrumbanInterface import ScrumbanInterface, GetInitializingInfo, at_risk_days
 from ScrumbanHistory import ScrumbanHistory
-from ScrumbanBoard import Board
+from ScrumbanDatabase import ScrumbanDatabase
+from ScrumbanBoard import Board, PROJECT, TODO, MEMBER, COMPLETED, NOTES
+from ScrumbanJournal import BoardJournal
+from ScrumbanSnapshot import BootSnapshot
+from ScrumbanQueue import AgingPolicy
+from ScrumbanArchive import CompletedArchive
+from ScrumbanAutosave import Autosaver
+from ScrumbanWatcher import BacklogWatcher
+from ScrumbanMeetings import MeetingStore
+from ScrumbanLock import DataLock
 
 
 class VSS():
@@ -29,10 +39,41 @@ class VSS():
 
         self.interface          : ScrumbanInterface : -             -> A singleton instance of ScrumbanInterface
 
-        self.history            : ScrumbanHistory   : -             -> A singleton instance of ScrumbanHistory
+        self.history            : ScrumbanHistory   : -             -> A singleton instance of ScrumbanHistory, a ScrumbanDatabase
+                                                                       when the system is started with --storage sqlite
 
         self.board              : ScrumbanBoard     : -             -> A singleton instance of ScrumbanBoard
 
+        self.journal            : BoardJournal      : None          -> Journals every change to the board when the system is
+                                                                       started with --journal, None otherwise
+
+        self.aging_policy       : AgingPolicy       : None          -> How project backlog tasks gain priority as they wait,
+                                                                       None if they don't
+
+        self.boot_snapshot      : BootSnapshot      : -             -> The board as it was saved at the last shutdown, loaded
+                                                                       at boot when its files haven't changed
+
+        self.archive            : CompletedArchive  : None          -> Where completed tasks older than self.archive_days go
+                                                                       at boot, None if they stay in the completed tasks file
+
+        self.archive_days       : int               : 0             -> How many days a completed task stays in the completed
+                                                                       tasks file
+
+        self.autosave           : Autosaver         : None          -> Saves the board in the background while the meeting
+                                                                       runs, None if it is only saved when quitting
+
+        self.watcher            : BacklogWatcher    : None          -> Applies the edits made to the project backlog file while
+                                                                       the meeting runs, None if they wait for a restart
+
+        self.meetings           : MeetingStore      : None          -> Keeps the saved files of every meeting, None if only the
+                                                                       latest board is kept
+
+        self.lock               : DataLock          : -             -> Keeps other copies of the system running in the same
+                                                                       directory from reading the files while they are saved
+
+        self.read_only          : bool              : False         -> True if this copy only shows the board and never saves it,
+                                                                       as asked for or because another copy is the writer
+
     Methods:
 
         Public:                                                                      Return:
@@ -65,9 +106,32 @@ class VSS():
                                                                                     |
         Description:    Shutdown the system by saving the information stored in     |
                         self.board, send emails to team members and close the UI    |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+
+        Private:                                                                     Return:
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _set_changed_parts(self)                                    |   ->  set[str]
+                                                                                    |
+        Usage:          instance._set_changed_parts()                               |
+                                                                                    |
+        Description:    Hand history the parts of the board changed since saved     |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _save_changed_parts(self, changed: set)                     |   ->  None
+                                                                                    |
+        Usage:          instance._save_changed_parts(changed)                       |
+                                                                                    |
+        Description:    Save the changed parts and report the skipped files         |
+        ----------------------------------------------------------------------------|-------------------------------------------------
+        Declaration:    _upgrade_files(self)                                        |   ->  None
+                                                                                    |
+        Usage:          instance._upgrade_files()                                   |
+                                                                                    |
+        Description:    Bring the saved files in older formats up to date           |
     """
 
-    def __init__(self):
+    def __init__(self, journal: bool = False, aging_days: int = 0, storage: str = "text",
+                 load_threads: int = 1, archive_days: int = 0, autosave_seconds: float = 0,
+                 reload_backlog: bool = False, meeting_history: bool = False, read_only: bool = False):
 
         # the max number of tasks in the todo backlog
         self.todo_limit = 0
@@ -77,12 +141,49 @@ class VSS():
         # The ScrumbanInterface singleton instance for the program
         self.interface = ScrumbanInterface(self)
 
-        # The ScrumbanHistory singleton instance for the program
-        self.history = ScrumbanHistory()
+        # The ScrumbanHistory singleton instance for the program, kept in text files or a database
+        self.history = ScrumbanDatabase() if storage == "sqlite" else ScrumbanHistory()
+        # Read the saved files with load_threads threads
+        self.history.set_load_threads(load_threads)
+
+        # Only one copy running in this directory saves the board, the others attach read only
+        self.lock = DataLock()
+        self.read_only = read_only or not self.lock.acquire_writer()
+        if self.read_only and not read_only:
+            print("ANOTHER COPY IS SAVING THIS PROJECT, ATTACHING READ ONLY")
+        # Saves lock out the other copies, reads only lock out a save
+        self.history.set_data_lock(self.lock)
 
         # The ScrumbanBoard singleton instance for the program
         self.board = Board([],[],[],[],[])
 
+        # The journal of board changes, only used in the event sourced mode
+        self.journal = BoardJournal() if journal else None
+
+        # The board kept between meetings for a fast start
+        self.boot_snapshot = BootSnapshot()
+
+        # Waiting project backlog tasks gain one priority level every aging_days days, if asked for
+        self.aging_policy = AgingPolicy(aging_days) if aging_days > 0 else None
+
+        # Completed tasks older than archive_days days are moved out of the completed tasks file at boot
+        self.archive = CompletedArchive() if archive_days > 0 and not self.read_only else None
+        self.archive_days = archive_days
+
+        # The board is saved in the background autosave_seconds after the last change, if asked
+        # for, the journal already keeps every change so it isn't needed with one
+        self.autosave = Autosaver(self, int(autosave_seconds * 1000)) \
+            if autosave_seconds > 0 and not journal and not self.read_only else None
+
+        # Edits to the project backlog file are picked up while the board is open, if asked for.
+        # Only the text storage keeps the project backlog in that file
+        self.watcher = BacklogWatcher(self) if reload_backlog and storage == "text" and not journal else None
+
+        # Each save records the files of this meeting, sharing what didn't change with past
+        # meetings, if asked for. The journal keeps its own history of every change
+        self.meetings = MeetingStore() if meeting_history and not journal and not self.read_only else None
+        self.history.set_meeting_store(self.meetings)
+
     def startup(self) -> None:
         """
         Parameter:      N/A
@@ -93,13 +194,27 @@ class VSS():
                         set_project_backlog_path(), check_valid_member_file(),
                         set_members_path(), load_scrumban(), get_project_backlog(),
                         get_todo_backlog(), get_member_list(), get_completed_tasks(),
-                        get_agenda(), read_system_data() - ScrumbanHistory.py
+                        get_agenda(), read_system_data(), get_data_files(),
+                        load_completed_tasks(), archive_completed_tasks()
+                        - ScrumbanHistory.py
+
+                        _upgrade_files() - VSS.py
 
                         get_project_backlog_input(), set_message_box(),
                         get_members_input(), set_board_data(), mainloop()
                         - ScrumbanInterface.py
 
-                        __init__ - ScrumbanBoard
+                        __init__, mark_unsaved(), page_completed(), start_meeting() - ScrumbanBoard
+
+                        has_snapshot(), load(), attach() - ScrumbanJournal.py
+
+                        load() - ScrumbanSnapshot.py
+
+                        start() - ScrumbanAutosave.py
+
+                        start() - ScrumbanWatcher.py
+
+                        shared(), exclusive() - ScrumbanLock.py
 
         Modifies:       self.history, self.board, self.interface
 
@@ -109,12 +224,25 @@ class VSS():
                         creating the singleton ScrumbanBoard instance and
                         starting the event loop for the user interface
         """
-        # intial_boot: A bool to determine if the system has been ran before
-        initial_boot = self.history.check_history()
+        # Show that this copy won't save the board
+        if self.read_only:
+            self.interface.title("Scrumban Board (Read Only)")
+
+        # intial_boot: A bool to determine if the system has been ran before,
+        # a read only copy only checks and doesn't create the files
+        initial_boot = self.history.check_history(not self.read_only)
+        # journaled_boot: True if the board is rebuilt from the journal
+        journaled_boot = False
 
         # if the program is being booted for the first time
         if not initial_boot:
             print("INITIAL")
+
+            # Only the writer can set up a new project
+            if self.read_only:
+                self.interface.set_message_box("Read Only", "The project hasn't been set up yet. "
+                                                            "Start the system without --read-only to set it up.")
+                sys.exit()
             # valid_project_backlog: bool value to loop over tell the user gives a valid file path
             valid_project_backlog = False
 
@@ -222,43 +350,114 @@ class VSS():
             # Populate the board with the data collected from the user
             self.board = Board(self.history.get_project_backlog(), self.history.get_todo_backlog(),
                                self.history.get_member_list(), self.history.get_completed_tasks(),
-                               self.history.get_agenda(), self.member_task_limit, self.todo_limit)
+                               self.history.get_agenda(), self.member_task_limit, self.todo_limit,
+                               self.history.get_queued_days())
+
+        # if the board was journaled, rebuild it from the snapshot and journal tail
+        # instead of reading every file
+        elif self.journal is not None and self.journal.has_snapshot():
+            print("SUBSEQUENT (JOURNAL)")
+            journaled_boot = True
+
+            # Read the saved system data so the file paths are known for reports
+            with self.lock.shared():
+                self.history.read_system_data()
+            # Only the writer upgrades the files
+            if not self.read_only:
+                with self.lock.exclusive():
+                    self._upgrade_files()
+
+            # Populate the board from the latest snapshot and the changes after it
+            with self.lock.shared():
+                self.board = self.journal.load()
+            # Start the new meeting as the other modes do: no notes or questions and
+            # concerns, and the todo backlog topped up
+            self.board.start_meeting()
 
         # if the program is not being booted for the first time
         else:
             print("SUBSEQUENT")
 
             # Read the saved system data
-            self.history.read_system_data()
-
-            # Try to load the saved data from the file system
-            # Except If the files don't exist
-            try:
-                self.history.load_scrumban()
-            except:
-                # Display a message to the user that the files no longer exist
-                file_not_found_message = "Files Were Moved! Please Move Files Back To Original Locations:"
-
-                # backlog_path: The invalid path of the project backlog
-                # mem_path: The invalid path of the members
-                backlog_path = f"Project Backlog: {self.history.get_project_backlog_path()}"
-                mem_path = f"Members File: {self.history.get_members_path()}"
-
-                # Display error to the user
-                self.interface.set_message_box("File Error", f"{file_not_found_message}\n\n\
-                                                {backlog_path}\n\n{mem_path}")
-                # exit the system
-                sys.exit()
-
-            # Populate the board with the data collected from the user
-            self.board = Board(self.history.get_project_backlog(), self.history.get_todo_backlog(),
-                            self.history.get_member_list(), self.history.get_completed_tasks(),
-                            self.history.get_agenda(), self.history.get_work_in_progress_limit(),
-                            self.history.get_todo_limit())
+            with self.lock.shared():
+                self.history.read_system_data()
+
+            # Only the writer changes the files before they are loaded
+            if not self.read_only:
+                with self.lock.exclusive():
+                    # Bring files saved in an older format up to date before any are loaded
+                    self._upgrade_files()
+
+                    # Move the old completed tasks into the archive before any of them are loaded
+                    if self.archive is not None:
+                        archived = self.history.archive_completed_tasks(self.archive, self.archive_days)
+                        if archived > 0:
+                            print(f"ARCHIVED {archived} COMPLETED TASKS")
+
+            # The files aren't saved by another copy while the board is read from them,
+            # including the rows the board streams from them as it is built
+            with self.lock.shared():
+                # Use the board kept from the last meeting if none of its files changed since
+                snapshot_board = self.boot_snapshot.load(self.history.get_data_files())
+
+                if snapshot_board is not None:
+                    print("SUBSEQUENT (SNAPSHOT)")
+                    self.board = snapshot_board
+                    self.board.set_agenda(self.history.get_agenda())
+
+                    # The database only compares against rows it has read, so the
+                    # first save after a snapshot writes the whole board
+                    if isinstance(self.history, ScrumbanDatabase):
+                        self.board.mark_unsaved()
+                    # Page the completed tasks from their file rather than keep them from the snapshot
+                    else:
+                        self.history.load_completed_tasks()
+                        self.board.page_completed(self.history.get_completed_tasks())
+                else:
+                    # Try to load the saved data from the file system
+                    # Except If the files don't exist
+                    try:
+                        self.history.load_scrumban()
+                    except:
+                        # Display a message to the user that the files no longer exist
+                        file_not_found_message = "Files Were Moved! Please Move Files Back To Original Locations:"
+
+                        # backlog_path: The invalid path of the project backlog
+                        # mem_path: The invalid path of the members
+                        backlog_path = f"Project Backlog: {self.history.get_project_backlog_path()}"
+                        mem_path = f"Members File: {self.history.get_members_path()}"
+
+                        # Display error to the user
+                        self.interface.set_message_box("File Error", f"{file_not_found_message}\n\n\
+                                                    {backlog_path}\n\n{mem_path}")
+                        # exit the system
+                        sys.exit()
+
+                    # Populate the board with the data collected from the user
+                    self.board = Board(self.history.get_project_backlog(), self.history.get_todo_backlog(),
+                                    self.history.get_member_list(), self.history.get_completed_tasks(),
+                                    self.history.get_agenda(), self.history.get_work_in_progress_limit(),
+                                    self.history.get_todo_limit(), self.history.get_queued_days())
+
+        # Age the project backlog for the time its tasks have waited
+        self.board.set_aging_policy(self.aging_policy)
+
+        # Start journaling the changes made to the board
+        if self.journal is not None and not self.read_only:
+            # a board from the journal started its meeting outside it, snapshot it as it is now
+            self.journal.attach(self.board, journaled_boot)
 
         # Setsup the interface based on the data in the ScrumbanBoard class
         self.interface.set_board_data(self.board)
 
+        # Save the board in the background as it changes
+        if self.autosave is not None:
+            self.autosave.start(self.interface)
+
+        # Pick up the edits made to the project backlog file from now on
+        if self.watcher is not None and self.history.get_project_backlog_path() != "":
+            self.watcher.start(self.interface)
+
         # Start the user interface eventloop
         self.interface.mainloop()
 
@@ -286,41 +485,51 @@ class VSS():
 
         Called By:      _send_reports_button_clicked - ScrumbanInterface.py
 
-        Calls:          set_project_backlog(), set_todo_backlog(), set_members()
-                        set_completed_tasks(), set_general_notes(), save_system_data(),
-                        save_scrumban(), send_emails() - ScrumbanHistory.py
+        Calls:          set_members(), set_general_notes(), set_at_risk_tasks(),
+                        set_completed_counts(), save_system_data(), send_emails() - ScrumbanHistory.py
+
+                        get_string_at_risk(), get_string_completed_counts() - ScrumbanBoard.py
+
+                        _set_changed_parts(), _save_changed_parts() - VSS.py
 
                         set_message_box() - ScrumbanInterface.py
 
+                        flush() - ScrumbanAutosave.py
+
         Modifies:       self.history
 
         Return:         None
 
         Description:    Sends the members emails with a summary of the meeting data
         """
-        # call all of the setters for history
+        # A read only copy doesn't save the board the reports are made from
+        if self.read_only:
+            self.interface.set_message_box("Read Only", "Reports can only be sent by the copy saving the project.")
+            return
 
-        # Set the data for the project backlog from the ScrumbanBoard instance
-        self.history.set_project_backlog(self.board.get_string_project_backlog())
+        # Let a background save finish before history is used here
+        if self.autosave is not None:
+            self.autosave.flush()
 
-        # Set the data for the todo backlog from the ScrumbanBoard instance
-        self.history.set_todo_backlog(self.board.get_string_todo())
+        # Set the data of the changed parts of the board in history
+        changed = self._set_changed_parts()
 
-        # Set the data for the members from the ScrumbanBoard instance
+        # The emails include every member and the notes even if they haven't changed
         self.history.set_members(self.board.get_string_members())
+        self.history.set_general_notes(self.board.get_notes())
 
-        # Set the data for the completed backlog from ScrumbanBoard instance
-        self.history.set_completed_tasks(self.board.get_string_completed())
+        # Set the overdue and soon due tasks for the reports from ScrumbanBoard instance
+        self.history.set_at_risk_tasks(self.board.get_string_at_risk(at_risk_days))
 
-        # Set the data for the genral notes from ScrumbanBoard instance
-        self.history.set_general_notes(self.board.get_notes())
+        # Set the completed tasks per day and per priority for the reports from ScrumbanBoard instance
+        self.history.set_completed_counts(self.board.get_string_completed_counts())
 
         # Save the data that the user can't see, ie system information
         self.history.save_system_data(self.board.get_task_member_limit(),
                                       self.board.get_max_todo_size())
 
         # Save the data from the above setters for the next time the system is ran
-        self.history.save_scrumban()
+        self._save_changed_parts(changed)
 
         # Try: Attempt to send the emails to each member and create a popup message that
         # informs the user of successfuly sending the emails
@@ -331,48 +540,253 @@ class VSS():
         except:
             self.interface.set_message_box("Error", "Error Sending Reports!")
 
-    def shutdown(self) -> None:
+    def _set_changed_parts(self) -> set:
         """
         Parameter:      None
 
-        Called By:      __main__ - VSS.py
+        Called By:      send_reports(), shutdown() - VSS.py
+                        _save() - ScrumbanAutosave.py
 
         Calls:          set_project_backlog(), set_todo_backlog(), set_members()
-                        set_completed_tasks(), set_general_notes(), save_system_data(),
-                        save_scrumban() - ScrumbanHistory.py
+                        set_completed_tasks(), set_queued_days(), set_general_notes() - ScrumbanHistory.py
+
+                        get_unsaved_parts() - ScrumbanBoard.py
 
         Modifies:       self.history
 
+        Return:         set[str]
+
+        Description:    Set the data of each part of the board that changed since it was
+                        last saved, the other parts aren't converted to strings. Returns
+                        the changed parts.
+        """
+        # changed: the parts of the board whose files are out of date
+        changed = self.board.get_unsaved_parts()
+
+        if PROJECT in changed:
+            # Set the data for the project backlog from the ScrumbanBoard instance,
+            # a copy that is sorted and formatted when history writes it
+            self.history.set_project_backlog(self.board.get_string_project_backlog())
+            # Set the day each project backlog task was queued from ScrumbanBoard instance
+            self.history.set_queued_days(self.board.get_queued_days())
+
+        if TODO in changed:
+            # Set the data for the todo backlog from the ScrumbanBoard instance
+            self.history.set_todo_backlog(self.board.get_string_todo())
+
+        if MEMBER in changed:
+            # Set the data for the members from the ScrumbanBoard instance
+            self.history.set_members(self.board.get_string_members())
+
+        if COMPLETED in changed:
+            # Set the data for the completed backlog from ScrumbanBoard instance
+            self.history.set_completed_tasks(self.board.get_string_completed())
+
+        if NOTES in changed:
+            # Set the data for the genral notes from ScrumbanBoard instance
+            self.history.set_general_notes(self.board.get_notes())
+
+        return changed
+
+    def _save_changed_parts(self, changed: set) -> None:
+        """
+        Parameter:      changed: The parts of the board returned by _set_changed_parts
+
+        Called By:      send_reports(), shutdown() - VSS.py
+
+        Calls:          save_scrumban() - ScrumbanHistory.py
+
+                        mark_saved() - ScrumbanBoard.py
+
+        Modifies:       self.board
+
         Return:         None
 
-        Description:    Shutsdown the system. Saves the state of the data in board
+        Description:    Save the changed parts of the board, mark them as saved and report
+                        the files that were skipped
+        """
+        # skipped: the files that already held their part of the board
+        skipped = self.history.save_scrumban(changed)
+        self.board.mark_saved(changed)
+
+        if skipped:
+            print(f"UNCHANGED, NOT SAVED: {', '.join(skipped)}")
+
+    def _upgrade_files(self) -> None:
         """
+        Parameter:      None
 
-        # call all of the setters for history
-        # Set the data for the project backlog from the ScrumbanBoard instance
-        self.history.set_project_backlog(self.board.get_string_project_backlog())
+        Called By:      startup() - VSS.py
 
-        # Set the data for the todo backlog from the ScrumbanBoard instance
-        self.history.set_todo_backlog(self.board.get_string_todo())
+        Calls:          upgrade_files() - ScrumbanHistory.py
 
-        # Set the data for the members from the ScrumbanBoard instance
-        self.history.set_members(self.board.get_string_members())
+                        set_message_box() - ScrumbanInterface.py
 
-        # Set the data for the completed backlog from ScrumbanBoard instance
-        self.history.set_completed_tasks(self.board.get_string_completed())
+        Modifies:       the saved files
 
-        # Set the data for the genral notes from ScrumbanBoard instance
-        self.history.set_general_notes(self.board.get_notes())
+        Return:         None
 
-        # Save the data that the user can't see, ie system information
-        self.history.save_system_data(self.board.get_task_member_limit(),
-                                      self.board.get_max_todo_size())
-        # Save the data from the above setters for the next time the system is ran
-        self.history.save_scrumban()
+        Description:    Upgrade the saved files written in an older format and report them. A
+                        file written by a newer version of the system can't be read, the user
+                        is told which and the system exits without touching it.
+        """
+        try:
+            upgraded = self.history.upgrade_files()
+        except ValueError as error:
+            self.interface.set_message_box("File Error", f"Saved File Can't Be Read: {error}")
+            sys.exit()
+
+        if upgraded:
+            print(f"UPGRADED: {', '.join(upgraded)}")
+
+    def shutdown(self) -> None:
+        """
+        Parameter:      None
+
+        Called By:      __main__ - VSS.py
+
+        Calls:          save_system_data() - ScrumbanHistory.py
+
+                        _set_changed_parts(), _save_changed_parts() - VSS.py
+
+                        close() - ScrumbanJournal.py
+
+                        close() - ScrumbanDatabase.py
+
+                        save() - ScrumbanSnapshot.py
+
+                        stop() - ScrumbanAutosave.py
+
+                        collect_garbage() - ScrumbanMeetings.py
+
+                        exclusive(), release_writer() - ScrumbanLock.py
+
+        Modifies:       self.history
+
+        Return:         None
+
+        Description:    Shutsdown the system. Saves the parts of the board that changed. In the
+                        event sourced mode the journal already holds every change, so only the
+                        system data is saved and the journal is flushed to disk. A read only copy
+                        saves nothing. The writer saves every file under the exclusive lock and
+                        then lets another copy become the writer.
+        """
+        # Finish the background save, the changes after it are saved below
+        if self.autosave is not None:
+            self.autosave.stop()
+
+        # A read only copy leaves the files as the writer saved them
+        if self.read_only:
+            # Close the database if one is used
+            if isinstance(self.history, ScrumbanDatabase):
+                self.history.close()
+            return
+
+        if self.journal is not None:
+            # Save the data that the user can't see, ie system information
+            self.history.save_system_data(self.board.get_task_member_limit(),
+                                          self.board.get_max_todo_size())
+            # Make sure every journaled change is on disk
+            self.journal.close()
+            # Close the database if one is used
+            if isinstance(self.history, ScrumbanDatabase):
+                self.history.close()
+            # Let the next copy to start save the project
+            self.lock.release_writer()
+            return
+
+
+        # Every file is saved before another copy reads any of them
+        with self.lock.exclusive():
+            # Set the data of the changed parts of the board in history
+            changed = self._set_changed_parts()
+
+            # Save the data that the user can't see, ie system information
+            self.history.save_system_data(self.board.get_task_member_limit(),
+                                          self.board.get_max_todo_size())
+            # Save the data from the above setters for the next time the system is ran
+            self._save_changed_parts(changed)
+
+            # Remove the chunks only the earlier saves of this meeting used
+            if self.meetings is not None:
+                self.meetings.collect_garbage()
+
+            # Close the database if one is used
+            if isinstance(self.history, ScrumbanDatabase):
+                self.history.close()
+
+            # Keep the built board for a fast start next time, keyed by the files just saved
+            self.boot_snapshot.save(self.board, self.history.get_data_files())
+
+        # Let the next copy to start save the project
+        self.lock.release_writer()
+
+
+def non_negative_int(text: str) -> int:
+    """
+    Parameter:      text: The value given for a command line option
+
+    Called By:      __main__ - VSS.py (through argparse)
+
+    Calls:          None
+
+    Modifies:       None
+
+    Return:         int
+
+    Description:    Return the value as an int, raising ArgumentTypeError so argparse reports
+                    the option if it isn't a whole number of 0 or more
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise ArgumentTypeError(f"'{text}' is not a whole number")
+    if value < 0:
+        raise ArgumentTypeError(f"{value} is negative, use 0 to turn it off")
+    return value
 
 
 if __name__ == "__main__":
+    # parser: Reads the command line options
+    parser = ArgumentParser(description="Virtual Scrumban System")
+    parser.add_argument("--journal", action="store_true",
+                        help="journal every board change and boot from the latest snapshot")
+    parser.add_argument("--aging-days", type=non_negative_int, default=0, metavar="DAYS",
+                        help="raise a waiting project backlog task one priority level every DAYS days, off by default")
+    parser.add_argument("--storage", choices=["text", "sqlite"], default="text",
+                        help="keep the board in the text files or in .sys_data/scrumban.db")
+    parser.add_argument("--load-threads", type=int, default=1, metavar="N",
+                        help="read up to N of the saved files at the same time when starting")
+    parser.add_argument("--archive-days", type=int, default=0, metavar="DAYS",
+                        help="move completed tasks older than DAYS days into completed_archive at boot, 0 to turn off")
+    parser.add_argument("--autosave-seconds", type=float, default=0, metavar="SECONDS",
+                        help="save the board in the background SECONDS after the last change, off by default")
+    parser.add_argument("--backlog-reload", action="store_true",
+                        help="pick up edits to the project backlog file while the board is open")
+    parser.add_argument("--meeting-history", action="store_true",
+                        help="record the saved files of each meeting in .sys_data/meetings")
+    parser.add_argument("--read-only", action="store_true",
+                        help="show the board without saving it, while another copy in the same directory saves it")
+    parser.add_argument("--list-meetings", action="store_true",
+                        help="list the recorded meetings and exit")
+    parser.add_argument("--restore-meeting", nargs=2, metavar=("MEETING", "DIR"),
+                        help="write the files of a recorded meeting into DIR and exit")
+    args = parser.parse_args()
+
+    # Look back at past meetings without starting the board
+    if args.list_meetings:
+        for meeting in MeetingStore().get_meetings():
+            print(meeting)
+        sys.exit()
+    if args.restore_meeting:
+        for restored in MeetingStore().restore(*args.restore_meeting):
+            print(f"RESTORED: {restored}")
+        sys.exit()
+
     # system: Instance of VSS
-    system = VSS()
+    system = VSS(journal=args.journal, aging_days=args.aging_days, storage=args.storage,
+                 load_threads=args.load_threads, archive_days=args.archive_days,
+                 autosave_seconds=args.autosave_seconds, reload_backlog=args.backlog_reload,
+                 meeting_history=args.meeting_history, read_only=args.read_only)
     system.startup()
     system.shutdown()
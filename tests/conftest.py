@@ -0,0 +1,14 @@
+"""
+File: conftest.py
+
+Description: Shared setup for the tests of the Virtual Scrumban System. The
+             modules live in .src and import each other by name, so that
+             directory is put on the import path.
+
+Date Created: 10/17/2026
+"""
+
+import sys
+from os import path
+
+sys.path.insert(0, path.join(path.dirname(path.dirname(path.abspath(__file__))), ".src"))
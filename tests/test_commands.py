@@ -0,0 +1,81 @@
+"""
+File: test_commands.py
+
+Description: Tests that the moves made on a Board are undone and redone
+             exactly, and that the undo history stays bounded.
+
+Date Created: 10/17/2026
+"""
+
+from ScrumbanBoard import Board
+from ScrumbanCommands import CommandLog
+
+
+def make_board(todo_limit=2):
+    project = [["task a", "2", "12/01/2026"], ["task b", "1", "12/02/2026"],
+               ["task c", "3", "12/03/2026"], ["task d", "1", "12/04/2026"]]
+    members = [["Ann", "ann@example.com", "", ""], ["Bob", "bob@example.com", "", ""]]
+    return Board(project, [], members, [], [], 4, todo_limit)
+
+
+def view(board):
+    # everything the user can see of the board, in display order
+    return (list(board.get_string_project_backlog()), board.get_string_todo(),
+            board.get_string_members(), list(board.get_string_completed()))
+
+
+def test_undo_and_redo_round_trip_each_move():
+    board = make_board()
+    views = [view(board)]
+
+    # each move, then the board as it was after it
+    assert board.assign_task(0, 0) == 0
+    views.append(view(board))
+    board.backlog_to_todo()
+    views.append(view(board))
+    assert board.move_member_to_member(0, 1, 0) == 0
+    views.append(view(board))
+    board.complete_task(1, 0)
+    views.append(view(board))
+    assert board.assign_task(0, 0) == 0
+    views.append(view(board))
+    assert board.completed_to_todo(0) == 0
+    views.append(view(board))
+
+    # undo walks back through every state, redo walks forward again
+    for expected in reversed(views[:-1]):
+        assert board.undo() == 0
+        assert view(board) == expected
+    assert board.undo() == 1
+
+    for expected in views[1:]:
+        assert board.redo() == 0
+        assert view(board) == expected
+    assert board.redo() == 1
+
+
+def test_a_new_move_drops_the_undone_moves():
+    board = make_board()
+    board.assign_task(0, 0)
+    board.undo()
+
+    board.assign_task(1, 0)
+    assert board.redo() == 1
+    assert board.undo() == 0
+    assert board.undo() == 1
+
+
+def test_the_oldest_moves_fall_out_of_the_history():
+    board = make_board(todo_limit=4)
+    board.command_log = CommandLog(limit=2)
+    start = view(board)
+
+    board.assign_task(0, 0)
+    board.assign_task(0, 0)
+    board.assign_task(1, 0)
+
+    assert board.undo() == 0
+    assert board.undo() == 0
+    # the first assignment can't be undone, the board isn't back where it started
+    assert board.undo() == 1
+    assert view(board) != start
@@ -0,0 +1,71 @@
+"""
+File: test_queue.py
+
+Description: Tests that the TaskQueue holding the project backlog hands out
+             tasks by priority and keeps equal priorities in the order they
+             were queued.
+
+Date Created: 10/17/2026
+"""
+
+from ScrumbanMember import Task
+from ScrumbanQueue import TaskQueue
+
+
+def make_tasks(*priorities):
+    # each task is named after its place in the arguments so the order can be checked
+    return [Task(f"task {uid}", str(priority), "12/01/2026", "", uid) for uid, priority in enumerate(priorities)]
+
+
+def names(tasks):
+    return [task.get_name() for task in tasks]
+
+
+def test_pop_takes_the_highest_priority_first():
+    queue = TaskQueue()
+    for task in make_tasks(3, 1, 2):
+        queue.push(task)
+
+    assert names([queue.pop(), queue.pop(), queue.pop()]) == ["task 1", "task 2", "task 0"]
+    assert not queue
+
+
+def test_equal_priorities_keep_their_queued_order():
+    queue = TaskQueue()
+    for task in make_tasks(2, 1, 2, 1, 2):
+        queue.push(task)
+
+    assert names(queue.pop() for _ in range(5)) == ["task 1", "task 3", "task 0", "task 2", "task 4"]
+
+
+def test_heapify_orders_like_pushing_one_at_a_time():
+    tasks = make_tasks(4, 2, 2, 9, 1, 2)
+    pushed = TaskQueue()
+    for task in tasks:
+        pushed.push(task)
+
+    assert names(TaskQueue(tasks)) == names(pushed)
+    assert names(TaskQueue(tasks)) == ["task 4", "task 1", "task 2", "task 5", "task 0", "task 3"]
+
+
+def test_iterating_and_peeking_leave_the_queue_unchanged():
+    queue = TaskQueue(make_tasks(2, 1, 1))
+
+    assert names(queue) == ["task 1", "task 2", "task 0"]
+    assert queue.peek().get_name() == "task 1"
+    assert len(queue) == 3
+    assert names(queue.pop() for _ in range(3)) == ["task 1", "task 2", "task 0"]
+
+
+def test_a_removed_task_returns_to_its_place_and_age():
+    queue = TaskQueue(make_tasks(1, 1, 1))
+    queue.set_queued_days({1: 700000})
+
+    place, task = queue.remove(1)
+    assert names(queue) == ["task 0", "task 2"]
+    # the queue keeps nothing of a task that left it
+    assert 1 not in queue
+
+    queue.push(task, place)
+    assert names(queue) == ["task 0", "task 1", "task 2"]
+    assert queue.get_queued_day(1) == 700000
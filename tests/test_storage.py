@@ -0,0 +1,118 @@
+"""
+File: test_storage.py
+
+Description: Tests that a board reloaded from the journal or from the SQLite
+             database is the same board the text files reload.
+
+Date Created: 10/17/2026
+"""
+
+import pytest
+
+from ScrumbanBoard import Board
+from ScrumbanDatabase import ScrumbanDatabase
+from ScrumbanHistory import ScrumbanHistory
+from ScrumbanJournal import BoardJournal
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    # each storage saves into its own copy of the user's files, and the saved
+    # files are kept relative to the working directory
+    def setup(name):
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "project.txt").write_text("task a, 2, 12/01/2026\ntask b, 1, 12/02/2026\n"
+                                               "task c, 3, 12/03/2026\ntask d, 1, 12/04/2026\n"
+                                               "task e, 2, 12/05/2026\n")
+        (directory / "members.txt").write_text("Ann, ann@example.com\nBob, bob@example.com\n")
+        monkeypatch.chdir(directory)
+        return directory
+    return setup
+
+
+def first_boot(history):
+    # read the user's files and build the board, as the first boot does
+    history.check_history()
+    assert history.check_valid_task_file("project.txt") == "VALID"
+    history.set_project_backlog_path("project.txt")
+    assert history.check_valid_member_file("members.txt") == "VALID"
+    history.set_members_path("members.txt")
+    history.load_scrumban()
+    return Board(history.get_project_backlog(), history.get_todo_backlog(), history.get_member_list(),
+                 history.get_completed_tasks(), history.get_agenda(), 4, 2, history.get_queued_days())
+
+
+def work(board):
+    # the moves of a meeting, one of them undone
+    board.assign_task(0, 0)
+    board.backlog_to_todo()
+    board.assign_task(1, 1)
+    board.complete_task(0, 0)
+    board.move_member_to_member(1, 0, 0)
+    board.undo()
+    board.set_notes("notes")
+    # the todo backlog is left full, so a reload has nothing to top up
+    board.backlog_to_todo()
+
+
+def save(board, history):
+    # save every part of the board, as shutdown does
+    history.set_project_backlog(board.get_string_project_backlog())
+    history.set_queued_days(board.get_queued_days())
+    history.set_todo_backlog(board.get_string_todo())
+    history.set_members(board.get_string_members())
+    history.set_completed_tasks(board.get_string_completed())
+    history.set_general_notes(board.get_notes())
+    history.save_system_data(board.get_task_member_limit(), board.get_max_todo_size())
+    history.save_scrumban()
+
+
+def reload(history):
+    # read the saved files back into a new board, as a later boot does
+    assert history.check_history()
+    history.read_system_data()
+    history.load_scrumban()
+    return Board(history.get_project_backlog(), history.get_todo_backlog(), history.get_member_list(),
+                 history.get_completed_tasks(), history.get_agenda(), history.get_work_in_progress_limit(),
+                 history.get_todo_limit(), history.get_queued_days())
+
+
+def view(board):
+    # everything the user can see of the board, in display order
+    return (list(board.get_string_project_backlog()), board.get_string_todo(), board.get_string_members(),
+            list(board.get_string_completed()), board.get_queued_days())
+
+
+def text_reload(project):
+    project("text")
+    board = first_boot(ScrumbanHistory())
+    work(board)
+    save(board, ScrumbanHistory("project.txt", "members.txt"))
+    return view(reload(ScrumbanHistory()))
+
+
+def test_the_journal_reloads_the_board_the_text_files_do(project):
+    expected = text_reload(project)
+
+    directory = project("journal")
+    board = first_boot(ScrumbanHistory())
+    journal = BoardJournal(str(directory / "journal.jsonl"), str(directory / "snapshot.json"))
+    journal.attach(board)
+    work(board)
+    journal.close()
+
+    assert view(BoardJournal(str(directory / "journal.jsonl"), str(directory / "snapshot.json")).load()) == expected
+
+
+def test_the_database_reloads_the_board_the_text_files_do(project):
+    expected = text_reload(project)
+
+    directory = project("sqlite")
+    history = ScrumbanDatabase(str(directory / "scrumban.db"))
+    board = first_boot(history)
+    work(board)
+    save(board, history)
+    history.close()
+
+    assert view(reload(ScrumbanDatabase(str(directory / "scrumban.db")))) == expected